@@ -20,6 +20,9 @@ class ScriptResult:
     output: str = ""
     error: str = ""
     exit_code: Optional[int] = None
+    peak_rss: Optional[int] = None
+    bytes_written: Optional[int] = None
+    profile: Optional[str] = None
 
 
 @dataclass
@@ -56,6 +59,9 @@ class ExecutionLogger:
         output: str = "",
         error: str = "",
         exit_code: Optional[int] = None,
+        peak_rss: Optional[int] = None,
+        bytes_written: Optional[int] = None,
+        profile: Optional[str] = None,
     ) -> ScriptResult:
         """Create a script result object."""
         duration = (end_time - start_time).total_seconds()
@@ -69,6 +75,30 @@ class ExecutionLogger:
             output=output,
             error=error,
             exit_code=exit_code,
+            peak_rss=peak_rss,
+            bytes_written=bytes_written,
+            profile=profile,
+        )
+
+    def record_run(self, result: ScriptResult, source: str = "org") -> Optional[int]:
+        """Add a script result to the shared run history (_scripts/run_history.py).
+
+        Returns the run id, or None if the run history is unavailable.
+        """
+        try:
+            from run_history import record_run
+        except ImportError:
+            return None
+        return record_run(
+            skill=result.script_name,
+            source=source,
+            started=datetime.strptime(result.start_time, "%Y-%m-%d %H:%M:%S"),
+            duration=result.duration,
+            exit_code=result.exit_code,
+            peak_rss=result.peak_rss,
+            bytes_written=result.bytes_written,
+            script=result.script_name,
+            profile=result.profile,
         )
 
     def save_session_log(
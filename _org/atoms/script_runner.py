@@ -4,7 +4,15 @@ import subprocess
 import sys
 from pathlib import Path
 from datetime import datetime
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
+
+# Resource measurement is shared with the vault scripts (_scripts/run_history.py)
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent / "_scripts"))
+try:
+    from run_history import run_measured
+    from run_profiler import profile_stem, profiling_enabled, stored_path, wrap_command
+except ImportError:
+    run_measured = None
 
 
 class ScriptRunner:
@@ -12,16 +20,24 @@ class ScriptRunner:
 
     def __init__(self, vault_root: Path):
         self.vault_root = vault_root
+        # Peak RSS / bytes written of the most recent run (None if unmeasured)
+        self.last_usage: Dict[str, Optional[int]] = {}
+        # Vault-relative profile path of the most recent run, if profiled
+        self.last_profile: Optional[str] = None
 
     def run(
         self,
         script_path: Path,
         description: str = "",
         args: Optional[list] = None,
+        profile: Optional[bool] = None,
     ) -> Tuple[bool, str, str, int, float]:
         """
         Run a script and return results.
 
+        With profile=True (default: the VAULT_PROFILE environment variable)
+        the script runs under cProfile and tracemalloc; see last_profile.
+
         Returns: (success, stdout, stderr, exit_code, duration_seconds)
         """
         start_time = datetime.now()
@@ -29,15 +45,22 @@ class ScriptRunner:
         cmd = [sys.executable, str(script_path)]
         if args:
             cmd.extend(args)
+        self.last_usage = {"peak_rss": None, "bytes_written": None}
+        self.last_profile = None
+        if run_measured and (profile if profile is not None else profiling_enabled()):
+            stem = profile_stem(script_path.name)
+            wrapped = wrap_command(cmd, stem)
+            # Non-Python targets run unprofiled, as in run_history.run_recorded
+            if wrapped is not None:
+                cmd = wrapped
+                self.last_profile = stored_path(stem)
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=str(self.vault_root),
-                timeout=300,
-            )
+            options = dict(capture_output=True, text=True, cwd=str(self.vault_root), timeout=300)
+            if run_measured:
+                result, self.last_usage = run_measured(cmd, **options)
+            else:
+                result = subprocess.run(cmd, **options)
 
             duration = (datetime.now() - start_time).total_seconds()
 
@@ -99,7 +99,11 @@ class ExecutionEngine:
             output=stdout,
             error=stderr,
             exit_code=exit_code,
+            peak_rss=self.runner.last_usage.get("peak_rss"),
+            bytes_written=self.runner.last_usage.get("bytes_written"),
+            profile=self.runner.last_profile,
         )
+        self.logger.record_run(result)
 
         if success:
             print(f"\n✓ Success ({duration:.2f}s)")
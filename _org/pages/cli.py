@@ -1,6 +1,7 @@
 """CLI interface for the atomic design automation system."""
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
@@ -27,6 +28,7 @@ Workflows:
   daily-quick    - Run quick daily (only news digestion)
   weekly         - Run weekly workflow (full)
   weekly-synth   - Run weekly synthesis only
+  (add --profile to profile each script; see _scripts/run_profiler.py report)
 
 Skills (Legacy Wrappers):
   skill list     - List all available skill wrappers
@@ -150,6 +152,10 @@ def main():
             skip_str = args[i + 1]
             skip_list = [s.strip() for s in skip_str.split(",") if s.strip()]
             i += 2
+        elif args[i] == "--profile":
+            # Picked up by ScriptRunner.run for every script in the workflow
+            os.environ["VAULT_PROFILE"] = "1"
+            i += 1
         else:
             workflow_args.append(args[i])
             i += 1
@@ -5,7 +5,6 @@ brief. Designed for a quick morning scan.
 """
 
 import argparse
-import re
 import subprocess
 import sys
 from datetime import datetime
@@ -13,6 +12,8 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 from config import summarize, save_note, VAULT_PATH, TRACKER
+from note_manifest import notes_between, read_body
+from run_history import run_recorded
 
 # Scripts to run for AI-relevant content (in order)
 FETCH_SCRIPTS = [
@@ -62,8 +63,10 @@ Be ruthless: if a source has nothing AI-relevant today, omit it. Quality over qu
 def run_script(script_name: str, cwd: Path) -> bool:
     """Run a script and return success."""
     try:
-        proc = subprocess.run(
+        proc = run_recorded(
             ["python3", f"_scripts/{script_name}"],
+            skill=script_name,
+            source="ai_brief",
             cwd=str(cwd),
             capture_output=True,
             text=True,
@@ -83,14 +86,12 @@ def run_script(script_name: str, cwd: Path) -> bool:
 def collect_today_notes(sources_dir: Path, today_str: str) -> list:
     """Collect today's digest notes for AI Brief synthesis."""
     notes = []
-    for md_file in sorted(sources_dir.glob("*.md")):
-        if today_str not in md_file.name:
-            continue
-        content = md_file.read_text(encoding="utf-8")
+    folder = sources_dir.relative_to(VAULT_PATH).as_posix()
+    for rec in sorted(notes_between(today_str, folder=folder), key=lambda r: r["filename"]):
         # Match note type by filename
         note_type = "unknown"
         for pattern, ntype in NOTE_PATTERNS:
-            if pattern in md_file.name:
+            if pattern in rec["filename"]:
                 note_type = ntype
                 break
         # Skip synthesis/reflection to avoid loops
@@ -99,15 +100,10 @@ def collect_today_notes(sources_dir: Path, today_str: str) -> list:
         # Only include AI-relevant sources
         if note_type not in AI_BRIEF_SOURCE_TYPES:
             continue
-        # Extract body (skip frontmatter)
-        body = content
-        fm_match = re.match(r"^---\s*\n.*?\n---\s*\n", content, re.DOTALL)
-        if fm_match:
-            body = content[fm_match.end():]
         notes.append({
-            "filename": md_file.stem,
+            "filename": rec["filename"],
             "type": note_type,
-            "content": body[:3000],
+            "content": read_body(rec)[:3000],
         })
     return notes
 
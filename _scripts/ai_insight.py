@@ -14,9 +14,14 @@ from pathlib import Path
 from typing import List, Optional
 
 from config import summarize, save_note, VAULT_PATH, TRACKER
+from vault_walker import find_markdown_files
+from context_packer import pack
 
 PRIORITY_TYPES = {"weekly-synthesis", "daily-synthesis", "self-reflection", "self-evolution"}
 
+# Prompt budget for the collected notes, in estimated tokens
+CONTEXT_TOKENS = 36000
+
 
 def collect_notes(
     days: int = 90,
@@ -40,13 +45,12 @@ def collect_notes(
             if not any(kw.lower() in combined for kw in topic_keywords):
                 return
 
-        char_limit = 4000 if source == "Sources" else 3000
         notes.append({
             "filename": path.stem,
             "type": note_type,
             "source": source,
             "date": mtime.strftime("%Y-%m-%d") if mtime else "",
-            "content": body[:char_limit],
+            "content": body,
             "priority": 1 if note_type in PRIORITY_TYPES else 0,
         })
 
@@ -100,7 +104,7 @@ def collect_notes(
         for para_name in ["01 - Projects", "02 - Areas", "03 - Resources", "Projects", "Areas", "Resources"]:
             para_dir = VAULT_PATH / para_name
             if para_dir.exists():
-                for md_file in para_dir.rglob("*.md"):
+                for md_file in find_markdown_files(under=para_name):
                     mtime = datetime.fromtimestamp(md_file.stat().st_mtime)
                     if mtime < cutoff:
                         continue
@@ -298,14 +302,20 @@ Examples:
     for src, count in sorted(by_source.items()):
         print(f"  {src}: {count}")
 
-    notes_text = "\n\n---\n\n".join(
-        "SOURCE: [[{filename}]] ({source}, type: {type}, date: {date})\n\n{content}".format(**n)
-        for n in notes
+    # Priority notes (syntheses, reflections) and Sources get first claim on the budget
+    notes_text = pack(
+        [
+            {
+                "header": "SOURCE: [[{filename}]] ({source}, type: {type}, date: {date})".format(**n),
+                "text": n["content"],
+                "weight": (2.0 if n["priority"] else 1.0) * (1.2 if n["source"] == "Sources" else 1.0),
+            }
+            for n in notes
+        ],
+        CONTEXT_TOKENS,
+        per_note=4,
     )
 
-    if len(notes_text) > 120000:
-        notes_text = notes_text[:120000] + "\n\n[Additional notes truncated for length...]"
-
     prompt = build_insight_prompt(args.focus, notes_text)
     print("Generating AI Insight report...")
     report_body = summarize(notes_text, prompt)
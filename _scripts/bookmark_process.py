@@ -4,14 +4,14 @@ import argparse
 import re
 import sys
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 # Add parent directory to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from article_summary import fetch_html, extract_metadata, extract_text
 from bs4 import BeautifulSoup
-from config import summarize, save_note
+from config import summarize_long, summarize_many, save_note, LLM_CONCURRENCY
 
 SUMMARY_PROMPT = """You are a research assistant. Given a web article, create a comprehensive
 summary in markdown. Include:
@@ -43,8 +43,8 @@ def parse_url_file(path: Path) -> List[Tuple[str, Optional[str]]]:
     return items
 
 
-def process_url(url: str, title_override: Optional[str] = None) -> bool:
-    """Fetch, extract, summarize one URL and save as note. Returns True on success."""
+def fetch_article(url: str, title_override: Optional[str] = None) -> Optional[Dict]:
+    """Fetch and extract one URL. Returns {meta, text, context} or None on failure."""
     try:
         print(f"Fetching: {url}")
         html = fetch_html(url)
@@ -58,16 +58,21 @@ def process_url(url: str, title_override: Optional[str] = None) -> bool:
         text = extract_text(soup)
         if not text:
             print("  Error: Could not extract any text.")
-            return False
-
-        if len(text) > 60000:
-            text = text[:60000] + "\n\n[Content truncated...]"
+            return None
 
-        print("  Generating summary...")
         author_line = f" by {meta['author']}" if meta["author"] else ""
         context = f"Article: {meta['title']}{author_line} ({meta['site_name']})\n\nContent:\n{text}"
-        summary_body = summarize(context, SUMMARY_PROMPT)
+        return {"meta": meta, "text": text, "context": context}
 
+    except Exception as e:
+        print(f"  Error: {e}")
+        return None
+
+
+def save_bookmark(article: Dict, summary_body: str) -> bool:
+    """Write the bookmark note for a fetched article. Returns True on success."""
+    meta, text = article["meta"], article["text"]
+    try:
         safe_title = re.sub(r'[\\/*?:"<>|]', "", meta["title"])[:80].strip()
 
         text_lines = text.split("\n")
@@ -119,7 +124,6 @@ def process_url(url: str, title_override: Optional[str] = None) -> bool:
 """
 
         save_note(f"Sources/Bookmark - {safe_title}.md", note)
-        print("  Done!")
         return True
 
     except Exception as e:
@@ -127,6 +131,52 @@ def process_url(url: str, title_override: Optional[str] = None) -> bool:
         return False
 
 
+def process_url(url: str, title_override: Optional[str] = None) -> bool:
+    """Fetch, extract, summarize one URL and save as note. Returns True on success."""
+    article = fetch_article(url, title_override)
+    if article is None:
+        return False
+    try:
+        print("  Generating summary...")
+        summary_body = summarize_long(article["context"], SUMMARY_PROMPT)
+    except Exception as e:
+        print(f"  Error: {e}")
+        return False
+    if not save_bookmark(article, summary_body):
+        return False
+    print("  Done!")
+    return True
+
+
+def process_urls(items: List[Tuple[str, Optional[str]]], concurrency: int = LLM_CONCURRENCY) -> Tuple[int, int]:
+    """Fetch every URL, summarize them in parallel, save notes. Returns (succeeded, failed)."""
+    if len(items) == 1:
+        ok = process_url(*items[0])
+        return int(ok), int(not ok)
+
+    articles = [fetch_article(url, title) for url, title in items]
+    fetched = [a for a in articles if a is not None]
+    failed = len(articles) - len(fetched)
+
+    print(f"\nGenerating {len(fetched)} summaries ({concurrency} at a time)...")
+    summaries = summarize_many(
+        [(a["context"], SUMMARY_PROMPT) for a in fetched],
+        concurrency=concurrency,
+        map_reduce=True,
+    )
+
+    success = 0
+    for article, summary_body in zip(fetched, summaries):
+        if isinstance(summary_body, Exception):
+            print(f"  Error summarizing {article['meta']['url']}: {summary_body}")
+            failed += 1
+        elif save_bookmark(article, summary_body):
+            success += 1
+        else:
+            failed += 1
+    return success, failed
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Process saved URLs into structured Obsidian notes"
@@ -135,6 +185,8 @@ def main():
     parser.add_argument("--file", "-f", help="File with URLs (one per line)")
     parser.add_argument("--limit", "-n", type=int, help="Max URLs to process (file mode)")
     parser.add_argument("--title", "-t", help="Override title (single-URL mode only)")
+    parser.add_argument("--concurrency", "-j", type=int, default=LLM_CONCURRENCY,
+                        help=f"Summaries to generate in parallel (default: {LLM_CONCURRENCY})")
     args = parser.parse_args()
 
     items: List[Tuple[str, Optional[str]]] = []
@@ -160,13 +212,7 @@ def main():
         print("No URLs to process.")
         sys.exit(0)
 
-    success = 0
-    failed = 0
-    for url, title in items:
-        if process_url(url, title):
-            success += 1
-        else:
-            failed += 1
+    success, failed = process_urls(items, concurrency=args.concurrency)
 
     print(f"\nProcessed: {success} succeeded, {failed} failed")
 
@@ -10,6 +10,8 @@ Always asks for explicit permission before removing any file.
 
 import argparse
 import hashlib
+import json
+import os
 import sys
 from collections import defaultdict
 from pathlib import Path
@@ -17,7 +19,9 @@ from typing import Dict, List, Tuple, Optional
 
 # Add parent for config
 sys.path.insert(0, str(Path(__file__).parent))
-from config import VAULT_PATH, save_note
+from config import VAULT_PATH, CACHE_DIR, save_note
+from vault_walker import get_walker
+from minhash import SignatureCache, estimate_jaccard, lsh_candidates, signature
 
 
 # Directories to exclude from scanning (templates, config, etc.)
@@ -26,6 +30,15 @@ EXCLUDE_DIRS = {".obsidian", ".trash", "node_modules", ".git", "_scripts", ".cla
 # Minimum content length (chars) to consider a note non-stub
 STUB_THRESHOLD = 50
 
+# Cached per-file lengths and hashes (see ContentManifest)
+CONTENT_MANIFEST_PATH = CACHE_DIR / "content_manifest.json"
+CONTENT_MANIFEST_VERSION = 1
+
+# Near-duplicate scan: notes shorter than this are skipped, and LSH candidates
+# whose estimated shingle Jaccard falls below the floor are not verified
+NEAR_DUP_MIN_CHARS = 100
+NEAR_DUP_MIN_JACCARD = 0.3
+
 
 def _normalize_content(text: str) -> str:
     """Normalize content for comparison (strip whitespace, normalize newlines)."""
@@ -37,81 +50,191 @@ def _content_hash(text: str) -> str:
     return hashlib.sha256(_normalize_content(text).encode("utf-8")).hexdigest()
 
 
-def _is_excluded(rel_path: str) -> bool:
-    """Check if path is in an excluded directory."""
-    parts = Path(rel_path).parts
-    return any(part in EXCLUDE_DIRS for part in parts)
+def find_markdown_files(folder: Optional[str] = None) -> List[Path]:
+    """Find all markdown files in vault (or one folder), pruning excluded directories."""
+    return get_walker(EXCLUDE_DIRS, skip_hidden=False).files(under=folder)
+
+
+def _body_length(content: str) -> int:
+    """Length of normalized content with YAML frontmatter removed."""
+    text = content.strip()
+    if text.startswith("---"):
+        end = text.find("---", 3)
+        if end != -1:
+            text = text[end + 3:].strip()
+    return len(_normalize_content(text))
+
+
+class ContentManifest:
+    """Per-file normalized length, body length and (lazily) content hash.
+
+    Records are keyed by vault-relative path and reused while (mtime, size)
+    is unchanged. Hashes are only computed for files whose normalized length
+    collides with another file's, since only those can be exact duplicates.
+    """
+
+    def __init__(self, path: Path = CONTENT_MANIFEST_PATH):
+        self.path = path
+        self.records: Dict[str, Dict] = {}
+        self._dirty = False
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") == CONTENT_MANIFEST_VERSION:
+                self.records = data.get("files", {})
+        except (OSError, ValueError):
+            pass
+
+    def save(self):
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(
+                json.dumps({"version": CONTENT_MANIFEST_VERSION, "files": self.records}),
+                encoding="utf-8",
+            )
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except OSError as e:
+            print(f"Warning: failed to save content manifest: {e}")
 
+    def _read(self, f: Path) -> Optional[str]:
+        try:
+            return f.read_text(encoding="utf-8", errors="ignore")
+        except (OSError, UnicodeDecodeError):
+            return None
 
-def find_markdown_files(vault_path: Path) -> List[Path]:
-    """Find all markdown files in vault, excluding certain directories."""
-    files = []
-    for md in vault_path.rglob("*.md"):
+    def record(self, f: Path) -> Optional[Dict]:
+        """Up-to-date record for one file, reading it only if it changed."""
         try:
-            rel = md.relative_to(vault_path)
-            if not _is_excluded(str(rel)):
-                files.append(md)
-        except ValueError:
+            st = os.stat(f)
+        except OSError:
+            return None
+        rel = f.relative_to(VAULT_PATH).as_posix()
+        rec = self.records.get(rel)
+        if rec and rec["mtime_ns"] == st.st_mtime_ns and rec["size"] == st.st_size:
+            return rec
+        content = self._read(f)
+        if content is None:
+            return None
+        rec = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "length": len(_normalize_content(content)),
+            "body_length": _body_length(content),
+            "sha256": None,
+        }
+        self.records[rel] = rec
+        self._dirty = True
+        return rec
+
+    def content_hash(self, f: Path, rec: Dict) -> Optional[str]:
+        if rec["sha256"] is None:
+            content = self._read(f)
+            if content is None:
+                return None
+            rec["sha256"] = _content_hash(content)
+            self._dirty = True
+        return rec["sha256"]
+
+    def prune(self, keep: List[Path]):
+        """Forget files not in `keep` (use after a whole-vault scan)."""
+        keep_set = {f.relative_to(VAULT_PATH).as_posix() for f in keep}
+        for rel in [r for r in self.records if r not in keep_set]:
+            del self.records[rel]
+            self._dirty = True
+
+
+def scan_redundancy(
+    files: List[Path], prune: bool = False
+) -> Tuple[Dict[str, List[Path]], List[Tuple[Path, int]]]:
+    """Find exact duplicates and stub notes in one pass over the manifest."""
+    manifest = ContentManifest()
+    by_length: Dict[int, List[Tuple[Path, Dict]]] = defaultdict(list)
+    stubs = []
+    for f in files:
+        rec = manifest.record(f)
+        if rec is None:
             continue
-    return files
+        by_length[rec["length"]].append((f, rec))
+        if rec["body_length"] < STUB_THRESHOLD:
+            stubs.append((f, rec["body_length"]))
+
+    # Same-length groups are the only possible duplicates; hash just those
+    hash_to_files: Dict[str, List[Path]] = defaultdict(list)
+    for group in by_length.values():
+        if len(group) < 2:
+            continue
+        for f, rec in group:
+            h = manifest.content_hash(f, rec)
+            if h is not None:
+                hash_to_files[h].append(f)
+
+    if prune:
+        manifest.prune(files)
+    manifest.save()
+    duplicates = {h: paths for h, paths in hash_to_files.items() if len(paths) > 1}
+    return duplicates, stubs
 
 
 def find_exact_duplicates(files: List[Path]) -> Dict[str, List[Path]]:
     """Find files with identical content (content hash)."""
-    hash_to_files: Dict[str, List[Path]] = defaultdict(list)
-    for f in files:
-        try:
-            content = f.read_text(encoding="utf-8", errors="ignore")
-            h = _content_hash(content)
-            hash_to_files[h].append(f)
-        except (OSError, UnicodeDecodeError):
-            continue
-    return {h: paths for h, paths in hash_to_files.items() if len(paths) > 1}
+    return scan_redundancy(files)[0]
 
 
 def find_stub_notes(files: List[Path]) -> List[Tuple[Path, int]]:
     """Find empty or nearly empty notes."""
-    stubs = []
-    for f in files:
-        try:
-            content = f.read_text(encoding="utf-8", errors="ignore")
-            # Remove YAML frontmatter for length check
-            text = content.strip()
-            if text.startswith("---"):
-                end = text.find("---", 3)
-                if end != -1:
-                    text = text[end + 3:].strip()
-            body_len = len(_normalize_content(text))
-            if body_len < STUB_THRESHOLD:
-                stubs.append((f, body_len))
-        except (OSError, UnicodeDecodeError):
-            continue
-    return stubs
+    return scan_redundancy(files)[1]
 
 
 def find_near_duplicates(files: List[Path], similarity_threshold: float = 0.9) -> List[Tuple[Path, Path, float]]:
-    """Find pairs of notes with highly similar content (optional, slower)."""
+    """Find pairs of notes with highly similar content.
+
+    MinHash/LSH proposes candidate pairs; only those are compared with
+    SequenceMatcher. Signatures are cached per content hash, so repeat scans
+    only sign notes that changed.
+    """
     from difflib import SequenceMatcher
 
-    pairs = []
     contents: Dict[Path, str] = {}
+    hashes: Dict[Path, str] = {}
     for f in files:
         try:
-            contents[f] = _normalize_content(f.read_text(encoding="utf-8", errors="ignore"))
+            text = _normalize_content(f.read_text(encoding="utf-8", errors="ignore"))
         except (OSError, UnicodeDecodeError):
             continue
-
-    checked = set()
-    for p1, c1 in contents.items():
-        for p2, c2 in contents.items():
-            if p1 >= p2 or (p1, p2) in checked:
-                continue
-            checked.add((p1, p2))
-            if len(c1) < 100 or len(c2) < 100:
+        if len(text) < NEAR_DUP_MIN_CHARS:
+            continue
+        contents[f] = text
+        hashes[f] = hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    cache = SignatureCache()
+    known = cache.get_many(hashes.values())
+    fresh = {}
+    signatures = {}
+    for f, h in hashes.items():
+        sig = known.get(h) or fresh.get(h)
+        if sig is None:
+            sig = signature(contents[f])
+            if sig is None:
                 continue
-            ratio = SequenceMatcher(None, c1, c2).ratio()
-            if ratio >= similarity_threshold:
-                pairs.append((p1, p2, ratio))
+            fresh[h] = sig
+        signatures[f] = sig
+    cache.put_many(fresh)
+    cache.close()
+
+    pairs = []
+    for p1, p2 in lsh_candidates(signatures):
+        if estimate_jaccard(signatures[p1], signatures[p2]) < NEAR_DUP_MIN_JACCARD:
+            continue
+        matcher = SequenceMatcher(None, contents[p1], contents[p2])
+        if matcher.real_quick_ratio() < similarity_threshold or matcher.quick_ratio() < similarity_threshold:
+            continue
+        ratio = matcher.ratio()
+        if ratio >= similarity_threshold:
+            pairs.append((p1, p2, ratio))
+    pairs.sort(key=lambda x: (-x[2], str(x[0]), str(x[1])))
     return pairs
 
 
@@ -197,7 +320,7 @@ Examples:
     parser.add_argument(
         "--near-duplicates",
         action="store_true",
-        help="Include near-duplicates (≥90%% similar) - slower, requires manual review",
+        help="Include near-duplicates (≥90%% similar, MinHash/LSH) - requires manual review",
     )
     parser.add_argument(
         "--save",
@@ -229,18 +352,14 @@ Examples:
         sys.exit(1)
 
     # Collect files
-    all_files = find_markdown_files(vault)
-    if args.folder:
-        folder_path = vault / args.folder
-        all_files = [f for f in all_files if str(f).startswith(str(folder_path))]
+    all_files = find_markdown_files(args.folder)
     print(f"Scanning {len(all_files)} markdown files...")
 
     # Run detection
-    duplicates = find_exact_duplicates(all_files)
-    stubs = find_stub_notes(all_files)
+    duplicates, stubs = scan_redundancy(all_files, prune=args.folder is None)
     near_dups = None
     if args.near_duplicates:
-        print("Checking near-duplicates (this may take a moment)...")
+        print("Checking near-duplicates...")
         near_dups = find_near_duplicates(all_files)
 
     report = format_report(duplicates, stubs, near_dups)
@@ -1,9 +1,12 @@
 """Shared configuration for AI Vault automation scripts."""
 
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 from dotenv import load_dotenv
-from openai import OpenAI
 
 # Load .env from vault root
 VAULT_PATH = Path(__file__).resolve().parent.parent
@@ -24,33 +27,104 @@ GNEWS_API_KEY = os.getenv("GNEWS_API_KEY", "")  # From gnews.io
 # Default to DeepSeek for cost savings
 DEFAULT_MODEL = DEEPSEEK_MODEL
 
-# AI clients
-# DeepSeek client (default - cost effective)
-deepseek_ai = OpenAI(
-    api_key=DEEPSEEK_API_KEY,
-    base_url=DEEPSEEK_BASE_URL,
-)
+# AI clients are built on first use (get_ai_client, or config.ai /
+# deepseek_ai / ark_ai via __getattr__): importing openai alone takes most of
+# a second, and many scripts never call the API.
+_CLIENTS: Dict[str, "OpenAI"] = {}
+_CLIENTS_LOCK = threading.Lock()
+_CLIENT_ATTRS = {"deepseek_ai": "deepseek", "ark_ai": "ark", "ai": "deepseek"}
 
-# Ark client (optional - for legacy or specific use cases)
-ark_ai = OpenAI(
-    api_key=ARK_API_KEY,
-    base_url="https://ark.cn-beijing.volces.com/api/coding/v1",
-)
 
-# Backward compatibility: alias ai to deepseek_ai
-ai = deepseek_ai
+def _client(name: str) -> "OpenAI":
+    with _CLIENTS_LOCK:
+        if name not in _CLIENTS:
+            from openai import OpenAI
+
+            if name == "ark":
+                # Ark client (optional - for legacy or specific use cases)
+                _CLIENTS[name] = OpenAI(
+                    api_key=ARK_API_KEY,
+                    base_url="https://ark.cn-beijing.volces.com/api/coding/v1",
+                )
+            else:
+                # DeepSeek client (default - cost effective)
+                _CLIENTS[name] = OpenAI(
+                    api_key=DEEPSEEK_API_KEY,
+                    base_url=DEEPSEEK_BASE_URL,
+                )
+        return _CLIENTS[name]
+
+
+def __getattr__(name: str):
+    """Lazy module attributes (PEP 562): the AI clients."""
+    if name in _CLIENT_ATTRS:
+        return _client(_CLIENT_ATTRS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Parallel AI calls (summarize_many) and the request rate they share
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "4"))
+LLM_RATE_LIMIT = float(os.getenv("LLM_RATE_LIMIT", "5"))  # requests/second, 0 = unlimited
+
+
+class RateLimiter:
+    """Spaces request starts at least 1/rate seconds apart across threads."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+RATE_LIMITER = RateLimiter(LLM_RATE_LIMIT)
+
+# Long inputs (summarize_long): inputs above LONG_INPUT_TOKENS are condensed
+# in CHUNK_TOKENS sections first, at most MAX_REDUCE_ROUNDS times
+LONG_INPUT_TOKENS = 24000
+CHUNK_TOKENS = 6000
+MAX_REDUCE_ROUNDS = 4
+CHUNK_SUMMARY_PROMPT = """You are condensing one section of a longer document so it can be analyzed as a whole later.
+Rewrite the section as dense notes of at most a quarter of its length. Keep every key claim, argument,
+finding, definition, name, number, date, notable quote and [[wikilink]] / source title, in the original
+order. Do not add commentary, introductions or conclusions. Write in the section's own language."""
 
 
 def get_ai_client(model: str = DEFAULT_MODEL):
     """Get the appropriate AI client based on the model."""
     if model.startswith("ark-") or model == "ark-code-latest":
-        return ark_ai
-    return deepseek_ai
+        return _client("ark")
+    return _client("deepseek")
+
+
+def summarize(text: str, prompt: str, model: str = DEFAULT_MODEL, cache: bool = True) -> str:
+    """Send text to AI for summarization/processing.
+
+    Responses are cached on disk by (model, prompt, text); pass cache=False
+    or set LLM_CACHE=off to always call the API. Generators that should give
+    a fresh answer for the same input (jokes, quotes, brainstorming) pass
+    cache=False.
+    """
+    from llm_cache import cache_enabled, cache_key, get_response_cache
 
+    use_cache = cache and cache_enabled()
+    if use_cache:
+        key = cache_key(model, prompt, text)
+        cached = get_response_cache().get(key)
+        if cached is not None:
+            return cached
 
-def summarize(text: str, prompt: str, model: str = DEFAULT_MODEL) -> str:
-    """Send text to AI for summarization/processing."""
     client = get_ai_client(model)
+    RATE_LIMITER.wait()
     response = client.chat.completions.create(
         model=model,
         messages=[
@@ -58,7 +132,155 @@ def summarize(text: str, prompt: str, model: str = DEFAULT_MODEL) -> str:
             {"role": "user", "content": text},
         ],
     )
-    return response.choices[0].message.content.strip()
+    result = response.choices[0].message.content.strip()
+    if use_cache and result:
+        get_response_cache().put(key, model, result)
+    return result
+
+
+def summarize_stream(
+    text: str,
+    prompt: str,
+    model: str = DEFAULT_MODEL,
+    cache: bool = True,
+    echo: bool = True,
+    stats: Optional[Dict] = None,
+    **params,
+) -> Iterator[str]:
+    """Stream a summarize call, yielding text deltas as they arrive.
+
+    With echo=True each delta is also printed, so `"".join(summarize_stream(...))`
+    shows the answer live and returns the full text. Shares summarize's cache.
+    If `stats` is given it receives first_token_s, total_s and cached. Extra
+    keyword arguments (temperature, max_tokens) go to the API and the cache key.
+    """
+    from llm_cache import cache_enabled, cache_key, get_response_cache
+
+    start = time.perf_counter()
+    use_cache = cache and cache_enabled()
+    cached = None
+    if use_cache:
+        key = cache_key(model, prompt, text, **params)
+        cached = get_response_cache().get(key)
+
+    if cached is not None:
+        deltas = iter([cached])
+    else:
+        client = get_ai_client(model)
+        RATE_LIMITER.wait()
+        response = client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": prompt},
+                {"role": "user", "content": text},
+            ],
+            stream=True,
+            **params,
+        )
+        deltas = (
+            chunk.choices[0].delta.content
+            for chunk in response
+            if chunk.choices and chunk.choices[0].delta.content
+        )
+
+    parts: List[str] = []
+    for delta in deltas:
+        if not parts and stats is not None:
+            stats["first_token_s"] = round(time.perf_counter() - start, 3)
+        parts.append(delta)
+        if echo:
+            print(delta, end="", flush=True)
+        yield delta
+    if echo:
+        print()
+
+    if stats is not None:
+        stats["total_s"] = round(time.perf_counter() - start, 3)
+        stats["cached"] = cached is not None
+    result = "".join(parts).strip()
+    if use_cache and cached is None and result:
+        get_response_cache().put(key, model, result)
+
+
+def summarize_long(
+    text: str,
+    prompt: str,
+    model: str = DEFAULT_MODEL,
+    target_tokens: int = LONG_INPUT_TOKENS,
+    chunk_tokens: int = CHUNK_TOKENS,
+    concurrency: int = LLM_CONCURRENCY,
+    cache: bool = True,
+) -> str:
+    """Summarize text of any length with `prompt` via map-reduce.
+
+    Text that fits `target_tokens` goes straight to summarize. Longer text is
+    split on heading and paragraph boundaries into ~chunk_tokens pieces, the
+    pieces are condensed in parallel (each cached by its content), and the
+    condensed text is split and condensed again until it fits. The final
+    call applies `prompt` to the condensed document. `cache` applies to
+    every call, as in summarize.
+    """
+    from context_packer import estimate_tokens, split_chunks
+
+    rounds = 0
+    tokens = estimate_tokens(text)
+    while tokens > target_tokens and rounds < MAX_REDUCE_ROUNDS:
+        chunks = split_chunks(text, chunk_tokens)
+        print(f"  Condensing {len(chunks)} sections (~{tokens:,} tokens)...")
+        results = summarize_many(
+            [(chunk, CHUNK_SUMMARY_PROMPT) for chunk in chunks],
+            concurrency=concurrency,
+            model=model,
+            cache=cache,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        text = "\n\n".join(results)
+        rounds += 1
+        shrunk = estimate_tokens(text)
+        if shrunk >= tokens:
+            break
+        tokens = shrunk
+
+    if rounds:
+        text = f"(Condensed section by section from a longer document.)\n\n{text}"
+    return summarize(text, prompt, model=model, cache=cache)
+
+
+def summarize_many(
+    items: Sequence[Tuple[str, str]],
+    concurrency: int = LLM_CONCURRENCY,
+    model: str = DEFAULT_MODEL,
+    cache: bool = True,
+    map_reduce: bool = False,
+) -> List[Union[str, Exception]]:
+    """Run independent (text, prompt) summarize calls in parallel.
+
+    Results come back in input order. A failed item yields its exception
+    instead of a string, so one bad call doesn't sink the batch. Requests
+    still pass through the shared RATE_LIMITER. With map_reduce=True each
+    item goes through summarize_long, so long inputs are processed in full;
+    its sections are condensed serially when the items already run in
+    parallel, so the thread count stays at `concurrency`.
+    """
+    items = list(items)
+    parallel = concurrency > 1 and len(items) > 1
+    inner_concurrency = 1 if parallel else concurrency
+
+    def run(item: Tuple[str, str]) -> Union[str, Exception]:
+        text, prompt = item
+        try:
+            if map_reduce:
+                return summarize_long(text, prompt, model=model, concurrency=inner_concurrency, cache=cache)
+            return summarize(text, prompt, model=model, cache=cache)
+        except Exception as e:
+            return e
+
+    if not parallel:
+        return [run(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(items))) as pool:
+        return list(pool.map(run, items))
 
 
 def save_note(relative_path: str, content: str) -> Path:
@@ -71,13 +293,41 @@ def save_note(relative_path: str, content: str) -> Path:
 
 
 # Self-reflection and self-evolution tracking
-try:
-    from self_reflection import SystemBehaviorTracker
-    # Global tracker instance
-    TRACKER = SystemBehaviorTracker()
-except ImportError as e:
-    print(f"Warning: Self-reflection module not available: {e}")
-    TRACKER = None
+class _LazyTracker:
+    """Stands in for the global SystemBehaviorTracker until first use.
+
+    Scripts keep writing `if TRACKER: TRACKER.record_operation(...)`; the
+    tracker (and self_reflection with it) is only loaded when that runs.
+    """
+
+    def __init__(self):
+        self._tracker = None
+        self._unavailable = False
+        self._lock = threading.Lock()
+
+    def _get(self):
+        with self._lock:
+            if self._tracker is None and not self._unavailable:
+                try:
+                    from self_reflection import SystemBehaviorTracker
+                    self._tracker = SystemBehaviorTracker()
+                except ImportError as e:
+                    print(f"Warning: Self-reflection module not available: {e}")
+                    self._unavailable = True
+        return self._tracker
+
+    def __bool__(self) -> bool:
+        return self._get() is not None
+
+    def __getattr__(self, name: str):
+        tracker = self._get()
+        if tracker is None:
+            raise AttributeError(name)
+        return getattr(tracker, name)
+
+
+# Global tracker instance
+TRACKER = _LazyTracker()
 
 # Self-evolution configuration
 LEARNING_RATE = 0.1
@@ -86,6 +336,9 @@ MAX_EVOLUTION_ITERATIONS = 100
 EVOLUTION_LOG_PATH = VAULT_PATH / "_logs" / "evolution_log.json"
 LEARNING_LOG_PATH = VAULT_PATH / "_logs" / "learning_log.json"
 
+# Local caches (search index, manifests) - safe to delete, rebuilt on demand
+CACHE_DIR = VAULT_PATH / "_logs" / "cache"
+
 # Bilibili configuration
 BILIBILI_SESSDATA = os.getenv("BILIBILI_SESSDATA", "")
 BILIBILI_USER_AGENT = os.getenv("BILIBILI_USER_AGENT",
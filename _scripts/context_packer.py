@@ -0,0 +1,211 @@
+"""Context Packer - Fit the most useful note passages into a token budget.
+
+Prompts built from many notes used to be cut by character caps, in retrieval
+order. Character counts say little about tokens in mixed Chinese/English
+text, and the cut dropped whole notes at the tail. Instead:
+- Token counts are estimated offline (DeepSeek's published ratios: ~0.6
+  token per CJK character, ~0.3 per other character)
+- Notes are split into passages on headings and paragraphs
+- Each passage is valued by its note's weight, its position in the note and
+  (given a query) its BM25-style match, then passages are picked greedily by
+  value per token until the budget is full, at most `per_note` per note
+
+Selected passages are emitted in note order, then document order, so each
+note still reads top to bottom.
+"""
+
+import math
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+# Add parent for config
+sys.path.insert(0, str(Path(__file__).parent))
+from vault_index import tokenize
+
+CJK_TOKENS_PER_CHAR = 0.6
+OTHER_TOKENS_PER_CHAR = 0.3
+
+# Passages are paragraphs merged up to this size; longer paragraphs are split
+PASSAGE_TOKENS = 300
+# Lead passages carry the most signal when nothing else distinguishes them
+POSITION_DECAY = 0.85
+# How much a perfect query match outweighs an unmatched passage
+QUERY_BOOST = 3.0
+
+GAP_MARKER = "[...]"
+
+_CJK_RE = re.compile(r"[\u3000-\u303f\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uff00-\uffef]")
+_BLOCK_RE = re.compile(r"\n\s*\n|\n(?=#{1,6}\s)")
+_SENTENCE_RE = re.compile(r"[^.!?\u3002\uff01\uff1f\uff1b]*(?:[.!?\u3002\uff01\uff1f\uff1b]+\s*|$)")
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count for mixed CJK/English text."""
+    cjk = len(_CJK_RE.findall(text))
+    return math.ceil(cjk * CJK_TOKENS_PER_CHAR + (len(text) - cjk) * OTHER_TOKENS_PER_CHAR)
+
+
+def _split_long(block: str, max_tokens: int) -> List[str]:
+    """Split an oversized block at sentence ends (hard cut as a last resort)."""
+    pieces: List[str] = []
+    current = ""
+    for sentence in _SENTENCE_RE.findall(block):
+        if not sentence:
+            continue
+        if current and estimate_tokens(current + sentence) > max_tokens:
+            pieces.append(current)
+            current = ""
+        while estimate_tokens(sentence) > max_tokens:
+            # Characters per budget at this text's density
+            cut = max(1, int(len(sentence) * max_tokens / estimate_tokens(sentence)))
+            pieces.append(sentence[:cut])
+            sentence = sentence[cut:]
+        current += sentence
+    if current.strip():
+        pieces.append(current)
+    return [p.strip() for p in pieces if p.strip()]
+
+
+def split_passages(text: str, max_tokens: int = PASSAGE_TOKENS) -> List[str]:
+    """Split a note into passages of at most ~max_tokens on heading/paragraph breaks."""
+    passages: List[str] = []
+    current = ""
+    for block in _BLOCK_RE.split(text):
+        block = block.strip()
+        if not block:
+            continue
+        if estimate_tokens(block) > max_tokens:
+            pieces = _split_long(block, max_tokens)
+            if current.startswith("#") and "\n" not in current:
+                # Keep a bare heading with the text under it
+                pieces[0] = f"{current}\n\n{pieces[0]}"
+            elif current:
+                passages.append(current)
+            current = ""
+            passages.extend(pieces)
+            continue
+        # A heading starts a new passage so it stays with its section
+        if current and (block.startswith("#") or estimate_tokens(current) + estimate_tokens(block) > max_tokens):
+            passages.append(current)
+            current = ""
+        current = f"{current}\n\n{block}" if current else block
+    if current:
+        passages.append(current)
+    return passages
+
+
+def split_chunks(text: str, max_tokens: int) -> List[str]:
+    """Split text into as few ~max_tokens chunks as possible, breaking only
+    between passages (heading and paragraph boundaries)."""
+    chunks: List[str] = []
+    current: List[str] = []
+    size = 0
+    for passage in split_passages(text, max_tokens=min(max_tokens, PASSAGE_TOKENS * 4)):
+        tokens = estimate_tokens(passage)
+        if current and size + tokens > max_tokens:
+            chunks.append("\n\n".join(current))
+            current, size = [], 0
+        current.append(passage)
+        size += tokens
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+def _query_scores(passages: List[Dict], query: str) -> None:
+    """Set each passage's `rel` to its BM25 score over the query, scaled to [0, 1]."""
+    terms = set(tokenize(query))
+    if not terms:
+        return
+    counts = [Counter(t for t in tokenize(p["text"]) if t in terms) for p in passages]
+    n = len(passages)
+    df = Counter(t for c in counts for t in c)
+    avg_len = sum(p["tokens"] for p in passages) / n if n else 1
+    k1, b = 1.2, 0.75
+    raw = []
+    for p, c in zip(passages, counts):
+        score = 0.0
+        for term, tf in c.items():
+            idf = math.log(1 + (n - df[term] + 0.5) / (df[term] + 0.5))
+            score += idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * p["tokens"] / avg_len))
+        raw.append(score)
+    top = max(raw) if raw else 0
+    if top > 0:
+        for p, score in zip(passages, raw):
+            p["rel"] = score / top
+
+
+def pack(
+    docs: Sequence[Dict],
+    budget: int,
+    query: Optional[str] = None,
+    per_note: int = 3,
+    separator: str = "\n\n---\n\n",
+) -> str:
+    """Pack note passages into at most `budget` estimated tokens.
+
+    Args:
+        docs: Dicts with `header` (shown once above a note's passages),
+            `text`, and optional `weight` (default 1.0; e.g. retrieval rank
+            or a priority boost).
+        budget: Token budget for the whole returned string.
+        query: When given, passages matching it are preferred.
+        per_note: Keep at most this many passages from each note.
+        separator: Placed between notes.
+
+    Returns:
+        The packed context; notes with no selected passage are left out.
+    """
+    passages: List[Dict] = []
+    header_tokens: List[int] = []
+    sizes: List[int] = []
+    for d, doc in enumerate(docs):
+        header_tokens.append(estimate_tokens(doc.get("header", "")) + estimate_tokens(separator))
+        weight = doc.get("weight", 1.0)
+        texts = split_passages(doc.get("text", ""))
+        sizes.append(len(texts))
+        for i, text in enumerate(texts):
+            passages.append({
+                "doc": d,
+                "pos": i,
+                "text": text,
+                "tokens": estimate_tokens(text) + 2,
+                "prior": weight * POSITION_DECAY ** i,
+                "rel": 0.0,
+            })
+    if query:
+        _query_scores(passages, query)
+
+    # Value per token; passage value = tokens * prior * (1 + boost * rel)
+    passages.sort(key=lambda p: -p["prior"] * (1 + QUERY_BOOST * p["rel"]))
+
+    chosen: Dict[int, List[Dict]] = {}
+    used = 0
+    for p in passages:
+        picked = chosen.get(p["doc"])
+        if picked is not None and len(picked) >= per_note:
+            continue
+        cost = p["tokens"] + (header_tokens[p["doc"]] if picked is None else 0)
+        if used + cost > budget:
+            continue
+        chosen.setdefault(p["doc"], []).append(p)
+        used += cost
+
+    blocks = []
+    for d in sorted(chosen):
+        picked = sorted(chosen[d], key=lambda p: p["pos"])
+        body = []
+        prev = -1
+        for p in picked:
+            if p["pos"] != prev + 1:
+                body.append(GAP_MARKER)
+            body.append(p["text"])
+            prev = p["pos"]
+        if prev < sizes[d] - 1:
+            body.append(GAP_MARKER)
+        header = docs[d].get("header", "")
+        blocks.append(f"{header}\n\n" + "\n\n".join(body) if header else "\n\n".join(body))
+    return separator.join(blocks)
@@ -76,7 +76,7 @@ Provide:
 4. A synthesized framework or model that ties everything together
 5. The most important 3-5 insights to remember"""
         
-        result = summarize(prompt, CONVERGE_PROMPT)
+        result = summarize(prompt, CONVERGE_PROMPT, cache=False)
         return {"topic": topic, "synthesis": result}
     
     def prioritize(self, options: List[str], framework: str = "impact-effort", criteria: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -104,7 +104,7 @@ For each option, provide:
 
 Be systematic and objective, but also pragmatic about real-world constraints."""
         
-        result = summarize(prompt, CONVERGE_PROMPT)
+        result = summarize(prompt, CONVERGE_PROMPT, cache=False)
         return {"framework": framework, "prioritization": result}
     
     def decide(self, question: str, options: List[str], framework: str = "pros-cons") -> Dict[str, Any]:
@@ -128,7 +128,7 @@ Using the {framework} framework, provide:
 
 Make a clear recommendation, don't just analyze forever."""
         
-        result = summarize(prompt, CONVERGE_PROMPT)
+        result = summarize(prompt, CONVERGE_PROMPT, cache=False)
         return {"question": question, "decision": result}
     
     def next_steps(self, goal: str, synthesis: str) -> List[str]:
@@ -151,7 +151,7 @@ Each next step should be:
 - Time-bound (has clear timing)
 - Measurable (we can tell if it's done)"""
         
-        result = summarize(prompt, CONVERGE_PROMPT)
+        result = summarize(prompt, CONVERGE_PROMPT, cache=False)
         return self._parse_list(result)
     
     def tradeoffs(self, options: List[str]) -> Dict[str, Any]:
@@ -172,7 +172,7 @@ For each pair of options, analyze:
 
 Provide a clear tradeoff matrix and guidance on what matters most."""
         
-        result = summarize(prompt, CONVERGE_PROMPT)
+        result = summarize(prompt, CONVERGE_PROMPT, cache=False)
         return {"options": options, "tradeoffs": result}
     
     def distill(self, content: str, ratio: float = 0.3) -> str:
@@ -190,7 +190,7 @@ Extract:
 
 Make it concise but comprehensive."""
         
-        return summarize(prompt, CONVERGE_PROMPT)
+        return summarize(prompt, CONVERGE_PROMPT, cache=False)
     
     def full_convergence(self, topic: str, ideas: List[str]) -> Dict[str, Any]:
         """Complete convergence process: synthesize, prioritize, decide, next steps."""
@@ -17,6 +17,7 @@ Features:
 import argparse
 import sys
 import re
+from collections import defaultdict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Set
@@ -24,6 +25,8 @@ from typing import Dict, List, Any, Optional, Set
 # Add parent for config
 sys.path.insert(0, str(Path(__file__).parent))
 from config import summarize, save_note, VAULT_PATH
+from vault_walker import get_walker
+from note_store import get_store
 
 
 CURL_PROMPT = """You are a knowledge curation assistant. Your role is to help
@@ -45,6 +48,24 @@ For each curation, provide:
 """
 
 
+class KeywordMatcher:
+    """Case-insensitive matcher for many keywords in a single scan.
+    
+    Keywords are compiled into one alternation (longest first), so each text
+    is scanned once for all of them by the C regex engine instead of once per
+    keyword.
+    """
+    
+    def __init__(self, keywords: List[str]):
+        self.keywords = [kw for kw in dict.fromkeys(keywords) if kw]
+        alternation = "|".join(re.escape(kw) for kw in sorted(self.keywords, key=len, reverse=True))
+        self._pattern = re.compile(alternation, re.IGNORECASE) if alternation else None
+    
+    def search(self, text: str) -> bool:
+        """True if any keyword occurs in `text`."""
+        return bool(self._pattern and self._pattern.search(text))
+
+
 class InformationCurator:
     """Engine for curating information from multiple sources."""
     
@@ -60,50 +81,72 @@ class InformationCurator:
             "02 - Areas",
             "03 - Resources"
         ]
+        
+        # Per-run caches shared by the filters and gather_files
+        self._contents: Dict[Path, Optional[str]] = {}
+        self._mtimes: Dict[Path, float] = {}
+    
+    def _iter_markdown(self, directories: List[str]) -> List[Path]:
+        """Markdown files under the given vault folders (cached, pruned walk)."""
+        files: List[Path] = []
+        walker = get_walker()
+        for dir_name in directories:
+            for rel, entry in sorted(walker.scan(under=dir_name, fresh=True).items()):
+                path = self.vault_path / rel
+                self._mtimes[path] = entry.mtime_ns / 1e9
+                files.append(path)
+        return files
+    
+    def _read(self, md_file: Path) -> Optional[str]:
+        """File content, read at most once per curator."""
+        if md_file not in self._contents:
+            try:
+                self._contents[md_file] = md_file.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                self._contents[md_file] = None
+        return self._contents[md_file]
     
-    def search_by_tags(self, tags: List[str], directories: Optional[List[str]] = None) -> List[Path]:
-        """Find files containing any of the specified tags."""
+    def tag_index(self, directories: Optional[List[str]] = None) -> Dict[str, Set[Path]]:
+        """Inverted index: tag -> notes, with nested tags also under each parent.
+        
+        Built from the note store's cached metadata (frontmatter and inline
+        tags), so unchanged notes are not re-read. Notes the store has to
+        parse are read through _read, so gather_files and keyword search
+        reuse that content instead of reading the file again.
+        """
         if directories is None:
             directories = self.source_dirs
-        
-        matching_files = []
-        tag_patterns = [re.compile(rf'#\s*{re.escape(tag)}\b', re.IGNORECASE) for tag in tags]
-        
-        for dir_name in directories:
-            dir_path = self.vault_path / dir_name
-            if not dir_path.exists():
+        store = get_store()
+        index: Dict[str, Set[Path]] = defaultdict(set)
+        for md_file in self._iter_markdown(directories):
+            meta = store.get_meta(md_file, reader=self._read)
+            if not meta:
                 continue
-            
-            for md_file in dir_path.rglob("*.md"):
-                try:
-                    content = md_file.read_text(encoding="utf-8")
-                    if any(pattern.search(content) for pattern in tag_patterns):
-                        matching_files.append(md_file)
-                except:
-                    continue
-        
-        return matching_files
+            for tag in meta["tags"]:
+                parts = tag.lower().strip("/").split("/")
+                for i in range(1, len(parts) + 1):
+                    index["/".join(parts[:i])].add(md_file)
+        return index
+    
+    def search_by_tags(self, tags: List[str], directories: Optional[List[str]] = None) -> List[Path]:
+        """Find files carrying any of the specified tags (or tags nested under them)."""
+        index = self.tag_index(directories)
+        matching: Set[Path] = set()
+        for tag in tags:
+            matching |= index.get(tag.lower().lstrip("#").strip("/"), set())
+        return sorted(matching)
     
     def search_by_keywords(self, keywords: List[str], directories: Optional[List[str]] = None) -> List[Path]:
-        """Find files containing any of the specified keywords."""
+        """Find files containing any of the specified keywords (one scan per file)."""
         if directories is None:
             directories = self.source_dirs
         
+        matcher = KeywordMatcher(keywords)
         matching_files = []
-        keyword_patterns = [re.compile(re.escape(kw), re.IGNORECASE) for kw in keywords]
-        
-        for dir_name in directories:
-            dir_path = self.vault_path / dir_name
-            if not dir_path.exists():
-                continue
-            
-            for md_file in dir_path.rglob("*.md"):
-                try:
-                    content = md_file.read_text(encoding="utf-8")
-                    if any(pattern.search(content) for pattern in keyword_patterns):
-                        matching_files.append(md_file)
-                except:
-                    continue
+        for md_file in self._iter_markdown(directories):
+            content = self._read(md_file)
+            if content is not None and matcher.search(content):
+                matching_files.append(md_file)
         
         return matching_files
     
@@ -112,23 +155,14 @@ class InformationCurator:
         if directories is None:
             directories = self.source_dirs
         
-        cutoff = datetime.now() - timedelta(days=days)
-        matching_files = []
-        
-        for dir_name in directories:
-            dir_path = self.vault_path / dir_name
-            if not dir_path.exists():
-                continue
-            
-            for md_file in dir_path.rglob("*.md"):
-                try:
-                    mtime = datetime.fromtimestamp(md_file.stat().st_mtime)
-                    if mtime >= cutoff:
-                        matching_files.append(md_file)
-                except:
-                    continue
+        cutoff = (datetime.now() - timedelta(days=days)).timestamp()
+        matching_files = [
+            (self._mtimes[md_file], md_file)
+            for md_file in self._iter_markdown(directories)
+            if self._mtimes[md_file] >= cutoff
+        ]
         
-        return sorted(matching_files, key=lambda x: x.stat().st_mtime, reverse=True)
+        return [f for _, f in sorted(matching_files, key=lambda x: x[0], reverse=True)]
     
     def search_in_directory(self, directory: str, pattern: str = "*.md") -> List[Path]:
         """Search for files in a specific directory."""
@@ -171,17 +205,20 @@ class InformationCurator:
         
         # Read file contents
         results = []
-        for file_path in all_files:
-            try:
-                content = file_path.read_text(encoding="utf-8")
-                results.append({
-                    "path": str(file_path.relative_to(self.vault_path)),
-                    "name": file_path.name,
-                    "content": content,
-                    "mtime": datetime.fromtimestamp(file_path.stat().st_mtime)
-                })
-            except Exception as e:
-                print(f"Warning: Could not read {file_path}: {e}")
+        for file_path in sorted(all_files):
+            content = self._read(file_path)
+            if content is None:
+                print(f"Warning: Could not read {file_path}")
+                continue
+            mtime = self._mtimes.get(file_path)
+            if mtime is None:
+                mtime = file_path.stat().st_mtime
+            results.append({
+                "path": str(file_path.relative_to(self.vault_path)),
+                "name": file_path.name,
+                "content": content,
+                "mtime": datetime.fromtimestamp(mtime)
+            })
         
         return results
     
@@ -5,11 +5,11 @@ contradictions, and the single most important signal of the day.
 """
 
 import argparse
-import re
 from datetime import datetime
 from pathlib import Path
 
-from config import summarize, save_note, VAULT_PATH, TRACKER
+from config import summarize, save_note, TRACKER
+from note_manifest import notes_between, read_body
 
 SYNTHESIS_PROMPT = """You are a cross-domain pattern detector. Given today's curated notes from
 multiple sources (ArXiv, Hacker News, Reddit, news, Twitter), find ONLY:
@@ -35,40 +35,14 @@ SKIP_TYPES = {"weekly-synthesis", "self-reflection", "daily-synthesis"}
 
 def collect_today_notes() -> list:
     """Find all Source notes from today, excluding synthesis/reflection notes."""
-    sources_dir = VAULT_PATH / "Sources"
-    if not sources_dir.exists():
-        return []
-
-    today_str = datetime.now().strftime("%Y-%m-%d")
     notes = []
 
-    for md_file in sources_dir.glob("*.md"):
-        # Only include files with today's date in the name
-        if today_str not in md_file.name:
-            continue
-
-        content = md_file.read_text(encoding="utf-8")
-
-        # Extract type from frontmatter
-        note_type = "unknown"
-        type_match = re.search(r"^type:\s*(.+)$", content, re.MULTILINE)
-        if type_match:
-            note_type = type_match.group(1).strip()
-
-        # Skip synthesis/reflection notes to avoid self-referential loops
-        if note_type in SKIP_TYPES:
-            continue
-
-        # Extract the body (skip frontmatter)
-        body = content
-        fm_match = re.match(r"^---\s*\n.*?\n---\s*\n", content, re.DOTALL)
-        if fm_match:
-            body = content[fm_match.end():]
-
+    # Skip synthesis/reflection notes to avoid self-referential loops
+    for rec in notes_between(datetime.now(), exclude_types=SKIP_TYPES):
         notes.append({
-            "filename": md_file.stem,
-            "type": note_type,
-            "content": body[:2000],  # 2000 char cap (lighter than weekly's 3000)
+            "filename": rec["filename"],
+            "type": rec["type"],
+            "content": read_body(rec)[:2000],  # 2000 char cap (lighter than weekly's 3000)
         })
 
     return notes
@@ -103,7 +103,7 @@ Generate steelmanned opposing views to this position."""
 The user is exploring this topic/position. Generate steelmanned opposing views. You may infer the implied position from the topic alone."""
 
     print("Generating steelmanned opposing views...")
-    result = summarize(user_input, STEELMAN_PROMPT)
+    result = summarize(user_input, STEELMAN_PROMPT, cache=False)
 
     today = datetime.now().strftime("%Y-%m-%d")
 
@@ -14,12 +14,12 @@ from typing import List, Optional
 
 # Add parent for config
 sys.path.insert(0, str(Path(__file__).parent))
-from config import summarize, save_note, VAULT_PATH, TRACKER
+from config import summarize, summarize_many, summarize_stream, save_note, VAULT_PATH, TRACKER
 
 # Import RAG components
 from rag_query import (
     find_markdown_files,
-    search_vault_keyword,
+    retrieve_seeds,
     read_note,
     expand_via_graph,
     build_context,
@@ -167,24 +167,18 @@ Output structure:
 [All cited sources]"""
 
 
-def run_vault_rag(query: str, top_k: int = 15, depth: int = 2) -> str:
-    """Retrieve and synthesize vault content via RAG."""
-    all_files = find_markdown_files()
-    seed_paths = search_vault_keyword(query, limit=top_k)
+STEELMAN_PROMPT = """You are an expert at steelmanning — presenting the strongest possible version of opposing arguments. Given the research topic, identify 2-4 substantive opposing views and present each in 2-3 paragraphs. Be charitable and substantive. No YAML frontmatter."""
 
-    if not seed_paths:
-        query_lower = query.lower()
-        for f in all_files:
-            if len(seed_paths) >= top_k:
-                break
-            try:
-                if query_lower in f.read_text(encoding="utf-8").lower():
-                    seed_paths.append(f)
-            except Exception:
-                pass
+NO_VAULT_MATCHES = "(No matching notes found in vault.)"
+
+
+def vault_rag_message(query: str, top_k: int = 15, depth: int = 2, rank: str = "keyword") -> Optional[str]:
+    """Retrieve vault context and build the RAG user message (None if nothing matched)."""
+    all_files = find_markdown_files()
+    seed_paths = retrieve_seeds(query, limit=top_k, rank=rank)
 
     if not seed_paths:
-        return "(No matching notes found in vault.)"
+        return None
 
     seed_paths = [p if isinstance(p, Path) else Path(p) for p in seed_paths]
     expanded = expand_via_graph(
@@ -195,7 +189,14 @@ def run_vault_rag(query: str, top_k: int = 15, depth: int = 2) -> str:
     )
     paths = list(expanded)[: top_k * 2]
     context = build_context(paths, "hybrid", query)
-    user_msg = build_user_message(query, "hybrid", context or "(No context)")
+    return build_user_message(query, "hybrid", context or "(No context)")
+
+
+def run_vault_rag(query: str, top_k: int = 15, depth: int = 2, rank: str = "keyword") -> str:
+    """Retrieve and synthesize vault content via RAG."""
+    user_msg = vault_rag_message(query, top_k=top_k, depth=depth, rank=rank)
+    if user_msg is None:
+        return NO_VAULT_MATCHES
     return summarize(user_msg, RAG_SYSTEM_PROMPT)
 
 
@@ -208,7 +209,6 @@ def run_source_finder(topic: str) -> str:
 
 def run_steelman(topic: str) -> str:
     """Generate steelmanned opposing views."""
-    STEELMAN_PROMPT = """You are an expert at steelmanning — presenting the strongest possible version of opposing arguments. Given the research topic, identify 2-4 substantive opposing views and present each in 2-3 paragraphs. Be charitable and substantive. No YAML frontmatter."""
     return summarize(topic, STEELMAN_PROMPT)
 
 
@@ -249,6 +249,7 @@ def run_methodology(
     include_sources: bool,
     include_debate: bool,
     save_final: bool,
+    rank: str = "keyword",
 ) -> str:
     """Run full 8-step methodology with intermediate artifacts."""
     safe = _safe_topic(query)
@@ -260,25 +261,29 @@ def run_methodology(
         path.write_text(content, encoding="utf-8")
         print(f"   Saved: {path.relative_to(VAULT_PATH)}")
 
-    # Phase 1: Vault RAG
-    print("\n📚 Step 0-1: Problem type, time-sensitivity, decomposition...")
-    step01 = summarize(
-        f"Research topic: {query}\n\nAnalyze and output the structured response.",
-        STEP_0_1_PROMPT,
-    )
+    # Phase 1-2: decomposition, vault RAG and steelman don't depend on each
+    # other, so their AI calls run in parallel
+    print("\n📚 Step 0-1: Problem type, time-sensitivity, decomposition + retrieving from vault...")
+    rag_msg = vault_rag_message(query, top_k=top_k, depth=depth, rank=rank)
+    batch = [(f"Research topic: {query}\n\nAnalyze and output the structured response.", STEP_0_1_PROMPT)]
+    if rag_msg is not None:
+        batch.append((rag_msg, RAG_SYSTEM_PROMPT))
+    if include_debate:
+        print("   Steelmanning opposing views...")
+        batch.append((query, STEELMAN_PROMPT))
+    results = summarize_many(batch)
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+    step01 = results.pop(0)
+    vault_section = results.pop(0) if rag_msg is not None else NO_VAULT_MATCHES
+    steelman_section = results.pop(0) if include_debate else None
     _save("00_problem_decomposition.md", f"# Problem Decomposition\n\n**Topic:** {query}\n\n---\n\n{step01}")
 
-    # Phase 2: Retrieve content
-    print("\n📚 Retrieving from vault...")
-    vault_section = run_vault_rag(query, top_k=top_k, depth=depth)
     sources_section = None
     if include_sources and HAS_SOURCE_FINDER:
         print("   Finding external sources...")
         sources_section = run_source_finder(query)
-    steelman_section = None
-    if include_debate:
-        print("   Steelmanning opposing views...")
-        steelman_section = run_steelman(query)
 
     combined = vault_section
     if sources_section:
@@ -365,6 +370,13 @@ Examples:
         default=2,
         help="Graph expansion depth for RAG (default: 2)",
     )
+    parser.add_argument(
+        "--rank",
+        type=str,
+        choices=["keyword", "bm25"],
+        default="keyword",
+        help="Vault seed ranking: exact phrase match or BM25 relevance (default: keyword)",
+    )
     parser.add_argument(
         "--save",
         action="store_true",
@@ -396,6 +408,7 @@ Examples:
             include_sources=args.sources,
             include_debate=args.debate,
             save_final=args.save,
+            rank=args.rank,
         )
         print("\n" + "=" * 60)
         print(report)
@@ -418,7 +431,7 @@ Examples:
 
     # Phase 1: Vault RAG
     print("\n📚 Phase 1: Retrieving from vault...")
-    vault_section = run_vault_rag(args.query, top_k=args.top_k, depth=args.depth)
+    vault_section = run_vault_rag(args.query, top_k=args.top_k, depth=args.depth, rank=args.rank)
     print("   Done.")
 
     # Phase 2: External sources (optional)
@@ -443,7 +456,10 @@ Examples:
         sources_section,
         steelman_section,
     )
-    report = summarize(user_prompt, DEEP_RESEARCH_SYSTEM)
+    print("\n" + "=" * 60)
+    stream_stats = {}
+    report = "".join(summarize_stream(user_prompt, DEEP_RESEARCH_SYSTEM, stats=stream_stats)).strip()
+    print("=" * 60)
 
     # Output
     date_str = datetime.now().strftime("%Y-%m-%d")
@@ -455,16 +471,12 @@ Examples:
         save_note(save_path, title)
         print(f"\n💾 Saved to: {save_path}")
 
-    print("\n" + "=" * 60)
-    print(report)
-    print("=" * 60)
-
     if TRACKER:
         TRACKER.record_operation(
             script_name="deep_research.py",
             operation_type="deep_research",
             status="success",
-            metrics={"query": args.query[:50], "saved": args.save},
+            metrics={"query": args.query[:50], "saved": args.save, "first_token_s": stream_stats.get("first_token_s")},
         )
 
 
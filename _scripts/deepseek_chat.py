@@ -16,12 +16,14 @@ import requests
 # Add parent directory to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from config import TRACKER, VAULT_PATH
+from config import TRACKER, VAULT_PATH, summarize_stream
+from config import DEEPSEEK_API_KEY as CONFIG_API_KEY, DEEPSEEK_BASE_URL as CONFIG_BASE_URL
 
 import os
 DEEPSEEK_API_KEY = os.getenv("DEEPSEEK_API_KEY", "")
 DEEPSEEK_BASE_URL = os.getenv("DEEPSEEK_BASE_URL", "https://api.deepseek.com")
 DEEPSEEK_MODEL = os.getenv("DEEPSEEK_MODEL", "deepseek-chat")
+DEFAULT_SYSTEM_PROMPT = "You are a helpful assistant."
 
 
 class DeepSeekClient:
@@ -118,6 +120,8 @@ def chat_with_deepseek(
     model: Optional[str] = None,
     temperature: float = 0.7,
     stream: bool = False,
+    max_tokens: Optional[int] = None,
+    stats: Optional[Dict[str, Any]] = None,
 ) -> str:
     """
     Simple one-shot chat with DeepSeek.
@@ -128,10 +132,28 @@ def chat_with_deepseek(
         model: Model to use
         temperature: Sampling temperature
         stream: Whether to stream response
+        max_tokens: Maximum tokens in response
+        stats: Filled with first-token latency when streaming
         
     Returns:
         AI response string
     """
+    # Stream through the shared config client unless --api-key/--base-url overrode it
+    overridden = (DEEPSEEK_API_KEY, DEEPSEEK_BASE_URL) != (CONFIG_API_KEY, CONFIG_BASE_URL)
+    if stream and not overridden:
+        params = {"temperature": temperature}
+        if max_tokens is not None:
+            params["max_tokens"] = max_tokens
+        deltas = summarize_stream(
+            prompt,
+            system_prompt or DEFAULT_SYSTEM_PROMPT,
+            model=model or DEEPSEEK_MODEL,
+            cache=False,
+            stats=stats,
+            **params,
+        )
+        return "".join(deltas).strip()
+
     client = DeepSeekClient()
     
     messages = []
@@ -143,6 +165,7 @@ def chat_with_deepseek(
         messages=messages,
         model=model,
         temperature=temperature,
+        max_tokens=max_tokens,
         stream=stream,
     )
     
@@ -157,7 +180,8 @@ def main():
 Examples:
   python3 _scripts/deepseek_chat.py "Explain quantum computing"
   python3 _scripts/deepseek_chat.py "Write a Python function" --system "You are a coding assistant"
-  python3 _scripts/deepseek_chat.py "Tell me a story" --temperature 1.0 --stream
+  python3 _scripts/deepseek_chat.py "Tell me a story" --temperature 1.0
+  python3 _scripts/deepseek_chat.py "Summarize this" --no-stream
   python3 _scripts/deepseek_chat.py --model deepseek-coder "Debug this code"
         """
     )
@@ -181,8 +205,12 @@ Examples:
         help="Maximum tokens in response"
     )
     parser.add_argument(
-        "--stream", action="store_true",
-        help="Stream the response"
+        "--stream", action="store_true", default=True,
+        help="Stream the response as it is generated (default)"
+    )
+    parser.add_argument(
+        "--no-stream", dest="stream", action="store_false",
+        help="Wait for the full response before printing"
     )
     parser.add_argument(
         "--api-key",
@@ -242,6 +270,7 @@ Examples:
                 )
             return 1
         
+        stream_stats: Dict[str, Any] = {}
         print("\n🤖 DeepSeek Response:\n")
         print("-" * 50)
         
@@ -251,6 +280,8 @@ Examples:
             model=args.model,
             temperature=args.temperature,
             stream=args.stream,
+            max_tokens=args.max_tokens,
+            stats=stream_stats,
         )
         
         if not args.stream:
@@ -266,7 +297,8 @@ Examples:
                 status="success",
                 metrics={
                     "prompt_length": len(prompt),
-                    "response_length": len(response) if response else 0
+                    "response_length": len(response) if response else 0,
+                    "first_token_s": stream_stats.get("first_token_s"),
                 }
             )
         return 0
@@ -23,7 +23,7 @@ from typing import Dict, List, Any, Optional
 
 # Add parent for config
 sys.path.insert(0, str(Path(__file__).parent))
-from config import summarize, save_note, VAULT_PATH
+from config import summarize, summarize_many, save_note, VAULT_PATH
 
 
 DIVERGE_PROMPT = """You are a creative thinking assistant specializing in divergent thinking.
@@ -69,7 +69,11 @@ class DivergentThinker:
     
     def generate_ideas(self, topic: str, count: int = 10) -> List[str]:
         """Generate a list of diverse ideas from a central topic."""
-        prompt = f"""Generate {count} diverse, creative ideas about: {topic}
+        return self._parse_list(summarize(self._ideas_prompt(topic, count), DIVERGE_PROMPT, cache=False))
+
+    @staticmethod
+    def _ideas_prompt(topic: str, count: int) -> str:
+        return f"""Generate {count} diverse, creative ideas about: {topic}
 
 For each idea, think expansively about:
 - Different applications of the concept
@@ -79,13 +83,15 @@ For each idea, think expansively about:
 
 Output exactly {count} ideas, one per line, numbered 1-{count}.
 Each idea should be concise (1-2 sentences) and thought-provoking."""
-        
-        result = summarize(prompt, DIVERGE_PROMPT)
-        return self._parse_list(result)
     
     def explore_branches(self, topic: str, branches: int = 5) -> Dict[str, List[str]]:
         """Explore multiple branching directions from a central topic."""
-        prompt = f"""Starting from the central concept: {topic}
+        result = summarize(self._branches_prompt(topic, branches), DIVERGE_PROMPT, cache=False)
+        return {"topic": topic, "branches": self._parse_sections(result)}
+
+    @staticmethod
+    def _branches_prompt(topic: str, branches: int) -> str:
+        return f"""Starting from the central concept: {topic}
 
 Explore {branches} different, distinct directions this topic could branch into.
 For each branch:
@@ -95,9 +101,6 @@ For each branch:
 
 Make each branch fundamentally different from the others.
 Cover various perspectives: practical, theoretical, creative, critical, etc."""
-        
-        result = summarize(prompt, DIVERGE_PROMPT)
-        return {"topic": topic, "branches": self._parse_sections(result)}
     
     def cross_domain_connections(self, topic: str, domains: Optional[List[str]] = None) -> List[str]:
         """Find connections between the topic and unrelated domains."""
@@ -113,12 +116,16 @@ For each domain:
 
 Make these connections meaningful, not forced. Look for deep structural similarities."""
         
-        result = summarize(prompt, DIVERGE_PROMPT)
+        result = summarize(prompt, DIVERGE_PROMPT, cache=False)
         return self._parse_list(result)
     
     def question_storm(self, topic: str, count: int = 15) -> List[str]:
         """Generate provocative questions that challenge assumptions."""
-        prompt = f"""Generate {count} provocative, thought-provoking questions about: {topic}
+        return self._parse_list(summarize(self._questions_prompt(topic, count), DIVERGE_PROMPT, cache=False))
+
+    @staticmethod
+    def _questions_prompt(topic: str, count: int) -> str:
+        return f"""Generate {count} provocative, thought-provoking questions about: {topic}
 
 Include:
 - Questions that challenge basic assumptions
@@ -129,9 +136,22 @@ Include:
 
 Avoid simple factual questions. Focus on questions that spark thinking.
 Number them 1-{count}."""
-        
-        result = summarize(prompt, DIVERGE_PROMPT)
-        return self._parse_list(result)
+
+    def full_session(self, topic: str) -> Dict[str, Any]:
+        """Ideas, branches and questions, requested in parallel."""
+        ideas, branches, questions = summarize_many([
+            (self._ideas_prompt(topic, 10), DIVERGE_PROMPT),
+            (self._branches_prompt(topic, 5), DIVERGE_PROMPT),
+            (self._questions_prompt(topic, 15), DIVERGE_PROMPT),
+        ], cache=False)
+        for result in (ideas, branches, questions):
+            if isinstance(result, Exception):
+                raise result
+        return {
+            "ideas": self._parse_list(ideas),
+            "branches_text": str({"topic": topic, "branches": self._parse_sections(branches)}),
+            "questions": self._parse_list(questions),
+        }
     
     def mind_map(self, topic: str, depth: int = 3) -> Dict[str, Any]:
         """Create a mind map structure for the topic."""
@@ -145,7 +165,7 @@ Structure:
 
 Make it rich and interconnected. Use evocative language for each node."""
         
-        result = summarize(prompt, DIVERGE_PROMPT)
+        result = summarize(prompt, DIVERGE_PROMPT, cache=False)
         return {"topic": topic, "mind_map": result}
     
     def random_walk(self, topic: str, steps: int = 5) -> List[str]:
@@ -164,7 +184,7 @@ Step 2: [concept] (because: [connection])
 ...
 Final insight: [what we learned from this walk]"""
         
-        result = summarize(prompt, DIVERGE_PROMPT)
+        result = summarize(prompt, DIVERGE_PROMPT, cache=False)
         return self._parse_list(result)
     
     def _parse_list(self, text: str) -> List[str]:
@@ -344,10 +364,7 @@ Examples:
     else:
         mode = "full"
         print("🧠 Full divergence session...")
-        results["ideas"] = thinker.generate_ideas(args.topic, 10)
-        branch_result = thinker.explore_branches(args.topic)
-        results["branches_text"] = str(branch_result)
-        results["questions"] = thinker.question_storm(args.topic, 15)
+        results = thinker.full_session(args.topic)
     
     # Generate report
     report = format_diverge_report(args.topic, results, mode)
@@ -258,7 +258,7 @@ def main():
 
     prompt = build_essay_prompt(args.topic, notes_text)
     print("Generating essay with AI...")
-    essay_body = summarize(notes_text, prompt)
+    essay_body = summarize(notes_text, prompt, cache=False)
 
     today = datetime.now().strftime("%Y-%m-%d")
 
@@ -11,7 +11,6 @@ Different from /rag: Filter returns only exact matches; RAG synthesizes broadly.
 
 import argparse
 import re
-import subprocess
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -19,7 +18,8 @@ from typing import Dict, List, Optional, Tuple
 
 # Add parent for config
 sys.path.insert(0, str(Path(__file__).parent))
-from config import summarize, save_note, VAULT_PATH, TRACKER
+from config import summarize, save_note, TRACKER
+from vault_index import get_index
 
 # Reuse RAG infrastructure
 from rag_query import (
@@ -41,62 +41,22 @@ def search_vault_multi(
     use_terms: bool = True,
 ) -> List[Path]:
     """Multi-strategy search: phrase match + term expansion for recall."""
-    seen: set = set()
-    results: List[Path] = []
+    index = get_index()
 
     # 1. Phrase search (exact query)
-    try:
-        proc = subprocess.run(
-            ["rg", "-l", "-i", "-F", "--max-count", "1", query, str(VAULT_PATH)],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        if proc.returncode == 0 and proc.stdout:
-            for line in proc.stdout.strip().split("\n"):
-                if line.strip():
-                    p = Path(line.strip())
-                    if p.suffix == ".md":
-                        try:
-                            full = (VAULT_PATH / p).resolve() if not p.is_absolute() else p.resolve()
-                            if full.exists() and str(VAULT_PATH) in str(full) and full not in seen:
-                                seen.add(full)
-                                results.append(full)
-                        except (OSError, RuntimeError):
-                            pass
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        pass
-
-    if len(results) >= limit:
+    results = index.search(query, limit=limit)
+    if len(results) >= limit or not use_terms:
         return results[:limit]
 
     # 2. Term search (split query into words, any match)
-    if use_terms and len(results) < limit:
-        terms = [t.strip() for t in re.split(r"[\s,;]+", query) if len(t.strip()) >= 2]
-        for term in terms[:5]:
-            if len(results) >= limit:
-                break
-            try:
-                proc = subprocess.run(
-                    ["rg", "-l", "-i", "-F", "--max-count", "1", term, str(VAULT_PATH)],
-                    capture_output=True,
-                    text=True,
-                    timeout=20,
-                )
-                if proc.returncode == 0 and proc.stdout:
-                    for line in proc.stdout.strip().split("\n"):
-                        if line.strip():
-                            p = Path(line.strip())
-                            if p.suffix == ".md":
-                                try:
-                                    full = (VAULT_PATH / p).resolve() if not p.is_absolute() else p.resolve()
-                                    if full.exists() and str(VAULT_PATH) in str(full) and full not in seen:
-                                        seen.add(full)
-                                        results.append(full)
-                                except (OSError, RuntimeError):
-                                    pass
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
+    terms = [t.strip() for t in re.split(r"[\s,;]+", query) if len(t.strip()) >= 2]
+    seen = set(results)
+    for path in index.search_any(terms[:5], limit=limit):
+        if len(results) >= limit:
+            break
+        if path not in seen:
+            seen.add(path)
+            results.append(path)
 
     return results[:limit]
 
@@ -259,18 +219,6 @@ Examples:
     all_files = find_markdown_files()
     seed_paths = search_vault_multi(args.query, limit=25, use_terms=True)
 
-    if not seed_paths:
-        # Fallback: scan all files
-        q_lower = args.query.lower()
-        for f in all_files:
-            if len(seed_paths) >= 25:
-                break
-            try:
-                if q_lower in f.read_text(encoding="utf-8").lower():
-                    seed_paths.append(f)
-            except Exception:
-                pass
-
     if not seed_paths:
         print("❌ No matching notes found.")
         if TRACKER:
@@ -72,7 +72,7 @@ Please provide:
 
 Make meaningful but focused improvements - don't rewrite everything at once."""
         
-        result = summarize(prompt, GRADIENT_PROMPT)
+        result = summarize(prompt, GRADIENT_PROMPT, cache=False)
         
         return {
             "original": content,
@@ -121,7 +121,7 @@ Please analyze:
 
 Be constructive, specific, and actionable."""
         
-        result = summarize(prompt, GRADIENT_PROMPT)
+        result = summarize(prompt, GRADIENT_PROMPT, cache=False)
         
         return {
             "content": content,
@@ -154,7 +154,7 @@ Please provide:
 
 Be systematic and fair in your comparison."""
         
-        result = summarize(prompt, GRADIENT_PROMPT)
+        result = summarize(prompt, GRADIENT_PROMPT, cache=False)
         
         return {
             "version_a": version_a,
@@ -203,7 +203,7 @@ For each aspect ({aspects_text}):
 
 End with a fully enhanced synthesis of the idea."""
         
-        result = summarize(prompt, GRADIENT_PROMPT)
+        result = summarize(prompt, GRADIENT_PROMPT, cache=False)
         
         return {
             "original_idea": idea,
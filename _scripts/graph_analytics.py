@@ -0,0 +1,380 @@
+"""Graph Analytics - Centrality and community detection over the wikilink graph.
+
+Reusable functions on top of link_graph.LinkGraph:
+- pagerank: importance of each note (optionally personalized to seed notes)
+- approximate_betweenness: sampled Brandes BFS to surface "bridge" notes
+- label_propagation: communities of densely interlinked notes
+
+With NumPy (requirements.txt) all three run over sparse edge arrays
+(CSR adjacency + bincount, no dense matrices), so 100k-note vaults finish in
+seconds: PageRank by power iteration, betweenness by level-synchronous BFS,
+communities by semi-synchronous label propagation. Without NumPy they fall
+back to pure Python, which is fine for small vaults.
+
+PageRank is cached on its own (pagerank_weights), so retrieval doesn't pay
+for betweenness and communities after every note edit.
+"""
+
+import json
+import os
+import random
+import sys
+from collections import Counter, defaultdict, deque
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Add parent for config
+sys.path.insert(0, str(Path(__file__).parent))
+from config import CACHE_DIR
+from link_graph import LinkGraph, get_link_graph
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+ANALYTICS_CACHE_PATH = CACHE_DIR / "graph_analytics.json"
+PAGERANK_CACHE_PATH = CACHE_DIR / "graph_pagerank.json"
+# Share of nodes that may change label per label-propagation round (NumPy path);
+# updating everyone at once makes labels oscillate on bipartite structures
+LPA_UPDATE_FRACTION = 0.5
+
+
+def _edges(graph: LinkGraph) -> Tuple[List[str], Dict[str, int], List[Tuple[int, int]]]:
+    nodes = graph.nodes
+    index = {n: i for i, n in enumerate(nodes)}
+    edges = [
+        (index[src], index[dst])
+        for src, targets in graph.forward.items()
+        if src in index
+        for dst in targets
+        if dst in index
+    ]
+    return nodes, index, edges
+
+
+def _undirected(graph: LinkGraph) -> Dict[str, List[str]]:
+    adj: Dict[str, set] = defaultdict(set)
+    for src, targets in graph.forward.items():
+        for dst in targets:
+            if dst != src:
+                adj[src].add(dst)
+                adj[dst].add(src)
+    return {n: sorted(adj.get(n, ())) for n in graph.nodes}
+
+
+def _csr(graph: LinkGraph) -> Tuple[List[str], "np.ndarray", "np.ndarray"]:
+    """Undirected adjacency as CSR arrays (indptr, indices), self-loops dropped."""
+    nodes, _, edges = _edges(graph)
+    n = len(nodes)
+    pairs = np.array(edges, dtype=np.int64).reshape(-1, 2)
+    pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+    # Both directions, deduplicated and sorted by source
+    keys = np.unique(np.concatenate([pairs[:, 0] * n + pairs[:, 1], pairs[:, 1] * n + pairs[:, 0]]))
+    src, indices = keys // n, keys % n
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+    return nodes, indptr, indices
+
+
+def _expand(indptr: "np.ndarray", indices: "np.ndarray", frontier: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """All (node, neighbor) pairs for the nodes in `frontier`."""
+    starts = indptr[frontier]
+    counts = indptr[frontier + 1] - starts
+    total = int(counts.sum())
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(frontier, counts), indices[np.repeat(starts, counts) + offsets]
+
+
+def pagerank(
+    graph: LinkGraph,
+    damping: float = 0.85,
+    personalization: Optional[Dict[str, float]] = None,
+    tol: float = 1e-8,
+    max_iter: int = 100,
+) -> Dict[str, float]:
+    """PageRank over resolved wikilinks; dangling mass follows the teleport vector."""
+    nodes, index, edges = _edges(graph)
+    n = len(nodes)
+    if n == 0:
+        return {}
+
+    teleport = [0.0] * n
+    if personalization:
+        total = sum(v for k, v in personalization.items() if k in index and v > 0)
+        if total > 0:
+            for k, v in personalization.items():
+                if k in index and v > 0:
+                    teleport[index[k]] = v / total
+    if not any(teleport):
+        teleport = [1.0 / n] * n
+
+    out_deg = [0] * n
+    for s, _ in edges:
+        out_deg[s] += 1
+
+    if HAS_NUMPY:
+        src = np.fromiter((s for s, _ in edges), dtype=np.int64, count=len(edges))
+        dst = np.fromiter((d for _, d in edges), dtype=np.int64, count=len(edges))
+        deg = np.asarray(out_deg, dtype=np.float64)
+        inv = np.divide(1.0, deg, out=np.zeros(n), where=deg > 0)
+        dangling = deg == 0
+        v = np.asarray(teleport, dtype=np.float64)
+        x = v.copy()
+        for _ in range(max_iter):
+            flow = np.bincount(dst, weights=x[src] * inv[src], minlength=n)
+            x_new = damping * (flow + x[dangling].sum() * v) + (1 - damping) * v
+            if np.abs(x_new - x).sum() < tol:
+                x = x_new
+                break
+            x = x_new
+        return {nodes[i]: float(x[i]) for i in range(n)}
+
+    x = list(teleport)
+    for _ in range(max_iter):
+        flow = [0.0] * n
+        for s, d in edges:
+            flow[d] += x[s] / out_deg[s]
+        dangling_mass = sum(x[i] for i in range(n) if out_deg[i] == 0)
+        x_new = [
+            damping * (flow[i] + dangling_mass * teleport[i]) + (1 - damping) * teleport[i]
+            for i in range(n)
+        ]
+        delta = sum(abs(a - b) for a, b in zip(x_new, x))
+        x = x_new
+        if delta < tol:
+            break
+    return {nodes[i]: x[i] for i in range(n)}
+
+
+def approximate_betweenness(graph: LinkGraph, samples: int = 64, seed: int = 0) -> Dict[str, float]:
+    """Betweenness centrality estimated from `samples` BFS sources (undirected, unweighted)."""
+    if HAS_NUMPY:
+        return _betweenness_numpy(graph, samples, seed)
+    adj = _undirected(graph)
+    nodes = [n for n in graph.nodes if adj.get(n)]
+    if not nodes:
+        return {}
+    rng = random.Random(seed)
+    sources = nodes if len(nodes) <= samples else rng.sample(nodes, samples)
+    scores: Dict[str, float] = defaultdict(float)
+
+    for s in sources:
+        # Brandes' single-source shortest paths + dependency accumulation
+        order: List[str] = []
+        preds: Dict[str, List[str]] = defaultdict(list)
+        sigma: Dict[str, int] = defaultdict(int)
+        dist: Dict[str, int] = {s: 0}
+        sigma[s] = 1
+        queue = deque([s])
+        while queue:
+            v = queue.popleft()
+            order.append(v)
+            for w in adj[v]:
+                if w not in dist:
+                    dist[w] = dist[v] + 1
+                    queue.append(w)
+                if dist[w] == dist[v] + 1:
+                    sigma[w] += sigma[v]
+                    preds[w].append(v)
+        delta: Dict[str, float] = defaultdict(float)
+        for w in reversed(order):
+            for v in preds[w]:
+                delta[v] += sigma[v] / sigma[w] * (1 + delta[w])
+            if w != s:
+                scores[w] += delta[w]
+
+    scale = len(nodes) / len(sources) / 2  # extrapolate; undirected pairs counted twice
+    return {n: scores.get(n, 0.0) * scale for n in graph.nodes}
+
+
+def _betweenness_numpy(graph: LinkGraph, samples: int, seed: int) -> Dict[str, float]:
+    """Brandes over CSR arrays: each BFS level and its dependency pass is one vector step."""
+    nodes, indptr, indices = _csr(graph)
+    n = len(nodes)
+    connected = np.flatnonzero(np.diff(indptr))
+    if not len(connected):
+        return {}
+    rng = random.Random(seed)
+    candidates = connected.tolist()
+    sources = candidates if len(candidates) <= samples else rng.sample(candidates, samples)
+    scores = np.zeros(n)
+
+    for s in sources:
+        dist = np.full(n, -1, dtype=np.int64)
+        sigma = np.zeros(n)
+        dist[s], sigma[s] = 0, 1.0
+        frontier = np.array([s], dtype=np.int64)
+        levels: List[Tuple["np.ndarray", "np.ndarray"]] = []
+        depth = 0
+        while len(frontier):
+            v, w = _expand(indptr, indices, frontier)
+            unseen = w[dist[w] < 0]
+            dist[unseen] = depth + 1
+            # Shortest-path edges into the next level
+            tree = dist[w] == depth + 1
+            v, w = v[tree], w[tree]
+            sigma += np.bincount(w, weights=sigma[v], minlength=n)
+            levels.append((v, w))
+            frontier = np.flatnonzero(np.bincount(unseen, minlength=n))
+            depth += 1
+        delta = np.zeros(n)
+        for v, w in reversed(levels):
+            delta += np.bincount(v, weights=sigma[v] / sigma[w] * (1 + delta[w]), minlength=n)
+        delta[s] = 0.0
+        scores += delta
+
+    scale = len(connected) / len(sources) / 2  # extrapolate; undirected pairs counted twice
+    return {nodes[i]: float(scores[i] * scale) for i in range(n)}
+
+
+def label_propagation(graph: LinkGraph, max_iter: int = 20, seed: int = 0) -> Dict[str, int]:
+    """Community id per note via label propagation (undirected)."""
+    if HAS_NUMPY:
+        return _renumber(_label_propagation_numpy(graph, max_iter, seed))
+    adj = _undirected(graph)
+    labels = {n: i for i, n in enumerate(graph.nodes)}
+    rng = random.Random(seed)
+    active = [n for n in graph.nodes if adj[n]]
+    for _ in range(max_iter):
+        rng.shuffle(active)
+        changed = 0
+        for n in active:
+            counts = Counter(labels[m] for m in adj[n])
+            best = max(counts.values())
+            choices = sorted(l for l, c in counts.items() if c == best)
+            new = labels[n] if labels[n] in choices else choices[0]
+            if new != labels[n]:
+                labels[n] = new
+                changed += 1
+        if not changed:
+            break
+    return _renumber(labels)
+
+
+def _label_propagation_numpy(graph: LinkGraph, max_iter: int, seed: int) -> Dict[str, int]:
+    """Semi-synchronous label propagation over CSR arrays.
+
+    Each round a random LPA_UPDATE_FRACTION of the notes adopts its
+    neighbors' most common label at once.
+    """
+    nodes, indptr, indices = _csr(graph)
+    n = len(nodes)
+    labels = np.arange(n, dtype=np.int64)
+    src = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+    rng = np.random.default_rng(seed)
+    for _ in range(max_iter):
+        # Count neighbor labels per (node, label) pair; keys sort by node, then label
+        keys, counts = np.unique(src * n + labels[indices], return_counts=True)
+        owner, label = keys // n, keys % n
+        best = np.zeros(n, dtype=np.int64)
+        np.maximum.at(best, owner, counts)
+        # Smallest label among the most common, unless the current one ties
+        top = counts == best[owner]
+        first = np.unique(owner[top], return_index=True)[1]
+        new = labels.copy()
+        new[owner[top][first]] = label[top][first]
+        keeps = top & (label == labels[owner])
+        new[owner[keeps]] = labels[owner[keeps]]
+        changed = new != labels
+        if not changed.any():
+            break
+        update = changed & (rng.random(n) < LPA_UPDATE_FRACTION)
+        labels[update] = new[update]
+    return {nodes[i]: int(labels[i]) for i in range(n)}
+
+
+def _renumber(labels: Dict[str, int]) -> Dict[str, int]:
+    """Renumber communities by size (0 = largest)."""
+    sizes = Counter(labels.values())
+    order = {label: i for i, (label, _) in enumerate(sorted(sizes.items(), key=lambda x: (-x[1], x[0])))}
+    return {n: order[l] for n, l in labels.items()}
+
+
+def communities(labels: Dict[str, int], min_size: int = 2) -> List[List[str]]:
+    """Group notes by community label, largest first."""
+    groups: Dict[int, List[str]] = defaultdict(list)
+    for node, label in labels.items():
+        groups[label].append(node)
+    return [sorted(g) for _, g in sorted(groups.items()) if len(g) >= min_size]
+
+
+def top_n(scores: Dict[str, float], n: int = 20) -> List[Tuple[str, float]]:
+    return sorted(scores.items(), key=lambda x: (-x[1], x[0]))[:n]
+
+
+def _load_cached(path: Path, key: Dict) -> Optional[Dict]:
+    """Cached metrics stored under `key` (graph signature + parameters), if current."""
+    try:
+        cached = json.loads(path.read_text(encoding="utf-8"))
+        if all(cached.get(k) == v for k, v in key.items()):
+            return cached["metrics"]
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+
+def _store_cached(path: Path, key: Dict, metrics: Dict):
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({**key, "metrics": metrics}, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def cached_pagerank(graph: Optional[LinkGraph] = None) -> Dict[str, float]:
+    """PageRank alone, cached per graph signature."""
+    graph = graph or get_link_graph()
+    signature = getattr(graph, "signature", None)
+    key = {"signature": signature}
+    if signature:
+        cached = _load_cached(PAGERANK_CACHE_PATH, key)
+        if cached is not None:
+            return cached
+    scores = pagerank(graph)
+    if signature:
+        _store_cached(PAGERANK_CACHE_PATH, key, scores)
+    return scores
+
+
+def graph_metrics(graph: Optional[LinkGraph] = None, samples: int = 64) -> Dict[str, Dict]:
+    """PageRank, betweenness and communities, cached per graph signature."""
+    graph = graph or get_link_graph()
+    signature = getattr(graph, "signature", None)
+    key = {"signature": signature, "samples": samples}
+    if signature:
+        cached = _load_cached(ANALYTICS_CACHE_PATH, key)
+        if cached is not None:
+            return cached
+
+    metrics = {
+        "pagerank": cached_pagerank(graph),
+        "betweenness": approximate_betweenness(graph, samples=samples),
+        "communities": label_propagation(graph),
+    }
+    if signature:
+        _store_cached(ANALYTICS_CACHE_PATH, key, metrics)
+    return metrics
+
+
+def pagerank_weights() -> Dict[str, float]:
+    """Cached PageRank keyed by vault-relative path, for weighting retrieval.
+
+    Uses the PageRank-only cache, so a note edit costs one PageRank rather
+    than the full graph_metrics recompute.
+    """
+    return cached_pagerank()
+
+
+if __name__ == "__main__":
+    import time
+
+    t0 = time.perf_counter()
+    g = get_link_graph()
+    m = graph_metrics(g)
+    print(f"Analyzed {len(g.nodes)} notes in {(time.perf_counter() - t0) * 1000:.1f} ms")
+    for name, score in top_n(m["pagerank"], 10):
+        print(f"  {score:.4f}  {name}")
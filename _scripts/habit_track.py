@@ -6,6 +6,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 
 from config import summarize, save_note, VAULT_PATH
+from note_manifest import notes_between, read_body
 
 HABIT_PROMPT = """You are helping define a habit to track. Given a brief description, create a structured habit note. Output ONLY the following sections in markdown (no YAML, no top-level # title):
 
@@ -206,30 +207,19 @@ def collect_habits_content(active_only: bool = True) -> str:
 
 def collect_synthesis_notes(days: int = 7) -> list[dict]:
     """Collect Daily and Weekly Synthesis notes from Sources/."""
-    sources_dir = VAULT_PATH / "Sources"
-    if not sources_dir.exists():
-        return []
-
     cutoff = datetime.now() - timedelta(days=days)
     notes = []
 
-    for pattern in ["Daily Synthesis - *.md", "Weekly Synthesis - *.md"]:
-        for md_file in sources_dir.glob(pattern):
-            mtime = datetime.fromtimestamp(md_file.stat().st_mtime)
-            if mtime < cutoff:
-                continue
-
-            content = md_file.read_text(encoding="utf-8")
-            body = content
-            fm_match = re.match(r"^---\s*\n.*?\n---\s*\n", content, re.DOTALL)
-            if fm_match:
-                body = content[fm_match.end():]
-
-            notes.append({
-                "filename": md_file.stem,
-                "date": mtime.strftime("%Y-%m-%d"),
-                "content": body[:4000],
-            })
+    for rec in notes_between(cutoff, datetime.now(), by="mtime"):
+        if not rec["filename"].startswith(("Daily Synthesis - ", "Weekly Synthesis - ")):
+            continue
+        if rec["mtime"] < cutoff.timestamp():
+            continue
+        notes.append({
+            "filename": rec["filename"],
+            "date": datetime.fromtimestamp(rec["mtime"]).strftime("%Y-%m-%d"),
+            "content": read_body(rec)[:4000],
+        })
 
     notes.sort(key=lambda n: n["date"], reverse=True)
     return notes
@@ -7,6 +7,8 @@ to iteratively enhance the 10x Distill System.
 import argparse
 import json
 import re
+import sqlite3
+import threading
 import time
 import traceback
 from datetime import datetime, timedelta
@@ -17,7 +19,11 @@ from config import summarize, save_note, VAULT_PATH, TRACKER
 from self_evolution import EvolutionEngine
 
 # Insight management configuration
+INSIGHTS_DB_PATH = VAULT_PATH / "_logs" / "insights.db"
+# Pre-SQLite repository (one JSON list rewritten on every change); imported once
 INSIGHTS_REPO_PATH = VAULT_PATH / "_logs" / "insights_repo.json"
+# Insight categories, matched in the title ("Performance Optimization" -> performance)
+INSIGHT_CATEGORIES = ("performance", "efficiency", "accuracy", "scalability", "reliability")
 IMPROVEMENT_TEMPLATE = """
 ## {{insight_id}} - {{title}}
 
@@ -44,6 +50,12 @@ IMPROVEMENT_TEMPLATE = """
 """
 
 
+def infer_category(title: str) -> str:
+    """Insight category from its title, or "general"."""
+    lowered = title.lower()
+    return next((c for c in INSIGHT_CATEGORIES if c in lowered), "general")
+
+
 class Insight:
     """Represents a single actionable insight for system improvement."""
 
@@ -63,6 +75,7 @@ class Insight:
         self.verified_at: Optional[str] = None
         self.impact_metrics: Dict = {}
         self.source_iteration: Optional[int] = None
+        self.category = infer_category(title)
 
     def to_dict(self) -> Dict:
         """Convert Insight to dictionary for storage."""
@@ -79,7 +92,8 @@ class Insight:
             "implemented_at": self.implemented_at,
             "verified_at": self.verified_at,
             "impact_metrics": self.impact_metrics,
-            "source_iteration": self.source_iteration
+            "source_iteration": self.source_iteration,
+            "category": self.category
         }
 
     @classmethod
@@ -105,6 +119,8 @@ class Insight:
             insight.impact_metrics = data["impact_metrics"]
         if "source_iteration" in data:
             insight.source_iteration = data["source_iteration"]
+        if data.get("category"):
+            insight.category = data["category"]
         return insight
 
     def update_status(self, new_status: str):
@@ -124,57 +140,127 @@ class Insight:
 
 
 class InsightRepository:
-    """Manages the repository of system insights."""
-
-    def __init__(self):
-        self.insights: List[Insight] = []
-        self._load_repository()
-
-    def _load_repository(self):
-        """Load insights from repository file."""
+    """Manages the repository of system insights.
+
+    Insights live in a SQLite table keyed by id, with indexes on status,
+    impact and category, so lookups don't load the whole repository and
+    each add/update is a single transaction. The old insights_repo.json is
+    imported once on first use.
+    """
+
+    def __init__(self, db_path: Path = INSIGHTS_DB_PATH):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(str(db_path), timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        with self.conn:
+            self.conn.execute(
+                """CREATE TABLE IF NOT EXISTS insights (
+                    id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    impact TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    data TEXT NOT NULL
+                )"""
+            )
+            for column in ("status", "impact", "category"):
+                self.conn.execute(f"CREATE INDEX IF NOT EXISTS insights_{column} ON insights ({column})")
         if INSIGHTS_REPO_PATH.exists():
-            try:
-                with open(INSIGHTS_REPO_PATH, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.insights = [Insight.from_dict(item) for item in data]
-            except Exception as e:
-                print(f"Error loading insights repository: {e}")
-                self.insights = []
-        else:
-            self.insights = []
+            self._migrate_json_repository()
 
-    def _save_repository(self):
-        """Save insights to repository file."""
-        INSIGHTS_REPO_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with open(INSIGHTS_REPO_PATH, "w", encoding="utf-8") as f:
-            json.dump([insight.to_dict() for insight in self.insights], f,
-                     indent=2, default=str)
+    def _migrate_json_repository(self):
+        """Import insights_repo.json into the database, then set it aside."""
+        try:
+            with open(INSIGHTS_REPO_PATH, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            insights = [Insight.from_dict(item) for item in data]
+        except Exception as e:
+            print(f"Error loading insights repository: {e}")
+            return
+        with self.lock, self.conn:
+            # The JSON list could hold repeated ids; the first one won lookups
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO insights (id, status, impact, category, data) VALUES (?, ?, ?, ?, ?)",
+                [self._row(insight) for insight in insights],
+            )
+        try:
+            INSIGHTS_REPO_PATH.rename(INSIGHTS_REPO_PATH.with_suffix(".json.migrated"))
+        except FileNotFoundError:
+            return  # Another process migrated it at the same time
+        print(f"Migrated {len(insights)} insights to {INSIGHTS_DB_PATH.name}")
+
+    @staticmethod
+    def _row(insight: Insight) -> tuple:
+        return (insight.id, insight.status, insight.impact, insight.category,
+                json.dumps(insight.to_dict(), default=str))
+
+    def _query(self, where: str = "", params: tuple = ()) -> List[Insight]:
+        with self.lock:
+            rows = self.conn.execute(f"SELECT data FROM insights {where} ORDER BY rowid", params).fetchall()
+        return [Insight.from_dict(json.loads(row[0])) for row in rows]
+
+    @property
+    def insights(self) -> List[Insight]:
+        """All insights, oldest first (read on access)."""
+        return self._query()
 
     def add_insight(self, insight: Insight) -> Insight:
-        """Add new insight to repository."""
-        self.insights.append(insight)
-        self._save_repository()
+        """Add new insight to repository.
+
+        An id that is already taken gets a numeric suffix, so a new insight
+        never overwrites an older one.
+        """
+        with self.lock, self.conn:
+            base, n = insight.id, 1
+            while self.conn.execute("SELECT 1 FROM insights WHERE id = ?", (insight.id,)).fetchone():
+                n += 1
+                insight.id = f"{base}-{n}"
+            self.conn.execute(
+                "INSERT INTO insights (id, status, impact, category, data) VALUES (?, ?, ?, ?, ?)",
+                self._row(insight),
+            )
         return insight
 
+    def get_insights(self, status: Optional[str] = None, impact: Optional[str] = None,
+                     category: Optional[str] = None) -> List[Insight]:
+        """Get insights matching every given filter."""
+        filters = [(c, v) for c, v in (("status", status), ("impact", impact), ("category", category)) if v]
+        where = "WHERE " + " AND ".join(f"{c} = ?" for c, _ in filters) if filters else ""
+        return self._query(where, tuple(v for _, v in filters))
+
     def get_insights_by_status(self, status: str) -> List[Insight]:
         """Get insights with specific status."""
-        return [i for i in self.insights if i.status == status]
+        return self.get_insights(status=status)
 
     def get_insights_by_impact(self, impact: str) -> List[Insight]:
         """Get insights by impact level."""
-        return [i for i in self.insights if i.impact == impact]
+        return self.get_insights(impact=impact)
+
+    def get_insights_by_category(self, category: str) -> List[Insight]:
+        """Get insights by category (performance, efficiency, ...)."""
+        return self.get_insights(category=category)
 
     def get_insight_by_id(self, insight_id: str) -> Optional[Insight]:
         """Get insight by ID."""
-        return next((i for i in self.insights if i.id == insight_id), None)
+        with self.lock:
+            row = self.conn.execute("SELECT data FROM insights WHERE id = ?", (insight_id,)).fetchone()
+        return Insight.from_dict(json.loads(row[0])) if row else None
 
     def update_insight(self, insight: Insight):
         """Update existing insight."""
-        existing = self.get_insight_by_id(insight.id)
-        if existing:
-            index = self.insights.index(existing)
-            self.insights[index] = insight
-            self._save_repository()
+        row = self._row(insight)
+        with self.lock, self.conn:
+            self.conn.execute(
+                "UPDATE insights SET status = ?, impact = ?, category = ?, data = ? WHERE id = ?",
+                row[1:] + row[:1],
+            )
+
+    def count_by(self, column: str) -> Dict[str, int]:
+        """Insight counts per status, impact or category (from the index)."""
+        if column not in ("status", "impact", "category"):
+            raise ValueError(f"Cannot count by {column!r}")
+        with self.lock:
+            return dict(self.conn.execute(f"SELECT {column}, COUNT(*) FROM insights GROUP BY {column}"))
 
 
 class InsightExtractor:
@@ -586,6 +672,9 @@ def main():
     repo_parser.add_argument(
         "--impact", type=str, help="Filter by impact (low/medium/high)"
     )
+    repo_parser.add_argument(
+        "--category", type=str, help=f"Filter by category ({'/'.join(INSIGHT_CATEGORIES)})"
+    )
 
     # Insight extraction
     extract_parser = subparsers.add_parser("extract", help="Extract insights from evolution")
@@ -615,11 +704,7 @@ def main():
     elif args.mode == "repo":
         repo = InsightRepository()
         if args.list:
-            insights = repo.insights
-            if args.status:
-                insights = [i for i in insights if i.status == args.status]
-            if args.impact:
-                insights = [i for i in insights if i.impact == args.impact]
+            insights = repo.get_insights(args.status, args.impact, args.category)
 
             print(f"Found {len(insights)} insights:")
             for insight in insights:
@@ -627,6 +712,7 @@ def main():
                 print(f"Title: {insight.title}")
                 print(f"Status: {insight.status}")
                 print(f"Impact: {insight.impact}")
+                print(f"Category: {insight.category}")
                 print(f"Description: {insight.description}")
 
     elif args.mode == "extract":
@@ -135,7 +135,7 @@ Apply inverse thinking to the input above, taking the context into account."""
         user_input += "\nApply inverse thinking to the input above."
 
     print(f"Computing inverse for {args.type}...")
-    result = summarize(user_input, INVERSE_PROMPT)
+    result = summarize(user_input, INVERSE_PROMPT, cache=False)
 
     if args.save:
         today = datetime.now().strftime("%Y-%m-%d")
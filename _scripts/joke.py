@@ -57,7 +57,7 @@ Examples:
     user_input = f"Topic: {topic}"
 
     print(f"Generating a dad joke about: {topic}...")
-    joke = summarize(user_input, PROMPT)
+    joke = summarize(user_input, PROMPT, cache=False)
 
     print()
     print("—" * 30)
@@ -20,6 +20,8 @@ from collections import defaultdict, Counter
 sys.path.insert(0, str(Path(__file__).parent))
 from config import save_note, VAULT_PATH
 from obsidian_cli import get_cli
+from link_graph import get_link_graph
+from graph_analytics import graph_metrics, communities, top_n
 
 
 class KnowledgeGraph:
@@ -107,28 +109,16 @@ class KnowledgeGraph:
         """Get detailed hub and connectivity analysis."""
         print("Analyzing knowledge hubs...")
 
-        all_files = self.cli.list_files(ext="md", total=True)
-        orphans = self.cli.get_orphans(all=True)
-        deadends = self.cli.get_deadends(all=True)
-
-        # Find most connected files (hubs)
-        hub_files = []
-        for file in all_files[:150]:  # Analyze first 150 files
-            try:
-                backlinks = self.cli.get_backlinks(path=file)
-                outgoing = self.cli.get_outgoing_links(path=file)
-                if len(backlinks) > 0 or len(outgoing) > 3:
-                    hub_files.append({
-                        "file": file,
-                        "backlink_count": len(backlinks),
-                        "outgoing_count": len(outgoing),
-                        "total_connections": len(backlinks) + len(outgoing)
-                    })
-            except:
-                continue
+        graph = get_link_graph()
+        all_files = graph.nodes
+        orphans = graph.orphans()
+        deadends = graph.deadends()
 
-        # Sort by total connections
-        hub_files.sort(key=lambda x: -x["total_connections"])
+        # Most connected files (hubs), across every note
+        hub_files = [
+            h for h in graph.hubs(limit=len(all_files))
+            if h["backlink_count"] > 0 or h["outgoing_count"] > 3
+        ]
 
         return {
             "top_hubs": hub_files[:25],
@@ -138,6 +128,29 @@ class KnowledgeGraph:
             "connected_count": len(all_files) - len(orphans)
         }
 
+    def get_graph_analytics(self) -> Dict[str, Any]:
+        """Get PageRank, bridge-note and community analysis of the link graph."""
+        print("Computing graph centrality and communities...")
+
+        graph = get_link_graph()
+        metrics = graph_metrics(graph)
+        groups = communities(metrics["communities"], min_size=3)
+        pagerank = metrics["pagerank"]
+
+        return {
+            "top_pagerank": top_n(pagerank, 15),
+            "top_bridges": [b for b in top_n(metrics["betweenness"], 15) if b[1] > 0],
+            "communities": [
+                {
+                    "size": len(g),
+                    # Most central notes name the community
+                    "core": sorted(g, key=lambda n: -pagerank.get(n, 0.0))[:5],
+                }
+                for g in groups[:10]
+            ],
+            "community_count": len(groups),
+        }
+
     def get_tag_themes(self) -> Dict[str, Any]:
         """Get tag-based thematic analysis."""
         print("Analyzing thematic tags...")
@@ -177,6 +190,7 @@ class KnowledgeGraph:
         directory = self.get_directory_structure()
         categories = self.get_file_categories()
         hubs = self.get_hub_analysis()
+        analytics = self.get_graph_analytics()
         themes = self.get_tag_themes()
 
         return {
@@ -184,6 +198,7 @@ class KnowledgeGraph:
             "directory_structure": directory,
             "file_categories": categories,
             "hub_analysis": hubs,
+            "graph_analytics": analytics,
             "thematic_analysis": themes
         }
 
@@ -194,6 +209,7 @@ def format_graph_report(report: Dict[str, Any]) -> str:
     dir_struct = report["directory_structure"]
     categories = report["file_categories"]
     hubs = report["hub_analysis"]
+    analytics = report["graph_analytics"]
     themes = report["thematic_analysis"]
 
     md = f"""# Knowledge Graph - Vault Overview
@@ -254,6 +270,50 @@ Top 25 hub files by total connections:
     for i, hub in enumerate(hubs["top_hubs"][:25], 1):
         md += f"| {i} | {hub['file']} | {hub['backlink_count']} | {hub['outgoing_count']} | {hub['total_connections']} |\n"
 
+    md += """
+---
+
+## 🧭 Most Central Notes (PageRank)
+
+Notes that the rest of the graph points to, directly or through other central notes:
+
+| Rank | File | PageRank |
+|------|------|----------|
+"""
+
+    for i, (file, score) in enumerate(analytics["top_pagerank"], 1):
+        md += f"| {i} | {file} | {score:.4f} |\n"
+
+    md += """
+---
+
+## 🌉 Bridge Notes (Approx. Betweenness)
+
+Notes that sit on many shortest paths between otherwise separate areas:
+
+"""
+
+    if analytics["top_bridges"]:
+        for i, (file, score) in enumerate(analytics["top_bridges"], 1):
+            md += f"{i}. {file} ({score:.1f})\n"
+    else:
+        md += "No bridge notes found.\n"
+
+    md += f"""
+---
+
+## 🧩 Link Communities
+
+**{analytics['community_count']} communities** of 3+ interlinked notes (label propagation):
+
+"""
+
+    for i, community in enumerate(analytics["communities"], 1):
+        md += f"### Community {i} ({community['size']} notes)\n"
+        for file in community["core"]:
+            md += f"- {file}\n"
+        md += "\n"
+
     md += f"""
 ---
 
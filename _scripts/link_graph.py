@@ -0,0 +1,403 @@
+"""Link Graph - In-process wikilink graph of the whole vault.
+
+Builds forward and reverse adjacency (with alias resolution) in one pass over
+the parsed notes from the note store, instead of asking the Obsidian CLI for
+backlinks one file at a time. The resolved graph is cached under _logs/cache
+and reused while no note has changed, so hub, orphan, dead-end and
+unresolved-link analysis covers every note, not just a sample.
+
+vault_watcher patches the graph per edited note (update_link_graph): only
+the edited notes and the notes whose links could resolve differently are
+re-resolved.
+"""
+
+import bisect
+import hashlib
+import json
+import os
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Add parent for config
+sys.path.insert(0, str(Path(__file__).parent))
+from config import VAULT_PATH, CACHE_DIR
+from note_store import get_store
+from vault_walker import get_walker
+
+GRAPH_CACHE_PATH = CACHE_DIR / "link_graph.json"
+GRAPH_CACHE_VERSION = 3
+
+# Embeds/links to these are attachments, not notes
+ATTACHMENT_EXTENSIONS = {
+    ".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".bmp", ".pdf",
+    ".mp3", ".wav", ".m4a", ".mp4", ".mov", ".webm", ".canvas", ".base",
+}
+
+
+def link_target(link: str) -> str:
+    """Strip alias (|) and heading/block (#) parts from raw wikilink text."""
+    return link.split("|", 1)[0].split("#", 1)[0].strip()
+
+
+class LinkGraph:
+    """Resolved wikilink graph keyed by vault-relative note paths."""
+
+    def __init__(
+        self,
+        nodes: List[str],
+        forward: Dict[str, List[str]],
+        unresolved: Dict[str, List[str]],
+        aliases: Dict[str, str],
+        word_counts: Optional[Dict[str, int]] = None,
+    ):
+        self.nodes = nodes
+        self.forward = forward
+        self.unresolved = unresolved
+        self.aliases = aliases
+        # Per-note statistics, so callers can filter notes without parsing them
+        self.word_counts = word_counts or {}
+        # Fingerprint of the note set this graph was built from (see get_link_graph)
+        self.signature: Optional[str] = None
+        self.backward: Dict[str, List[str]] = defaultdict(list)
+        for src, targets in forward.items():
+            for dst in targets:
+                self.backward[dst].append(src)
+        self._by_name: Dict[str, List[str]] = defaultdict(list)
+        self._by_path: Dict[str, str] = {}
+        for node in nodes:
+            self._by_name[Path(node).stem.lower()].append(node)
+            self._by_path[node[:-3].lower() if node.endswith(".md") else node.lower()] = node
+        for candidates in self._by_name.values():
+            # Obsidian prefers the shortest path when names collide
+            candidates.sort(key=lambda p: (p.count("/"), len(p), p))
+
+    # Resolution
+    def resolve(self, link: str) -> Optional[str]:
+        """Resolve wikilink text (e.g. "Note|alias", "Folder/Note#H") to a note path."""
+        target = link_target(link)
+        if not target:
+            return None
+        if target.lower().endswith(".md"):
+            target = target[:-3]
+        key = target.lower()
+        if "/" in key:
+            if key in self._by_path:
+                return self._by_path[key]
+            key = key.rsplit("/", 1)[1]
+        candidates = self._by_name.get(key)
+        if candidates:
+            return candidates[0]
+        return self.aliases.get(key)
+
+    def _link_key(self, target: str) -> str:
+        """Note-name key a link target falls back to (lowercase, no folder or .md)."""
+        key = target.lower()
+        if key.endswith(".md"):
+            key = key[:-3]
+        return key.rsplit("/", 1)[-1]
+
+    def _resolve_links(self, rel: str, wikilinks: List[str]) -> Tuple[List[str], Set[str]]:
+        """(resolved targets in link order, unresolved targets) for one note."""
+        targets: List[str] = []
+        unresolved: Set[str] = set()
+        seen: Set[str] = set()
+        for link in wikilinks:
+            target = link_target(link)
+            if not target or _is_attachment(target):
+                continue
+            resolved = self.resolve(link)
+            if resolved is None:
+                unresolved.add(target)
+            elif resolved != rel and resolved not in seen:
+                seen.add(resolved)
+                targets.append(resolved)
+        return targets, unresolved
+
+    def apply_changes(self, metas: Dict[str, Dict], removed: Iterable[str]) -> bool:
+        """Patch the graph for edited/new notes (`metas`: their parsed metadata)
+        and deleted notes, re-resolving only the links that could change.
+
+        Returns False, leaving the graph untouched, when aliases changed; the
+        caller then rebuilds (alias precedence depends on the whole vault).
+        """
+        nodeset = set(self.nodes)
+        removed = {rel for rel in removed if rel in nodeset and rel not in metas}
+        added = {rel for rel in metas if rel not in nodeset}
+        owners: Dict[str, Set[str]] = defaultdict(set)
+        for alias, rel in self.aliases.items():
+            owners[rel].add(alias)
+        if any(owners.get(rel) for rel in removed):
+            return False
+        for rel, meta in metas.items():
+            if set(_aliases(meta)) != owners.get(rel, set()):
+                return False
+
+        # Links by these names may now resolve to a different note
+        keys = {Path(rel).stem.lower() for rel in removed | added}
+        affected = set(metas)
+        for key in keys:
+            for node in self._by_name.get(key, ()):
+                # The namesakes too: their self-links are dropped, not recorded
+                affected.add(node)
+                affected.update(self.backward.get(node, ()))
+            if key in self.aliases:
+                # A note named like an alias takes over links resolved via the alias
+                affected.update(self.backward.get(self.aliases[key], ()))
+        for target, sources in self.unresolved.items():
+            if self._link_key(target) in keys:
+                affected.update(sources)
+        affected -= removed
+
+        for rel in removed:
+            self.nodes.pop(bisect.bisect_left(self.nodes, rel))
+            self._by_name[Path(rel).stem.lower()].remove(rel)
+            self._by_path.pop(rel[:-3].lower() if rel.endswith(".md") else rel.lower(), None)
+            self.word_counts.pop(rel, None)
+            self._set_links(rel, [])
+            self.backward.pop(rel, None)
+        for rel in added:
+            bisect.insort(self.nodes, rel)
+            candidates = self._by_name[Path(rel).stem.lower()]
+            candidates.append(rel)
+            candidates.sort(key=lambda p: (p.count("/"), len(p), p))
+            self._by_path[rel[:-3].lower() if rel.endswith(".md") else rel.lower()] = rel
+
+        # Re-resolve affected notes (unchanged ones from the note store)
+        store = get_store()
+        unresolved: Dict[str, Set[str]] = {}
+        for target, sources in list(self.unresolved.items()):
+            kept = [src for src in sources if src not in affected and src not in removed]
+            if len(kept) != len(sources):
+                if kept:
+                    self.unresolved[target] = kept
+                else:
+                    del self.unresolved[target]
+        for rel in sorted(affected):
+            meta = metas.get(rel) or store.get_meta(VAULT_PATH / rel)
+            if meta is None:
+                continue
+            targets, missing = self._resolve_links(rel, meta["wikilinks"])
+            self._set_links(rel, targets)
+            for target in missing:
+                unresolved.setdefault(target, set()).add(rel)
+            if rel in metas:
+                self.word_counts[rel] = meta["word_count"]
+        store.flush()
+        for target, sources in unresolved.items():
+            self.unresolved[target] = sorted(set(self.unresolved.get(target, [])) | sources)
+        return True
+
+    def _set_links(self, rel: str, targets: List[str]):
+        """Replace a note's outgoing links, keeping backlinks in step."""
+        for dst in self.forward.get(rel, []):
+            back = self.backward.get(dst)
+            if back and rel in back:
+                back.remove(rel)
+        if targets:
+            self.forward[rel] = targets
+            for dst in targets:
+                self.backward[dst].append(rel)
+        else:
+            self.forward.pop(rel, None)
+
+    # Queries
+    def outgoing(self, path: str) -> List[str]:
+        return self.forward.get(path, [])
+
+    def backlinks(self, path: str) -> List[str]:
+        return self.backward.get(path, [])
+
+    def orphans(self) -> List[str]:
+        """Notes with no incoming links."""
+        return [n for n in self.nodes if not self.backward.get(n)]
+
+    def deadends(self) -> List[str]:
+        """Notes with no outgoing (resolved) links."""
+        return [n for n in self.nodes if not self.forward.get(n)]
+
+    def unresolved_links(self) -> List[str]:
+        """Unresolved link targets with the notes that reference them."""
+        return [
+            f"{target} ← {', '.join(sorted(sources)[:3])}" + (" ..." if len(sources) > 3 else "")
+            for target, sources in sorted(self.unresolved.items(), key=lambda x: (-len(x[1]), x[0]))
+        ]
+
+    def hubs(self, limit: int = 25) -> List[Dict]:
+        """Notes ranked by total connections (backlinks + outgoing)."""
+        ranked = []
+        for node in self.nodes:
+            back = len(self.backward.get(node, []))
+            out = len(self.forward.get(node, []))
+            if back or out:
+                ranked.append({
+                    "file": node,
+                    "backlink_count": back,
+                    "outgoing_count": out,
+                    "total_connections": back + out,
+                })
+        ranked.sort(key=lambda x: (-x["total_connections"], x["file"]))
+        return ranked[:limit]
+
+    def to_dict(self) -> Dict:
+        return {
+            "nodes": self.nodes,
+            "forward": self.forward,
+            "unresolved": self.unresolved,
+            "aliases": self.aliases,
+            "word_counts": self.word_counts,
+        }
+
+
+def _is_attachment(target: str) -> bool:
+    """Links to images, PDFs etc. are not note links."""
+    return Path(target).suffix.lower() in ATTACHMENT_EXTENSIONS
+
+
+def _aliases(meta: Dict) -> List[str]:
+    """Lowercased frontmatter aliases of a note."""
+    raw = meta["frontmatter"].get("aliases") or meta["frontmatter"].get("alias") or []
+    if isinstance(raw, str):
+        raw = [raw]
+    return [str(alias).strip().lower() for alias in raw]
+
+
+def build_link_graph(paths: List[Path]) -> LinkGraph:
+    """Build the graph from parsed note metadata (one pass, no file re-reads on cache hits)."""
+    store = get_store()
+    metas = {}
+    for path in paths:
+        meta = store.get_meta(path)
+        if meta is not None:
+            metas[meta["relative_path"]] = meta
+    store.flush()
+
+    nodes = sorted(metas)
+    aliases: Dict[str, str] = {}
+    for rel, meta in metas.items():
+        for alias in _aliases(meta):
+            aliases.setdefault(alias, rel)
+
+    graph = LinkGraph(nodes, {}, {}, aliases)
+    forward: Dict[str, List[str]] = {}
+    unresolved: Dict[str, Set[str]] = defaultdict(set)
+    for rel in nodes:
+        targets, missing = graph._resolve_links(rel, metas[rel]["wikilinks"])
+        for target in missing:
+            unresolved[target].add(rel)
+        if targets:
+            forward[rel] = targets
+
+    word_counts = {rel: metas[rel]["word_count"] for rel in nodes}
+    return LinkGraph(nodes, forward, {k: sorted(v) for k, v in unresolved.items()}, aliases, word_counts)
+
+
+def _entry_hash(rel: str, mtime_ns: int, size: int) -> int:
+    return int(hashlib.sha1(f"{rel}\0{mtime_ns}\0{size}".encode("utf-8")).hexdigest()[:32], 16)
+
+
+def _signature(entries) -> str:
+    """Fingerprint of the note set (paths, mtimes, sizes).
+
+    A sum of per-note hashes, so update_link_graph can adjust it per edit.
+    """
+    total = sum(_entry_hash(rel, e.mtime_ns, e.size) for rel, e in entries.items())
+    return format(total % 2 ** 128, "032x")
+
+
+_GRAPH: Optional[LinkGraph] = None
+
+
+def get_link_graph() -> LinkGraph:
+    """Get the vault link graph, rebuilding only if any note changed."""
+    global _GRAPH
+    if _GRAPH is not None:
+        return _GRAPH
+
+    entries = get_walker().scan(fresh=True)
+    signature = _signature(entries)
+    try:
+        cached = json.loads(GRAPH_CACHE_PATH.read_text(encoding="utf-8"))
+        if cached.get("version") == GRAPH_CACHE_VERSION and cached.get("signature") == signature:
+            g = cached["graph"]
+            _GRAPH = LinkGraph(g["nodes"], g["forward"], g["unresolved"], g["aliases"], g["word_counts"])
+            _GRAPH.signature = signature
+            return _GRAPH
+    except (OSError, ValueError, KeyError):
+        pass
+
+    _GRAPH = build_link_graph([VAULT_PATH / rel for rel in entries])
+    _GRAPH.signature = signature
+    save_link_graph(_GRAPH)
+    return _GRAPH
+
+
+def save_link_graph(graph: LinkGraph):
+    """Write the graph cache (keyed by its signature) for other processes."""
+    try:
+        GRAPH_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = GRAPH_CACHE_PATH.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(
+            json.dumps(
+                {"version": GRAPH_CACHE_VERSION, "signature": graph.signature, "graph": graph.to_dict()},
+                ensure_ascii=False,
+            ),
+            encoding="utf-8",
+        )
+        os.replace(tmp, GRAPH_CACHE_PATH)
+    except OSError as e:
+        print(f"Warning: failed to cache link graph: {e}")
+
+
+def update_link_graph(
+    changes: Dict[str, Optional[Tuple[int, int]]],
+    previous: Dict[str, Tuple[int, int]],
+    save: bool = True,
+) -> LinkGraph:
+    """Patch the in-process graph for per-note changes (vault_watcher).
+
+    `changes` maps vault-relative paths to their new (mtime_ns, size), or None
+    if deleted; `previous` holds the stamps the graph was built from. Falls
+    back to a full rebuild when aliases changed. With save=False the disk
+    cache is left for the caller to write (save_link_graph).
+    """
+    graph = get_link_graph()
+    store = get_store()
+    metas = {}
+    for rel, stamp in changes.items():
+        if stamp is not None:
+            meta = store.get_meta(VAULT_PATH / rel)
+            if meta is not None:
+                metas[rel] = meta
+    removed = [rel for rel, stamp in changes.items() if stamp is None]
+    if not graph.apply_changes(metas, removed):
+        return refresh_link_graph()
+
+    total = int(graph.signature, 16) if graph.signature else 0
+    for rel, stamp in changes.items():
+        if rel in previous:
+            total -= _entry_hash(rel, *previous[rel])
+        if stamp is not None:
+            total += _entry_hash(rel, *stamp)
+    graph.signature = format(total % 2 ** 128, "032x")
+    if save:
+        save_link_graph(graph)
+    return graph
+
+
+def refresh_link_graph() -> LinkGraph:
+    """Drop the in-process graph and reload it (rebuilding if notes changed)."""
+    global _GRAPH
+    _GRAPH = None
+    return get_link_graph()
+
+
+if __name__ == "__main__":
+    import time
+
+    t0 = time.perf_counter()
+    g = get_link_graph()
+    elapsed = (time.perf_counter() - t0) * 1000
+    edges = sum(len(v) for v in g.forward.values())
+    print(f"{len(g.nodes)} notes, {edges} links, {len(g.unresolved)} unresolved targets in {elapsed:.1f} ms")
@@ -0,0 +1,221 @@
+"""LLM Cache - Content-addressed on-disk cache for AI responses.
+
+`config.summarize` looks responses up here before calling the API. Entries
+are keyed by a hash of (model, system prompt, user text, parameters), so a
+re-run over unchanged inputs is answered instantly and for free.
+
+- Entries expire after a TTL (LLM_CACHE_TTL_DAYS, default 30)
+- Total size is bounded (LLM_CACHE_MAX_MB, default 100); least recently used
+  entries are evicted first
+- Opt out per call with `summarize(..., cache=False)` or globally with
+  LLM_CACHE=off
+- Hits, misses and evictions are counted in the cache database
+
+Usage:
+  python3 _scripts/llm_cache.py stats
+  python3 _scripts/llm_cache.py clear
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+# Add parent for config
+sys.path.insert(0, str(Path(__file__).parent))
+from config import CACHE_DIR
+
+LLM_CACHE_PATH = CACHE_DIR / "llm_cache.db"
+CACHE_VERSION = 1
+DEFAULT_TTL_DAYS = float(os.getenv("LLM_CACHE_TTL_DAYS", "30"))
+DEFAULT_MAX_MB = float(os.getenv("LLM_CACHE_MAX_MB", "100"))
+
+
+def cache_enabled() -> bool:
+    """False when LLM_CACHE is set to off/0/false/no."""
+    return os.getenv("LLM_CACHE", "on").strip().lower() not in ("off", "0", "false", "no")
+
+
+def cache_key(model: str, prompt: str, text: str, **params) -> str:
+    """Stable hash of everything that determines a response."""
+    payload = json.dumps([model, prompt, text, params], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed response cache with TTL and size-bounded LRU eviction."""
+
+    def __init__(
+        self,
+        db_path: Path = LLM_CACHE_PATH,
+        ttl_days: float = DEFAULT_TTL_DAYS,
+        max_bytes: int = int(DEFAULT_MAX_MB * 1024 * 1024),
+    ):
+        self.ttl = ttl_days * 86400
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self.conn: Optional[sqlite3.Connection] = None
+        # One connection shared by worker threads; the lock serializes use
+        self.lock = threading.RLock()
+        try:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(db_path), timeout=10, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != CACHE_VERSION:
+                self.conn.execute("DROP TABLE IF EXISTS responses")
+                self.conn.execute(f"PRAGMA user_version = {CACHE_VERSION}")
+            self.conn.execute(
+                """CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    created REAL NOT NULL,
+                    accessed REAL NOT NULL,
+                    size INTEGER NOT NULL,
+                    response TEXT NOT NULL
+                )"""
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            self.conn.commit()
+        except sqlite3.Error as e:
+            print(f"Warning: LLM cache unavailable: {e}")
+            self.conn = None
+
+    def _count(self, name: str, n: int = 1):
+        self.stats[name] += n
+        try:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT INTO counters (name, value) VALUES (?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                    (name, n),
+                )
+        except sqlite3.Error:
+            pass
+
+    def get(self, key: str) -> Optional[str]:
+        if self.conn is None:
+            return None
+        with self.lock:
+            return self._get(key)
+
+    def _get(self, key: str) -> Optional[str]:
+        try:
+            row = self.conn.execute("SELECT created, response FROM responses WHERE key = ?", (key,)).fetchone()
+            now = time.time()
+            if row and now - row[0] <= self.ttl:
+                with self.conn:
+                    self.conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+                self._count("hits")
+                return row[1]
+            if row:
+                with self.conn:
+                    self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+        except sqlite3.Error:
+            return None
+        self._count("misses")
+        return None
+
+    def put(self, key: str, model: str, response: str):
+        if self.conn is None:
+            return
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        try:
+            with self.lock, self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, model, created, accessed, size, response) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, model, now, now, size, response),
+                )
+            with self.lock:
+                self._evict()
+        except sqlite3.Error as e:
+            print(f"Warning: failed to cache AI response: {e}")
+
+    def _evict(self):
+        """Drop expired entries, then least recently used ones while over budget."""
+        with self.conn:
+            self.conn.execute("DELETE FROM responses WHERE created < ?", (time.time() - self.ttl,))
+            total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            # Trim to 90% so eviction doesn't run on every insert
+            target = total - int(self.max_bytes * 0.9)
+            freed = 0
+            victims = []
+            for key, size in self.conn.execute("SELECT key, size FROM responses ORDER BY accessed"):
+                victims.append((key,))
+                freed += size
+                if freed >= target:
+                    break
+            self.conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self._count("evictions", len(victims))
+
+    def summary(self) -> Dict:
+        """Entry count, size and lifetime counters."""
+        if self.conn is None:
+            return {}
+        with self.lock:
+            entries, size = self.conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            counters = dict(self.conn.execute("SELECT name, value FROM counters"))
+        lookups = counters.get("hits", 0) + counters.get("misses", 0)
+        return {
+            "entries": entries,
+            "bytes": size,
+            "hits": counters.get("hits", 0),
+            "misses": counters.get("misses", 0),
+            "evictions": counters.get("evictions", 0),
+            "hit_rate": round(counters.get("hits", 0) / lookups, 3) if lookups else 0.0,
+        }
+
+    def clear(self):
+        if self.conn is None:
+            return
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM responses")
+            self.conn.execute("DELETE FROM counters")
+
+
+_CACHE: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the shared response cache."""
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = ResponseCache()
+    return _CACHE
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="LLM Cache - inspect or clear cached AI responses",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python3 _scripts/llm_cache.py stats   # Entries, size, hit rate
+  python3 _scripts/llm_cache.py clear   # Drop all cached responses
+""",
+    )
+    parser.add_argument("command", choices=["stats", "clear"])
+    args = parser.parse_args()
+
+    cache = get_response_cache()
+    if args.command == "clear":
+        cache.clear()
+        print(f"Cleared {LLM_CACHE_PATH}")
+        return
+    for name, value in cache.summary().items():
+        print(f"{name:>10}: {value}")
+
+
+if __name__ == "__main__":
+    main()
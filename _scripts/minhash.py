@@ -0,0 +1,174 @@
+"""MinHash - Near-duplicate candidate generation for vault notes.
+
+Replaces all-pairs text comparison with:
+- Shingling: overlapping 3-token windows (words, or single CJK characters)
+- One-permutation MinHash: one hash per shingle, minimum kept per bin,
+  empty bins densified from their neighbour (no per-permutation loop)
+- LSH banding: notes sharing any band of their signature become candidates
+
+Signatures are persisted under _logs/cache keyed by the note's content hash,
+so repeat scans only sign notes whose text changed. Callers verify the
+(few) candidate pairs with an exact measure.
+"""
+
+import sqlite3
+import sys
+import zlib
+import re
+from array import array
+from collections import defaultdict
+from itertools import combinations
+from pathlib import Path
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+# Add parent for config
+sys.path.insert(0, str(Path(__file__).parent))
+from config import CACHE_DIR
+
+SIGNATURE_PATH = CACHE_DIR / "minhash.db"
+
+# Signature layout: NUM_BINS = BANDS * ROWS. 32 bands of 4 rows puts the LSH
+# threshold near Jaccard 0.42, well under the similarity we verify for.
+NUM_BINS = 128
+BANDS = 32
+ROWS = 4
+SHINGLE_SIZE = 3
+
+# Bump when shingling/hashing changes; cached signatures are discarded
+SIGNATURE_VERSION = 1
+
+# Band buckets larger than this are shared boilerplate (templates, headers);
+# they are skipped rather than expanded into O(m^2) pairs
+MAX_BUCKET = 200
+
+_BIN_BITS = NUM_BINS.bit_length() - 1
+_MASK64 = (1 << 64) - 1
+_VALUE_SPAN = 1 << (64 - _BIN_BITS)
+_CJK = "\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff"
+_TOKEN_RE = re.compile(rf"[{_CJK}]|[^\W{_CJK}]+")
+
+
+def _mix(h: int) -> int:
+    """64-bit finalizer so bin index and value come from well-mixed bits."""
+    h = ((h ^ (h >> 33)) * 0xFF51AFD7ED558CCD) & _MASK64
+    h = ((h ^ (h >> 33)) * 0xC4CEB9FE1A85EC53) & _MASK64
+    return h ^ (h >> 33)
+
+
+def shingle_hashes(text: str) -> Set[int]:
+    """Stable 64-bit hashes of overlapping SHINGLE_SIZE-token windows."""
+    token_hash: Dict[str, int] = {}
+    hashes = []
+    for tok in _TOKEN_RE.findall(text.lower()):
+        h = token_hash.get(tok)
+        if h is None:
+            h = token_hash[tok] = _mix(zlib.crc32(tok.encode("utf-8")))
+        hashes.append(h)
+    if len(hashes) < SHINGLE_SIZE:
+        return {sum(hashes) & _MASK64} if hashes else set()
+    # Token hashes are already mixed, so a position-weighted sum is enough
+    return {
+        (a * 0x9E3779B97F4A7C15 + b * 0xC2B2AE3D27D4EB4F + c) & _MASK64
+        for a, b, c in zip(hashes, hashes[1:], hashes[2:])
+    }
+
+
+def signature(text: str) -> Optional[array]:
+    """One-permutation MinHash signature (NUM_BINS unsigned 64-bit values)."""
+    shingles = shingle_hashes(text)
+    if not shingles:
+        return None
+    empty = _VALUE_SPAN
+    sig = [empty] * NUM_BINS
+    for h in shingles:
+        b = h & (NUM_BINS - 1)
+        v = h >> _BIN_BITS
+        if v < sig[b]:
+            sig[b] = v
+    # Densify: an empty bin borrows the next non-empty bin's value, offset by
+    # the distance so borrowed values only match equally-borrowed ones
+    if empty in sig:
+        for i in range(NUM_BINS):
+            if sig[i] != empty:
+                continue
+            for dist in range(1, NUM_BINS):
+                donor = sig[(i + dist) % NUM_BINS]
+                if donor < empty:
+                    sig[i] = donor + dist * _VALUE_SPAN
+                    break
+    return array("Q", sig)
+
+
+def estimate_jaccard(a: array, b: array) -> float:
+    """Fraction of agreeing bins (unbiased estimate of shingle Jaccard)."""
+    return sum(1 for x, y in zip(a, b) if x == y) / NUM_BINS
+
+
+def lsh_candidates(signatures: Dict[Hashable, array]) -> Set[Tuple]:
+    """Pairs of keys whose signatures collide in at least one band."""
+    candidates: Set[Tuple] = set()
+    for band in range(BANDS):
+        lo, hi = band * ROWS, (band + 1) * ROWS
+        buckets: Dict[Tuple, List] = defaultdict(list)
+        for key, sig in signatures.items():
+            buckets[tuple(sig[lo:hi])].append(key)
+        for keys in buckets.values():
+            if 1 < len(keys) <= MAX_BUCKET:
+                for a, b in combinations(sorted(keys), 2):
+                    candidates.add((a, b))
+    return candidates
+
+
+class SignatureCache:
+    """On-disk MinHash signatures keyed by content hash."""
+
+    def __init__(self, db_path: Path = SIGNATURE_PATH):
+        self.conn: Optional[sqlite3.Connection] = None
+        try:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(db_path))
+            version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SIGNATURE_VERSION:
+                self.conn.execute("DROP TABLE IF EXISTS signatures")
+                self.conn.execute(f"PRAGMA user_version = {SIGNATURE_VERSION}")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS signatures (hash TEXT PRIMARY KEY, sig BLOB NOT NULL)"
+            )
+            self.conn.commit()
+        except sqlite3.Error as e:
+            print(f"Warning: MinHash signature cache unavailable: {e}")
+            self.conn = None
+
+    def get_many(self, hashes: Iterable[str]) -> Dict[str, array]:
+        found: Dict[str, array] = {}
+        if self.conn is None:
+            return found
+        wanted = list(set(hashes))
+        for i in range(0, len(wanted), 500):
+            chunk = wanted[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT hash, sig FROM signatures WHERE hash IN ({','.join('?' * len(chunk))})", chunk
+            )
+            for h, blob in rows:
+                sig = array("Q")
+                sig.frombytes(blob)
+                if len(sig) == NUM_BINS:
+                    found[h] = sig
+        return found
+
+    def put_many(self, items: Dict[str, array]):
+        if self.conn is None or not items:
+            return
+        try:
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO signatures (hash, sig) VALUES (?, ?)",
+                    [(h, sig.tobytes()) for h, sig in items.items()],
+                )
+        except sqlite3.Error as e:
+            print(f"Warning: failed to persist MinHash signatures: {e}")
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
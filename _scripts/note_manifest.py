@@ -0,0 +1,241 @@
+"""Note Manifest - Day-bucketed metadata for date-window note collection.
+
+Keeps, per note in a folder (Sources/ by default), its frontmatter type, its
+date (frontmatter `date:`, else a YYYY-MM-DD in the filename), mtime and
+size, bucketed by both date and mtime day. Records are refreshed
+incrementally: only notes whose mtime or size changed are looked at again,
+and then only their frontmatter is read.
+
+`notes_between(start, end, types=...)` walks only the day buckets in range,
+so synthesis collectors read just the notes they return.
+"""
+
+import json
+import os
+import re
+import sys
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+# Add parent for config
+sys.path.insert(0, str(Path(__file__).parent))
+from config import VAULT_PATH, CACHE_DIR
+from note_store import get_store, read_frontmatter
+from vault_walker import FileEntry, get_walker
+
+MANIFEST_VERSION = 1
+
+_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+
+DateLike = Union[date, datetime, str]
+
+
+def _day(value: DateLike) -> str:
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d")
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)[:10]
+
+
+def note_date(frontmatter: Dict, filename: str) -> Optional[str]:
+    """Frontmatter date, else a date in the filename (None if undated)."""
+    for candidate in (str(frontmatter.get("date") or ""), filename):
+        match = _DATE_RE.search(candidate)
+        if match:
+            try:
+                datetime.strptime(match.group(1), "%Y-%m-%d")
+                return match.group(1)
+            except ValueError:
+                pass
+    return None
+
+
+class NoteManifest:
+    """Incrementally maintained, day-bucketed metadata for one vault folder."""
+
+    def __init__(self, folder: str = "Sources", manifest_dir: Path = CACHE_DIR):
+        self.folder = folder
+        slug = re.sub(r"[^\w\-]+", "_", folder).strip("_") or "vault"
+        self.path = Path(manifest_dir) / f"note_manifest-{slug}.json"
+        self.records: Dict[str, Dict] = {}
+        self.by_date: Dict[str, List[str]] = defaultdict(list)
+        self.by_mtime: Dict[str, List[str]] = defaultdict(list)
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") == MANIFEST_VERSION:
+                self.records = data.get("files", {})
+        except (OSError, ValueError):
+            pass
+        self._refreshed = False
+
+    def refresh(self) -> Dict[str, int]:
+        """Bring records up to date with the folder; returns change counts."""
+        entries = get_walker().scan(under=self.folder, fresh=True)
+        changes: Dict[str, Optional[FileEntry]] = {rel: None for rel in self.records if rel not in entries}
+        changes.update(entries)
+        stats = self._apply(changes)
+        self.by_date = defaultdict(list)
+        self.by_mtime = defaultdict(list)
+        for rel, rec in self.records.items():
+            if rec["date"]:
+                self.by_date[rec["date"]].append(rel)
+            self.by_mtime[rec["mtime_day"]].append(rel)
+        self._refreshed = True
+        return stats
+
+    def update(self, changes: Dict[str, Optional[FileEntry]], save: bool = True) -> Dict[str, int]:
+        """Apply known per-note changes ({path: FileEntry, or None if deleted}).
+
+        Paths outside the folder are ignored; day buckets are patched in place.
+        With save=False the file is written by a later save().
+        """
+        folder = self.folder.strip("/")
+        prefix = f"{folder}/" if folder else ""
+        changes = {rel: entry for rel, entry in changes.items() if rel.startswith(prefix)}
+        if self._refreshed:
+            for rel in changes:
+                rec = self.records.get(rel)
+                if rec:
+                    if rec["date"] and rel in self.by_date.get(rec["date"], ()):
+                        self.by_date[rec["date"]].remove(rel)
+                    if rel in self.by_mtime.get(rec["mtime_day"], ()):
+                        self.by_mtime[rec["mtime_day"]].remove(rel)
+        stats = self._apply(changes, save)
+        if self._refreshed:
+            for rel in changes:
+                rec = self.records.get(rel)
+                if rec:
+                    if rec["date"]:
+                        self.by_date[rec["date"]].append(rel)
+                    self.by_mtime[rec["mtime_day"]].append(rel)
+        return stats
+
+    def _apply(self, changes: Dict[str, Optional[FileEntry]], save: bool = True) -> Dict[str, int]:
+        """Update records for changed notes (None: deleted) and save if any changed."""
+        stats = {"added": 0, "updated": 0, "removed": 0}
+        for rel, entry in changes.items():
+            rec = self.records.get(rel)
+            if entry is None:
+                if rec:
+                    del self.records[rel]
+                    stats["removed"] += 1
+                continue
+            if rec and rec["mtime_ns"] == entry.mtime_ns and rec["size"] == entry.size:
+                continue
+            frontmatter = read_frontmatter(VAULT_PATH / rel)
+            mtime_day = datetime.fromtimestamp(entry.mtime_ns / 1e9).strftime("%Y-%m-%d")
+            note_type = frontmatter.get("type")
+            self.records[rel] = {
+                "type": str(note_type).strip() if note_type else "unknown",
+                "date": note_date(frontmatter, Path(rel).name),
+                "mtime_ns": entry.mtime_ns,
+                "mtime_day": mtime_day,
+                "size": entry.size,
+            }
+            stats["updated" if rec else "added"] += 1
+        if save and any(stats.values()):
+            self.save()
+        return stats
+
+    def save(self):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(
+                json.dumps({"version": MANIFEST_VERSION, "files": self.records}, ensure_ascii=False),
+                encoding="utf-8",
+            )
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"Warning: failed to save note manifest: {e}")
+
+    def notes_between(
+        self,
+        start: DateLike,
+        end: Optional[DateLike] = None,
+        types: Optional[Iterable[str]] = None,
+        exclude_types: Optional[Iterable[str]] = None,
+        by: str = "date",
+    ) -> List[Dict]:
+        """Notes dated within [start, end] (inclusive days), newest first.
+
+        Args:
+            start, end: Dates, datetimes or YYYY-MM-DD strings (end defaults to start).
+            types: Only these frontmatter types.
+            exclude_types: Skip these frontmatter types.
+            by: "date" (note date; undated notes never match) or "mtime"
+                (last-modified day).
+        """
+        if not self._refreshed:
+            self.refresh()
+        buckets = self.by_mtime if by == "mtime" else self.by_date
+        wanted = set(types) if types else None
+        skipped = set(exclude_types or ())
+
+        first = datetime.strptime(_day(start), "%Y-%m-%d").date()
+        last = datetime.strptime(_day(end if end is not None else start), "%Y-%m-%d").date()
+        results = []
+        day = first
+        while day <= last:
+            for rel in buckets.get(day.isoformat(), ()):
+                rec = self.records[rel]
+                if wanted is not None and rec["type"] not in wanted:
+                    continue
+                if rec["type"] in skipped:
+                    continue
+                results.append({
+                    "path": VAULT_PATH / rel,
+                    "relative_path": rel,
+                    "filename": Path(rel).stem,
+                    "type": rec["type"],
+                    "date": rec["date"],
+                    "mtime": rec["mtime_ns"] / 1e9,
+                    "size": rec["size"],
+                })
+            day += timedelta(days=1)
+
+        key = "mtime" if by == "mtime" else "date"
+        results.sort(key=lambda r: (r[key], r["filename"]), reverse=True)
+        return results
+
+
+_MANIFESTS: Dict[str, NoteManifest] = {}
+
+
+def get_note_manifest(folder: str = "Sources") -> NoteManifest:
+    """Get the shared manifest for a folder."""
+    if folder not in _MANIFESTS:
+        _MANIFESTS[folder] = NoteManifest(folder)
+    return _MANIFESTS[folder]
+
+
+def notes_between(
+    start: DateLike,
+    end: Optional[DateLike] = None,
+    types: Optional[Iterable[str]] = None,
+    exclude_types: Optional[Iterable[str]] = None,
+    folder: str = "Sources",
+    by: str = "date",
+) -> List[Dict]:
+    """Notes in `folder` dated within [start, end]; see NoteManifest.notes_between."""
+    return get_note_manifest(folder).notes_between(start, end, types, exclude_types, by)
+
+
+def read_body(record: Dict) -> str:
+    """Body (frontmatter removed) of a note returned by notes_between."""
+    note = get_store().get(record["path"])
+    return note["content"] if note else ""
+
+
+if __name__ == "__main__":
+    import time
+
+    t0 = time.perf_counter()
+    manifest = get_note_manifest()
+    print(manifest.refresh(), f"{(time.perf_counter() - t0) * 1000:.1f} ms")
+    today = datetime.now()
+    for rec in manifest.notes_between(today - timedelta(days=7), today):
+        print(f"  {rec['date'] or '-':<10}  {rec['type']:<20} {rec['filename']}")
@@ -0,0 +1,349 @@
+"""Note Store - Parse each vault note once and reuse the result.
+
+Memoizes parsed notes (frontmatter, body, wikilinks, tags, headings) keyed by
+path + mtime + size, so a note read during graph expansion is not re-read and
+re-parsed when the same script builds its context a moment later.
+
+Two tiers:
+- In-process LRU holding full notes, bounded by total bytes
+- On-disk SQLite tier under _logs/cache holding the parsed metadata (not the
+  body), so later processes that only need links/tags/headings skip reading
+  and parsing notes that have not changed
+"""
+
+import atexit
+import json
+import os
+import re
+import sqlite3
+import sys
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Add parent for config
+sys.path.insert(0, str(Path(__file__).parent))
+from config import VAULT_PATH, CACHE_DIR
+
+STORE_PATH = CACHE_DIR / "note_store.db"
+
+# In-memory budget for full notes (bytes of note text)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Parsed fields kept in the on-disk tier (everything except the body)
+_META_FIELDS = {"frontmatter", "wikilinks", "tags", "headings", "word_count"}
+
+# Bump when the parsed representation changes; stale rows are re-parsed
+PARSER_VERSION = 1
+
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+_WIKILINK_RE = re.compile(r"\[\[([^\]]+)\]\]")
+_TAG_RE = re.compile(r"(?:^|(?<=\s))#([\w][\w/\-]*)", re.UNICODE)
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$", re.MULTILINE)
+_INT_RE = re.compile(r"^[-+]?\d+$")
+_FLOAT_RE = re.compile(r"^[-+]?(\d+\.\d*|\.\d+)([eE][-+]?\d+)?$")
+
+# Header-only reads: frontmatter is read in chunks and given up on past the cap
+FRONTMATTER_CHUNK = 4096
+FRONTMATTER_MAX_BYTES = 64 * 1024
+_FENCE_OPEN_RE = re.compile(rb"^---[ \t]*\r?\n")
+_FENCE_CLOSE_RE = re.compile(rb"\n---[ \t]*\r?\n")
+
+
+def _coerce(value: str) -> Any:
+    """Bare scalar to bool/None/int/float where it looks like one (dates stay strings)."""
+    lowered = value.lower()
+    if lowered in ("true", "yes"):
+        return True
+    if lowered in ("false", "no"):
+        return False
+    if lowered in ("null", "~"):
+        return None
+    if _INT_RE.match(value):
+        return int(value)
+    if _FLOAT_RE.match(value):
+        return float(value)
+    return value
+
+
+def _parse_scalar(value: str, typed: bool = False) -> Any:
+    """Parse a frontmatter value: inline list, quoted or bare string."""
+    value = value.strip()
+    if value.startswith("[") and value.endswith("]"):
+        return [_parse_scalar(v, typed) for v in value[1:-1].split(",") if v.strip()]
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    return _coerce(value) if typed else value
+
+
+def parse_frontmatter(block: str, typed: bool = False) -> Dict[str, Any]:
+    """Parse simple YAML frontmatter (key: value and `- item` lists).
+
+    With `typed`, unquoted booleans, nulls and numbers become Python values.
+    """
+    data: Dict[str, Any] = {}
+    current: Optional[str] = None
+    for line in block.splitlines():
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        stripped = line.strip()
+        if stripped.startswith("- ") and current is not None:
+            if not isinstance(data.get(current), list):
+                data[current] = []
+            data[current].append(_parse_scalar(stripped[2:], typed))
+            continue
+        if ":" in line and not line[0].isspace():
+            key, _, value = line.partition(":")
+            current = key.strip()
+            data[current] = _parse_scalar(value, typed) if value.strip() else []
+    return data
+
+
+def _frontmatter_tags(frontmatter: Dict[str, Any]) -> List[str]:
+    raw = frontmatter.get("tags") or frontmatter.get("tag") or []
+    if isinstance(raw, str):
+        raw = re.split(r"[,\s]+", raw)
+    return [str(t).lstrip("#") for t in raw if str(t).strip()]
+
+
+def read_frontmatter(
+    path: Path,
+    chunk_size: int = FRONTMATTER_CHUNK,
+    max_bytes: int = FRONTMATTER_MAX_BYTES,
+) -> Dict[str, Any]:
+    """Typed frontmatter of a note, reading only up to the closing `---`.
+
+    Reads in `chunk_size` pieces, so a note with a large body costs one small
+    read. Returns {} for notes without (or with unterminated) frontmatter.
+    """
+    try:
+        with open(path, "rb") as f:
+            buf = f.read(chunk_size)
+            opening = _FENCE_OPEN_RE.match(buf)
+            if not opening:
+                return {}
+            while True:
+                # Back up one byte so an empty block ("---\n---\n") still matches
+                closing = _FENCE_CLOSE_RE.search(buf, opening.end() - 1)
+                if closing:
+                    break
+                if len(buf) >= max_bytes:
+                    return {}
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return {}
+                buf += chunk
+    except OSError:
+        return {}
+    block = buf[opening.end():closing.start()].decode("utf-8", errors="replace")
+    return parse_frontmatter(block, typed=True)
+
+
+def parse_note(content: str) -> Dict[str, Any]:
+    """Parse note text into frontmatter, body and extracted structure."""
+    frontmatter: Dict[str, Any] = {}
+    body = content
+    fm_match = _FRONTMATTER_RE.match(content)
+    if fm_match:
+        frontmatter = parse_frontmatter(fm_match.group(1))
+        body = content[fm_match.end():]
+    tags = _frontmatter_tags(frontmatter)
+    tags.extend(t for t in _TAG_RE.findall(body) if not t.isdigit())
+    return {
+        "frontmatter": frontmatter,
+        "content": body,
+        "wikilinks": _WIKILINK_RE.findall(body),
+        "tags": list(dict.fromkeys(tags)),
+        "headings": [[len(h), text] for h, text in _HEADING_RE.findall(body)],
+        "word_count": len(body.split()),
+    }
+
+
+class NoteStore:
+    """Two-tier cache of parsed notes keyed by (path, mtime, size)."""
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        db_path: Optional[Path] = STORE_PATH,
+        vault_path: Path = VAULT_PATH,
+    ):
+        self.max_bytes = max_bytes
+        self.vault_path = Path(vault_path)
+        self._lru: "OrderedDict[str, Tuple[Tuple[int, int], Dict, int]]" = OrderedDict()
+        self._bytes = 0
+        self._pending: List[Tuple] = []
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "parsed": 0}
+        self.conn: Optional[sqlite3.Connection] = None
+        if db_path is not None:
+            try:
+                Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+                self.conn = sqlite3.connect(str(db_path))
+                self.conn.execute("PRAGMA journal_mode=WAL")
+                self.conn.execute(
+                    """CREATE TABLE IF NOT EXISTS notes (
+                        path TEXT PRIMARY KEY,
+                        mtime_ns INTEGER NOT NULL,
+                        size INTEGER NOT NULL,
+                        version INTEGER NOT NULL,
+                        meta TEXT NOT NULL
+                    )"""
+                )
+                self.conn.commit()
+            except sqlite3.Error as e:
+                print(f"Warning: note store cache unavailable: {e}")
+                self.conn = None
+
+    def _rel(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.vault_path).as_posix()
+        except ValueError:
+            return str(path)
+
+    def _finish(self, path: Path, parsed: Dict[str, Any], stamp: Tuple[int, int]) -> Dict[str, Any]:
+        """Attach path-derived fields to a parsed record."""
+        note = dict(parsed)
+        note["path"] = path
+        note["relative_path"] = self._rel(path)
+        note["title"] = path.stem
+        note["mtime_ns"], note["size"] = stamp
+        return note
+
+    def _remember(self, key: str, stamp: Tuple[int, int], note: Dict[str, Any]):
+        """Insert into the LRU, evicting least-recently-used notes over budget."""
+        cost = len(note.get("content", "")) + 256
+        if key in self._lru:
+            self._bytes -= self._lru.pop(key)[2]
+        self._lru[key] = (stamp, note, cost)
+        self._bytes += cost
+        while self._bytes > self.max_bytes and len(self._lru) > 1:
+            _, (_, _, old_cost) = self._lru.popitem(last=False)
+            self._bytes -= old_cost
+
+    def _stamp(self, path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _load(
+        self,
+        path: Path,
+        key: str,
+        stamp: Tuple[int, int],
+        reader: Optional[Callable[[Path], Optional[str]]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Read and parse a note from disk, recording its metadata."""
+        if reader is not None:
+            content = reader(path)
+        else:
+            try:
+                content = path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                content = None
+        if content is None:
+            return None
+        self.stats["parsed"] += 1
+        note = self._finish(path, parse_note(content), stamp)
+        self._remember(key, stamp, note)
+        if self.conn is not None:
+            meta = {k: v for k, v in note.items() if k in _META_FIELDS}
+            self._pending.append(
+                (self._rel(path), stamp[0], stamp[1], PARSER_VERSION, json.dumps(meta, ensure_ascii=False))
+            )
+            if len(self._pending) >= 500:
+                self.flush()
+        return note
+
+    def get(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Full parsed note (including body), or None if unreadable."""
+        path = Path(path)
+        stamp = self._stamp(path)
+        if stamp is None:
+            return None
+        key = str(path)
+        cached = self._lru.get(key)
+        if cached and cached[0] == stamp:
+            self._lru.move_to_end(key)
+            self.stats["memory_hits"] += 1
+            return cached[1]
+        return self._load(path, key, stamp)
+
+    def get_meta(
+        self, path: Path, reader: Optional[Callable[[Path], Optional[str]]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Parsed metadata only (frontmatter, links, tags, headings, word count).
+
+        Served from memory or the on-disk tier when the note is unchanged,
+        so no file read or regex parsing happens on a hit. On a miss the note
+        is read with `reader` (path -> text, None if unreadable) when given,
+        so callers with their own read cache share it.
+        """
+        path = Path(path)
+        stamp = self._stamp(path)
+        if stamp is None:
+            return None
+        key = str(path)
+        cached = self._lru.get(key)
+        if cached and cached[0] == stamp:
+            self._lru.move_to_end(key)
+            self.stats["memory_hits"] += 1
+            return cached[1]
+        if self.conn is not None:
+            row = self.conn.execute(
+                "SELECT mtime_ns, size, version, meta FROM notes WHERE path = ?", (self._rel(path),)
+            ).fetchone()
+            if row and (row[0], row[1]) == stamp and row[2] == PARSER_VERSION:
+                self.stats["disk_hits"] += 1
+                return self._finish(path, json.loads(row[3]), stamp)
+        return self._load(path, key, stamp, reader)
+
+    def flush(self):
+        """Write pending metadata rows to the on-disk tier."""
+        if self.conn is None or not self._pending:
+            return
+        try:
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO notes (path, mtime_ns, size, version, meta) VALUES (?, ?, ?, ?, ?)",
+                    self._pending,
+                )
+        except sqlite3.Error as e:
+            print(f"Warning: failed to persist note cache: {e}")
+        self._pending = []
+
+    def forget(self, paths: List[Path]):
+        """Drop deleted notes from both tiers."""
+        for path in paths:
+            cached = self._lru.pop(str(path), None)
+            if cached:
+                self._bytes -= cached[2]
+        if self.conn is None:
+            return
+        self.flush()
+        with self.conn:
+            self.conn.executemany("DELETE FROM notes WHERE path = ?", [(self._rel(Path(p)),) for p in paths])
+
+    def prune(self, keep: List[str]):
+        """Drop on-disk rows for notes not in `keep` (vault-relative paths)."""
+        if self.conn is None:
+            return
+        self.flush()
+        keep_set = set(keep)
+        stale = [(p,) for (p,) in self.conn.execute("SELECT path FROM notes") if p not in keep_set]
+        if stale:
+            with self.conn:
+                self.conn.executemany("DELETE FROM notes WHERE path = ?", stale)
+
+
+_STORE: Optional[NoteStore] = None
+
+
+def get_store() -> NoteStore:
+    """Get the shared per-process note store."""
+    global _STORE
+    if _STORE is None:
+        _STORE = NoteStore()
+        atexit.register(_STORE.flush)
+    return _STORE
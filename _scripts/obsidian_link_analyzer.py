@@ -18,41 +18,41 @@ from collections import defaultdict
 # Add parent for config
 sys.path.insert(0, str(Path(__file__).parent))
 from config import summarize, save_note, VAULT_PATH
-from obsidian_cli import get_cli
+from link_graph import get_link_graph
 
 
 class LinkAnalyzer:
-    """Link analysis engine using Obsidian CLI."""
+    """Link analysis engine over the in-process vault link graph."""
     
     def __init__(self):
-        self.cli = get_cli()
+        self.graph = get_link_graph()
     
     def get_orphan_files(self) -> List[str]:
         """Get files with no incoming links."""
         print("Finding orphan files...")
-        return self.cli.get_orphans(all=True)
+        return self.graph.orphans()
     
     def get_deadend_files(self) -> List[str]:
         """Get files with no outgoing links."""
         print("Finding dead-end files...")
-        return self.cli.get_deadends(all=True)
+        return self.graph.deadends()
     
     def get_unresolved_links(self) -> List[str]:
         """Get unresolved links."""
         print("Finding unresolved links...")
-        return self.cli.get_unresolved_links(verbose=True)
+        return self.graph.unresolved_links()
     
     def get_all_files(self) -> List[str]:
         """Get all markdown files."""
-        all_files = self.cli.list_files(ext="md", total=True)
-        return [f for f in all_files if f.endswith('.md')]
+        return list(self.graph.nodes)
     
     def analyze_file_links(self, file_path: str) -> Dict[str, Any]:
         """Analyze links for a specific file."""
         print(f"Analyzing links for: {file_path}")
         
-        backlinks = self.cli.get_backlinks(path=file_path)
-        outgoing = self.cli.get_outgoing_links(path=file_path)
+        resolved = self.graph.resolve(file_path) or file_path
+        backlinks = self.graph.backlinks(resolved)
+        outgoing = self.graph.outgoing(resolved)
         
         return {
             "file": file_path,
@@ -75,8 +75,9 @@ class LinkAnalyzer:
         unresolved = self.get_unresolved_links()
         
         # Analyze connectivity
-        connected_files = [f for f in all_files if f not in orphans]
-        files_with_outgoing = [f for f in all_files if f not in deadends]
+        orphan_set, deadend_set = set(orphans), set(deadends)
+        connected_files = [f for f in all_files if f not in orphan_set]
+        files_with_outgoing = [f for f in all_files if f not in deadend_set]
         
         # Calculate metrics
         total_files = len(all_files)
@@ -110,22 +111,15 @@ class LinkAnalyzer:
         """Find files with most backlinks."""
         print("Finding most connected files...")
         
-        all_files = self.get_all_files()
         file_link_counts = []
-        
-        # Sample a subset for performance
-        sample_files = all_files[:100]  # Analyze first 100 files
-        
-        for file_path in sample_files:
-            try:
-                backlinks = self.cli.get_backlinks(path=file_path)
+        for file_path in self.get_all_files():
+            backlinks = self.graph.backlinks(file_path)
+            if backlinks:
                 file_link_counts.append({
                     "file": file_path,
                     "backlink_count": len(backlinks),
                     "backlinks": backlinks
                 })
-            except:
-                continue
         
         # Sort by backlink count
         return sorted(file_link_counts, key=lambda x: -x["backlink_count"])[:limit]
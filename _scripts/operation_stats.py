@@ -0,0 +1,409 @@
+"""Operation Stats - Per-script, per-day rollups of the operation log.
+
+SystemBehaviorTracker appends every operation to reflection_log.jsonl.
+Reading that whole file for each statistics query gets slower as the history
+grows, so this module keeps counters beside it:
+- One row per (day, script) with total / success / failed counts and a
+  t-digest of operation durations (for p50/p90/p99), plus an all-time row
+  per script
+- Rows are updated incrementally: each refresh folds in only the log lines
+  appended since the last one (tracked by byte offset)
+- The byte offset where each day starts is kept too, so "recent operations"
+  reads only the tail of the log
+
+The rollups are derived data (CACHE_DIR): delete the database and it is
+rebuilt from the log on the next query.
+
+Usage:
+  python3 _scripts/operation_stats.py            # All-time statistics
+  python3 _scripts/operation_stats.py --days 7   # Last 7 days
+  python3 _scripts/operation_stats.py --rebuild  # Recompute from the log
+"""
+
+import argparse
+import bisect
+import json
+import math
+import sqlite3
+import sys
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+# Add parent for config
+sys.path.insert(0, str(Path(__file__).parent))
+from config import CACHE_DIR
+
+ROLLUPS_PATH = CACHE_DIR / "operation_rollups.db"
+ROLLUPS_VERSION = 1
+ALL_TIME = "*"
+# Digest accuracy: more centroids, tighter percentiles (~1% at 100)
+DIGEST_COMPRESSION = 100
+PERCENTILES = (0.5, 0.9, 0.99)
+
+
+class TDigest:
+    """Merging t-digest (Dunning): streaming quantile sketch of bounded size.
+
+    Values are kept as (mean, weight) centroids; centroids near the tails
+    stay small, so extreme percentiles remain accurate. Digests merge, which
+    is what lets daily rollups combine into any window.
+    """
+
+    def __init__(self, centroids: Optional[Sequence[Sequence[float]]] = None,
+                 compression: int = DIGEST_COMPRESSION):
+        self.compression = compression
+        self.centroids: List[List[float]] = [list(c) for c in centroids or []]
+        self._buffer: List[List[float]] = []
+
+    @property
+    def count(self) -> float:
+        return sum(w for _, w in self.centroids) + sum(w for _, w in self._buffer)
+
+    def add(self, value: float, weight: float = 1.0):
+        self._buffer.append([float(value), weight])
+        if len(self._buffer) > 5 * self.compression:
+            self._compress()
+
+    def merge(self, other: "TDigest"):
+        self._buffer.extend(list(c) for c in other.centroids + other._buffer)
+        self._compress()
+
+    def _k(self, q: float) -> float:
+        """Scale function k1: centroid size limit shrinks toward q=0 and q=1."""
+        return self.compression / (2 * math.pi) * math.asin(2 * min(max(q, 0.0), 1.0) - 1)
+
+    def _compress(self):
+        items = sorted(self.centroids + self._buffer)
+        self._buffer = []
+        if not items:
+            self.centroids = []
+            return
+        total = sum(w for _, w in items)
+        merged = [list(items[0])]
+        done = 0.0  # weight of the centroids before merged[-1]
+        k_low = self._k(0.0)
+        for mean, weight in items[1:]:
+            current = merged[-1]
+            q_high = (done + current[1] + weight) / total
+            if self._k(q_high) - k_low <= 1:
+                new_weight = current[1] + weight
+                current[0] += (mean - current[0]) * weight / new_weight
+                current[1] = new_weight
+            else:
+                done += current[1]
+                k_low = self._k(done / total)
+                merged.append([mean, weight])
+        self.centroids = merged
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimated value at quantile q (0..1); None when empty."""
+        if self._buffer:
+            self._compress()
+        if not self.centroids:
+            return None
+        if len(self.centroids) == 1:
+            return self.centroids[0][0]
+        total = sum(w for _, w in self.centroids)
+        # Interpolate between centroid midpoints on the cumulative weight
+        mids = []
+        cumulative = 0.0
+        for _, weight in self.centroids:
+            mids.append(cumulative + weight / 2)
+            cumulative += weight
+        target = q * total
+        i = bisect.bisect_left(mids, target)
+        if i == 0:
+            return self.centroids[0][0]
+        if i == len(mids):
+            return self.centroids[-1][0]
+        (m0, _), (m1, _) = self.centroids[i - 1], self.centroids[i]
+        return m0 + (m1 - m0) * (target - mids[i - 1]) / (mids[i] - mids[i - 1])
+
+    def mean(self) -> Optional[float]:
+        if self._buffer:
+            self._compress()
+        total = sum(w for _, w in self.centroids)
+        return sum(m * w for m, w in self.centroids) / total if total else None
+
+    def to_json(self) -> str:
+        if self._buffer:
+            self._compress()
+        return json.dumps([[round(m, 4), w] for m, w in self.centroids])
+
+    @classmethod
+    def from_json(cls, data: Optional[str]) -> "TDigest":
+        return cls(json.loads(data) if data else None)
+
+
+def entry_duration(entry: Dict) -> Optional[float]:
+    """Duration in seconds recorded with an operation, if any."""
+    metrics = entry.get("metrics") or {}
+    for key in ("duration_s", "response_time"):
+        value = metrics.get(key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0:
+            return float(value)
+    return None
+
+
+class OperationRollups:
+    """SQLite-backed per-day, per-script counters over an operation log."""
+
+    def __init__(self, log_path: Path, db_path: Path = ROLLUPS_PATH):
+        self.log_path = Path(log_path)
+        self.conn: Optional[sqlite3.Connection] = None
+        self.lock = threading.Lock()
+        try:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            # Manual transactions: refresh must hold the write lock while it
+            # reads the offset, so two processes never fold in the same lines
+            self.conn = sqlite3.connect(str(db_path), timeout=30, isolation_level=None,
+                                        check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != ROLLUPS_VERSION:
+                for table in ("rollups", "days", "state"):
+                    self.conn.execute(f"DROP TABLE IF EXISTS {table}")
+                self.conn.execute(f"PRAGMA user_version = {ROLLUPS_VERSION}")
+            self.conn.execute(
+                """CREATE TABLE IF NOT EXISTS rollups (
+                    day TEXT NOT NULL,
+                    script TEXT NOT NULL,
+                    total INTEGER NOT NULL,
+                    success INTEGER NOT NULL,
+                    failed INTEGER NOT NULL,
+                    digest TEXT,
+                    PRIMARY KEY (day, script)
+                )"""
+            )
+            self.conn.execute("CREATE TABLE IF NOT EXISTS days (day TEXT PRIMARY KEY, offset INTEGER NOT NULL)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        except sqlite3.Error as e:
+            print(f"Warning: Operation rollups unavailable: {e}")
+            self.conn = None
+
+    def _offset(self) -> int:
+        row = self.conn.execute("SELECT value FROM state WHERE key = 'offset'").fetchone()
+        return row[0] if row else 0
+
+    def refresh(self) -> int:
+        """Fold log lines appended since the last refresh into the rollups.
+
+        Returns the number of operations added. If the log shrank (replaced
+        or truncated) the rollups are rebuilt from scratch.
+        """
+        if self.conn is None:
+            return 0
+        try:
+            size = self.log_path.stat().st_size
+        except OSError:
+            size = 0
+        with self.lock:
+            try:
+                self.conn.execute("BEGIN IMMEDIATE")
+                try:
+                    added = self._refresh(size)
+                    self.conn.execute("COMMIT")
+                    return added
+                except BaseException:
+                    self.conn.execute("ROLLBACK")
+                    raise
+            except sqlite3.Error as e:
+                print(f"Warning: Failed to update operation rollups: {e}")
+                return 0
+
+    def _refresh(self, size: int) -> int:
+        offset = self._offset()
+        if size < offset:
+            self._reset()
+            offset = 0
+        if size == offset:
+            return 0
+
+        with open(self.log_path, "rb") as f:
+            f.seek(offset)
+            data = f.read(size - offset)
+        # Only whole lines: a writer may be mid-append at EOF
+        end = data.rfind(b"\n") + 1
+        if not end:
+            return 0
+
+        rows: Dict[tuple, List] = {}
+        day_offsets: Dict[str, int] = {}
+        added = 0
+        position = offset
+        for raw in data[:end].splitlines(keepends=True):
+            line_offset = position
+            position += len(raw)
+            try:
+                entry = json.loads(raw)
+                day = str(entry["timestamp"])[:10]
+                script = str(entry.get("script", "unknown"))
+            except (ValueError, KeyError, TypeError):
+                continue
+            added += 1
+            day_offsets.setdefault(day, line_offset)
+            for key in ((day, script), (ALL_TIME, script)):
+                if key not in rows:
+                    rows[key] = self._load_row(*key)
+                row = rows[key]
+                row[0] += 1
+                if entry.get("status") == "success":
+                    row[1] += 1
+                elif entry.get("status") == "failed":
+                    row[2] += 1
+                duration = entry_duration(entry)
+                if duration is not None:
+                    row[3].add(duration)
+
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO rollups (day, script, total, success, failed, digest) VALUES (?, ?, ?, ?, ?, ?)",
+            [(day, script, t, s, f, d.to_json() if d.count else None)
+             for (day, script), (t, s, f, d) in rows.items()],
+        )
+        # Keep the earliest offset per day (legacy imports can land out of order)
+        self.conn.executemany(
+            "INSERT INTO days (day, offset) VALUES (?, ?) "
+            "ON CONFLICT(day) DO UPDATE SET offset = MIN(offset, excluded.offset)",
+            list(day_offsets.items()),
+        )
+        self.conn.execute(
+            "INSERT OR REPLACE INTO state (key, value) VALUES ('offset', ?)", (offset + end,)
+        )
+        return added
+
+    def _load_row(self, day: str, script: str) -> List:
+        row = self.conn.execute(
+            "SELECT total, success, failed, digest FROM rollups WHERE day = ? AND script = ?",
+            (day, script),
+        ).fetchone()
+        if row is None:
+            return [0, 0, 0, TDigest()]
+        return [row[0], row[1], row[2], TDigest.from_json(row[3])]
+
+    def _reset(self):
+        for table in ("rollups", "days", "state"):
+            self.conn.execute(f"DELETE FROM {table}")
+
+    def rebuild(self) -> int:
+        """Recompute every rollup from the log."""
+        if self.conn is None:
+            return 0
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self._reset()
+            self.conn.execute("COMMIT")
+        return self.refresh()
+
+    def statistics(self, days: Optional[int] = None) -> Optional[Dict]:
+        """Counts and duration percentiles overall and per script.
+
+        With `days`, covers the last N days rounded out to whole days;
+        otherwise all time. Returns None if the rollups are unavailable.
+        """
+        if self.conn is None:
+            return None
+        self.refresh()
+        with self.lock:
+            if days is None:
+                rows = self.conn.execute(
+                    "SELECT script, total, success, failed, digest FROM rollups WHERE day = ?", (ALL_TIME,)
+                ).fetchall()
+            else:
+                rows = self.conn.execute(
+                    "SELECT script, total, success, failed, digest FROM rollups WHERE day >= ? AND day != ?",
+                    (cutoff_day(days), ALL_TIME),
+                ).fetchall()
+
+        scripts: Dict[str, Dict] = {}
+        digests: Dict[str, TDigest] = {}
+        overall = TDigest()
+        for script, total, success, failed, digest in rows:
+            stats = scripts.setdefault(script, {"total": 0, "success": 0, "failed": 0})
+            stats["total"] += total
+            stats["success"] += success
+            stats["failed"] += failed
+            if digest:
+                d = TDigest.from_json(digest)
+                digests.setdefault(script, TDigest()).merge(d)
+                overall.merge(d)
+        for script, digest in digests.items():
+            scripts[script].update(duration_summary(digest))
+
+        total = sum(s["total"] for s in scripts.values())
+        successful = sum(s["success"] for s in scripts.values())
+        result = {
+            "total_operations": total,
+            "successful_operations": successful,
+            "failed_operations": sum(s["failed"] for s in scripts.values()),
+            "success_rate": successful / total if total > 0 else 0,
+            "script_statistics": dict(sorted(scripts.items())),
+        }
+        result.update(duration_summary(overall))
+        return result
+
+    def offset_since(self, day: str) -> Optional[int]:
+        """Byte offset in the log of the first operation on or after `day`.
+
+        None if the rollups are unavailable; the log size if nothing is that recent.
+        """
+        if self.conn is None:
+            return None
+        self.refresh()
+        with self.lock:
+            row = self.conn.execute("SELECT MIN(offset) FROM days WHERE day >= ?", (day,)).fetchone()
+            return row[0] if row[0] is not None else self._offset()
+
+
+def cutoff_day(days: int) -> str:
+    """ISO date of the day `days` days ago (windows are rounded out to whole days)."""
+    return (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+def duration_summary(digest: TDigest) -> Dict:
+    """Mean and percentile durations (seconds) from a digest; {} if empty."""
+    if not digest.count:
+        return {}
+    summary = {"duration_count": int(digest.count), "duration_avg_s": round(digest.mean(), 3)}
+    for q in PERCENTILES:
+        summary[f"duration_p{int(q * 100)}_s"] = round(digest.quantile(q), 3)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Operation Stats - counts and duration percentiles from the operation log",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python3 _scripts/operation_stats.py            # All-time statistics
+  python3 _scripts/operation_stats.py --days 7   # Last 7 days
+  python3 _scripts/operation_stats.py --rebuild  # Recompute from the log
+""",
+    )
+    parser.add_argument("--days", type=int, help="Only the last N days")
+    parser.add_argument("--rebuild", action="store_true", help="Recompute rollups from the log first")
+    args = parser.parse_args()
+
+    from self_reflection import REFLECTION_LOG_PATH
+
+    rollups = OperationRollups(REFLECTION_LOG_PATH)
+    if args.rebuild:
+        print(f"Rebuilt from {rollups.rebuild()} operations")
+    stats = rollups.statistics(args.days)
+    if stats is None:
+        sys.exit(1)
+
+    period = f"last {args.days} days" if args.days else "all time"
+    print(f"Operations ({period}): {stats['total_operations']} "
+          f"({stats['successful_operations']} ok, {stats['failed_operations']} failed, "
+          f"{stats['success_rate']:.1%} success)")
+    print(f"\n{'Script':<32} {'Total':>6} {'OK':>6} {'Fail':>6} {'p50 s':>8} {'p90 s':>8} {'p99 s':>8}")
+    for script, s in stats["script_statistics"].items():
+        p = [f"{s[k]:.2f}" if k in s else "-" for k in ("duration_p50_s", "duration_p90_s", "duration_p99_s")]
+        print(f"{script:<32} {s['total']:>6} {s['success']:>6} {s['failed']:>6} {p[0]:>8} {p[1]:>8} {p[2]:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,7 @@ import re
 import subprocess
 from pathlib import Path
 
-from config import summarize, save_note, VAULT_PATH
+from config import summarize_long, save_note, VAULT_PATH
 
 SUMMARY_PROMPT = """You are a research assistant analyzing a document. Create a comprehensive summary in markdown:
 
@@ -116,17 +116,14 @@ def main():
     if author:
         print("  Author: {}".format(author))
 
-    # Truncate very long documents
-    if len(text) > 60000:
-        text = text[:60000] + "\n\n[Document truncated...]"
-
     print("Generating summary with AI...")
     context = "Document: {}\n{}\n\n{}".format(
         title,
         "Author: {}".format(author) if author else "",
         text,
     )
-    summary_body = summarize(context, SUMMARY_PROMPT)
+    # Long documents are condensed section by section, not truncated
+    summary_body = summarize_long(context, SUMMARY_PROMPT)
 
     today = datetime.now().strftime("%Y-%m-%d")
     safe_title = re.sub(r'[\\/*?:"<>|]', "", title)[:80]
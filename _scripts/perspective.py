@@ -256,7 +256,7 @@ Examples:
     if len(keys) == 6 and set(keys) == set(PERSPECTIVES.keys()):
         # All perspectives: single batch call
         print("  → Generating all perspectives (batch)...")
-        body = summarize(args.problem, BATCH_PROMPT)
+        body = summarize(args.problem, BATCH_PROMPT, cache=False)
     else:
         # Subset: individual calls
         sections = []
@@ -264,7 +264,7 @@ Examples:
             meta = PERSPECTIVES[key]
             full_prompt = f"{PROMPT_PREFIX}\n\n{meta['prompt']}"
             print(f"  → {meta['name']}...")
-            response = summarize(args.problem, full_prompt)
+            response = summarize(args.problem, full_prompt, cache=False)
             sections.append(f"## {meta['name']}\n\n{response}")
         body = "\n\n---\n\n".join(sections)
     output = f"""# Perspective Analysis
@@ -6,11 +6,14 @@ Run multiple skills in sequence, use named pipelines, or pick random skills.
 import argparse
 import json
 import random
-import subprocess
 import sys
 import time
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+from run_history import run_recorded
 
 # Vault root
 VAULT_PATH = Path(__file__).resolve().parent.parent
@@ -48,8 +51,11 @@ def get_runnable_skills(skills: dict) -> dict:
     return {k: v for k, v in skills.items() if v.get("commands") and len(v["commands"]) > 0}
 
 
-def run_skill(name: str, commands: list, verbose: bool) -> dict:
-    """Run a skill's commands. Returns {name, success, duration, error}."""
+def run_skill(name: str, commands: list, verbose: bool, profile: Optional[bool] = None) -> dict:
+    """Run a skill's commands. Returns {name, success, duration, error}.
+
+    profile=True (default: VAULT_PROFILE) profiles each command; see run_profiler.py.
+    """
     start = time.time()
     result = {"name": name, "success": False, "duration": 0, "error": None}
 
@@ -60,8 +66,11 @@ def run_skill(name: str, commands: list, verbose: bool) -> dict:
             continue
 
         try:
-            proc = subprocess.run(
+            proc = run_recorded(
                 parts,
+                skill=name,
+                source="pipeline",
+                profile=profile,
                 cwd=str(VAULT_PATH),
                 capture_output=not verbose,
                 text=True,
@@ -91,6 +100,7 @@ Examples:
   pipeline --list                      # List all skills
   pipeline --list-pipelines            # List named pipelines
   pipeline --save daily arxiv hn news # Save as named pipeline
+  pipeline --profile arxiv hn          # Profile each skill (see run_profiler.py report)
 """,
     )
     parser.add_argument(
@@ -131,6 +141,11 @@ Examples:
         action="store_true",
         help="Stream each skill's output to terminal",
     )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile each skill with cProfile + tracemalloc (same as VAULT_PROFILE=1)",
+    )
     parser.add_argument(
         "--no-fail-stop",
         action="store_true",
@@ -217,7 +232,7 @@ Examples:
         meta = runnable[name]
         cmds = meta.get("commands", [])
         print(f"[{i}/{len(to_run)}] Running: {name}")
-        result = run_skill(name, cmds, args.verbose)
+        result = run_skill(name, cmds, args.verbose, profile=args.profile or None)
         results.append(result)
 
         if result["success"]:
@@ -360,7 +360,7 @@ Examples:
 
     # 3. AI enrichment
     print("  Curating with AI...")
-    ai_content = summarize(user_context, prompt)
+    ai_content = summarize(user_context, prompt, cache=False)
 
     # 4. Assemble output
     today = datetime.now().strftime("%Y-%m-%d")
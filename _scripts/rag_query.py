@@ -6,8 +6,6 @@ Uses AI only for synthesis—retrieval is deterministic Python.
 """
 
 import argparse
-import re
-import subprocess
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -15,79 +13,40 @@ from typing import Dict, List, Optional, Set
 
 # Add parent for config
 sys.path.insert(0, str(Path(__file__).parent))
-from config import summarize, save_note, VAULT_PATH, TRACKER
+from config import summarize_stream, save_note, VAULT_PATH, TRACKER
+from vault_index import get_index
+from vault_walker import find_markdown_files
+from note_store import get_store
+from graph_analytics import pagerank_weights
+from context_packer import pack
 
-# Directories to exclude from search
-EXCLUDE_DIRS = {".git", ".obsidian", ".claude", ".cursor", "_scripts", "_org", "_logs", ".ruff_cache"}
+# Context budget in estimated tokens, and passages kept per note
+MAX_CONTEXT_TOKENS = 8000
+MAX_PASSAGES_PER_NOTE = 3
+# Later retrieval ranks count for less: weight = 1 / (1 + RANK_DECAY * rank)
+RANK_DECAY = 0.1
 
-# Max chars per note in context (avoid token overflow)
-MAX_CHARS_PER_NOTE = 3000
-MAX_TOTAL_CONTEXT = 25000
 
+def search_vault_keyword(query: str, limit: int = 20) -> List[Path]:
+    """Search the persistent vault index for keyword matches."""
+    return get_index().search(query, limit=limit)
 
-def find_markdown_files() -> List[Path]:
-    """Find all markdown files in the vault."""
-    files = []
-    for item in VAULT_PATH.iterdir():
-        if item.is_dir() and item.name in EXCLUDE_DIRS:
-            continue
-        if item.is_dir():
-            for md in item.rglob("*.md"):
-                if any(p.name in EXCLUDE_DIRS for p in md.relative_to(VAULT_PATH).parents):
-                    continue
-                files.append(md)
-        elif item.suffix == ".md":
-            files.append(item)
-    return files
 
+def search_vault_bm25(query: str, limit: int = 20) -> List[Path]:
+    """Rank vault notes by BM25 relevance (title and heading hits boosted)."""
+    return [path for path, _ in get_index().rank(query, limit=limit)]
 
-def search_vault_keyword(query: str, limit: int = 20) -> List[Path]:
-    """Search vault using ripgrep for keyword matches."""
-    try:
-        result = subprocess.run(
-            ["rg", "-l", "-i", "-F", "--max-count", "1", query, str(VAULT_PATH)],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        if result.returncode != 0 and result.stderr and "No matches" not in result.stderr:
-            return []
-        lines = [p.strip() for p in result.stdout.strip().split("\n") if p.strip()]
-        paths = []
-        for line in lines:
-            p = Path(line)
-            if p.suffix != ".md":
-                continue
-            try:
-                if not p.is_absolute():
-                    p = (VAULT_PATH / p).resolve()
-                if p.exists() and str(VAULT_PATH) in str(p.resolve()):
-                    paths.append(p)
-            except (OSError, RuntimeError):
-                pass
-        return paths[:limit] if paths else []
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        return []
+
+def retrieve_seeds(query: str, limit: int = 20, rank: str = "keyword") -> List[Path]:
+    """Retrieve seed notes for a query using the chosen ranking strategy."""
+    if rank == "bm25":
+        return search_vault_bm25(query, limit=limit)
+    return search_vault_keyword(query, limit=limit)
 
 
 def read_note(path: Path) -> Optional[Dict]:
-    """Read and parse a note file."""
-    try:
-        content = path.read_text(encoding="utf-8")
-        body = content
-        fm_match = re.match(r"^---\s*\n.*?\n---\s*\n", content, re.DOTALL)
-        if fm_match:
-            body = content[fm_match.end() :]
-        wikilinks = re.findall(r"\[\[([^\]]+)\]\]", body)
-        return {
-            "path": path,
-            "relative_path": str(path.relative_to(VAULT_PATH)),
-            "title": path.stem,
-            "content": body,
-            "wikilinks": wikilinks,
-        }
-    except Exception:
-        return None
+    """Read and parse a note file (memoized via the shared note store)."""
+    return get_store().get(path)
 
 
 def expand_via_graph(
@@ -95,8 +54,14 @@ def expand_via_graph(
     all_files: List[Path],
     depth: int = 1,
     max_extra: int = 10,
+    weights: Optional[Dict[str, float]] = None,
 ) -> List[Path]:
-    """Expand retrieval via wikilink graph (LightRAG-style local context)."""
+    """Expand retrieval via wikilink graph (LightRAG-style local context).
+
+    When `weights` (vault-relative path -> score, e.g. PageRank) is given,
+    neighbours are visited most important first, so truncation keeps the
+    central notes rather than whichever links appeared first.
+    """
     seen_resolved: Set[Path] = {p.resolve() for p in seed_paths}
     result: List[Path] = list(seed_paths)
     title_to_path: Dict[str, Path] = {}
@@ -117,7 +82,9 @@ def expand_via_graph(
                 if cand and cand.resolve() not in seen_resolved:
                     seen_resolved.add(cand.resolve())
                     next_batch.append(cand)
-                    result.append(cand)
+        if weights:
+            next_batch.sort(key=lambda c: -weights.get(c.relative_to(VAULT_PATH).as_posix(), 0.0))
+        result.extend(next_batch)
         current = next_batch[:max_extra]
         if not current:
             break
@@ -129,23 +96,24 @@ def build_context(
     paths: List[Path],
     mode: str,
     query: str,
+    budget: int = MAX_CONTEXT_TOKENS,
 ) -> str:
-    """Build context string for LLM from retrieved notes."""
-    parts = []
-    total = 0
-    for p in paths:
+    """Build context string for LLM from retrieved notes.
+
+    Passages most relevant to the query (weighted by retrieval rank) are
+    packed into `budget` tokens, a few per note.
+    """
+    docs = []
+    for rank, p in enumerate(paths):
         note = read_note(p)
         if not note or len(note["content"].strip()) < 20:
             continue
-        excerpt = note["content"][:MAX_CHARS_PER_NOTE]
-        if len(note["content"]) > MAX_CHARS_PER_NOTE:
-            excerpt += "\n[... truncated ...]"
-        block = f"---\n**[[{note['title']}]]** ({note['relative_path']})\n\n{excerpt}"
-        if total + len(block) > MAX_TOTAL_CONTEXT:
-            break
-        parts.append(block)
-        total += len(block)
-    return "\n\n".join(parts)
+        docs.append({
+            "header": f"---\n**[[{note['title']}]]** ({note['relative_path']})",
+            "text": note["content"],
+            "weight": 1.0 / (1 + RANK_DECAY * rank),
+        })
+    return pack(docs, budget, query=query, per_note=MAX_PASSAGES_PER_NOTE, separator="\n\n")
 
 
 RAG_SYSTEM_PROMPT = """You are a retrieval-augmented assistant querying a personal knowledge base (Obsidian vault).
@@ -180,6 +148,7 @@ Examples:
   python3 _scripts/rag_query.py "Summarize my notes on habits" --mode hybrid
   python3 _scripts/rag_query.py "Key insights on productivity" --save
   python3 _scripts/rag_query.py "Connections between X and Y" --top-k 15
+  python3 _scripts/rag_query.py "agent memory design" --rank bm25 --top-k 6
 """,
     )
     parser.add_argument("query", type=str, help="Question to answer from vault content")
@@ -196,6 +165,13 @@ Examples:
         default=12,
         help="Max number of notes to retrieve (default: 12)",
     )
+    parser.add_argument(
+        "--rank",
+        type=str,
+        choices=["keyword", "bm25"],
+        default="keyword",
+        help="Seed ranking: exact phrase match or BM25 relevance (default: keyword)",
+    )
     parser.add_argument(
         "--depth",
         type=int,
@@ -214,27 +190,15 @@ Examples:
             script_name="rag_query.py",
             operation_type="rag_query",
             status="in_progress",
-            metrics={"query": args.query[:50], "mode": args.mode},
+            metrics={"query": args.query[:50], "mode": args.mode, "rank": args.rank},
         )
 
     print("🔍 RAG Query (LightRAG-inspired)")
     print(f"   Query: {args.query}")
-    print(f"   Mode: {args.mode}")
+    print(f"   Mode: {args.mode} | Rank: {args.rank}")
 
     all_files = find_markdown_files()
-    seed_paths = search_vault_keyword(args.query, limit=args.top_k)
-
-    if not seed_paths:
-        # Fallback: scan all files for keyword
-        query_lower = args.query.lower()
-        for f in all_files:
-            if len(seed_paths) >= args.top_k:
-                break
-            try:
-                if query_lower in f.read_text(encoding="utf-8").lower():
-                    seed_paths.append(f)
-            except Exception:
-                pass
+    seed_paths = retrieve_seeds(args.query, limit=args.top_k, rank=args.rank)
 
     if not seed_paths:
         print("❌ No matching notes found.")
@@ -256,6 +220,7 @@ Examples:
             all_files,
             depth=args.depth,
             max_extra=max(5, args.top_k // 2),
+            weights=pagerank_weights(),
         )
         paths = list(expanded)[: args.top_k * 2]
     else:
@@ -277,7 +242,10 @@ Examples:
         print(f"   - {rel}")
 
     print("\n🧠 Generating response...")
-    response = summarize(user_message, RAG_SYSTEM_PROMPT)
+    print("\n" + "=" * 60)
+    stream_stats = {}
+    response = "".join(summarize_stream(user_message, RAG_SYSTEM_PROMPT, stats=stream_stats)).strip()
+    print("=" * 60)
 
     if args.save:
         date_str = datetime.now().strftime("%Y-%m-%d")
@@ -286,10 +254,6 @@ Examples:
         save_note(save_path, content)
         print(f"\n💾 Saved to: {save_path}")
 
-    print("\n" + "=" * 60)
-    print(response)
-    print("=" * 60)
-
     if TRACKER:
         TRACKER.record_operation(
             script_name="rag_query.py",
@@ -298,6 +262,7 @@ Examples:
             metrics={
                 "mode": args.mode,
                 "notes_retrieved": len(paths),
+                "first_token_s": stream_stats.get("first_token_s"),
             },
         )
 
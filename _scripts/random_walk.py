@@ -7,124 +7,121 @@ discovering unexpected connections.
 
 import argparse
 import random
-import re
 import sys
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 # Add parent for config
 sys.path.insert(0, str(Path(__file__).parent))
 from config import summarize, save_note, VAULT_PATH, TRACKER
+from note_store import get_store
+from link_graph import get_link_graph
+from vault_index import get_index
 
 
-def find_markdown_files() -> List[Path]:
-    """Find all markdown files in the vault, excluding hidden directories."""
-    markdown_files = []
-    
-    # Directories to exclude
-    exclude_dirs = {'.git', '.obsidian', '.claude', '.cursor', '_scripts', '_org', '_logs', '.ruff_cache'}
-    
-    for item in VAULT_PATH.iterdir():
-        if item.is_dir():
-            if item.name in exclude_dirs:
-                continue
-            # Recursively search subdirectories
-            for md_file in item.rglob('*.md'):
-                markdown_files.append(md_file)
-        elif item.suffix == '.md':
-            markdown_files.append(item)
-    
-    return markdown_files
+# Notes at or below this many words are skipped as walk material
+MIN_WORDS = 50
 
 
-def extract_wikilinks(content: str) -> List[str]:
-    """Extract [[wikilink]] targets from markdown content."""
-    pattern = r'\[\[([^\]]+)\]\]'
-    return re.findall(pattern, content)
+def read_note_content(file_path: Path) -> Optional[Dict]:
+    """Read and parse a note file (memoized via the shared note store)."""
+    return get_store().get(file_path)
 
 
-def extract_tags(content: str) -> List[str]:
-    """Extract #tags from markdown content."""
-    pattern = r'#([a-zA-Z_][a-zA-Z0-9_-]*)'
-    return re.findall(pattern, content)
+def _load(rel: str) -> Optional[Dict]:
+    return read_note_content(VAULT_PATH / rel)
 
 
-def read_note_content(file_path: Path) -> Dict:
-    """Read and parse a note file."""
-    try:
-        content = file_path.read_text(encoding='utf-8')
-        
-        # Remove frontmatter if present
-        body = content
-        fm_match = re.match(r'^---\s*\n.*?\n---\s*\n', content, re.DOTALL)
-        if fm_match:
-            body = content[fm_match.end():]
-        
-        return {
-            'path': file_path,
-            'relative_path': str(file_path.relative_to(VAULT_PATH)),
-            'title': file_path.stem,
-            'content': body,
-            'full_content': content,
-            'wikilinks': extract_wikilinks(body),
-            'tags': extract_tags(body),
-            'word_count': len(body.split())
-        }
-    except Exception as e:
-        return None
+def topic_notes(topic: str) -> List[str]:
+    """Vault-relative paths of notes whose title or content mentions `topic`."""
+    graph = get_link_graph()
+    needle = topic.lower()
+    matches = {n for n in graph.nodes if needle in Path(n).stem.lower()}
+    for path in get_index().search(topic, limit=len(graph.nodes) or 1):
+        matches.add(path.relative_to(VAULT_PATH).as_posix())
+    return sorted(matches)
 
 
 def select_random_notes(count: int = 5, topic: Optional[str] = None) -> List[Dict]:
-    """Select random notes from the vault."""
-    all_files = find_markdown_files()
-    notes = []
-    
-    for file_path in all_files:
-        note = read_note_content(file_path)
-        if note and note['word_count'] > 50:  # Skip very short notes
-            if topic:
-                # Filter by topic if provided
-                combined = (note['title'] + ' ' + note['content']).lower()
-                if topic.lower() in combined:
-                    notes.append(note)
-            else:
-                notes.append(note)
-    
-    if not notes:
-        return []
-    
-    # Select random notes
-    selected = random.sample(notes, min(count, len(notes)))
+    """Select random notes from the vault.
+
+    Candidates come from the cached link graph's word counts (and the search
+    index for a topic), so only the selected notes are read.
+    """
+    graph = get_link_graph()
+    pool = topic_notes(topic) if topic else graph.nodes
+    eligible = [n for n in pool if graph.word_counts.get(n, 0) > MIN_WORDS]
+
+    selected = []
+    for rel in random.sample(eligible, min(count, len(eligible))):
+        note = _load(rel)
+        if note:
+            selected.append(note)
     return selected
 
 
 def trace_connection_path(start_note: Dict, max_depth: int = 3) -> List[Dict]:
     """Trace a path through linked notes starting from a given note."""
+    graph = get_link_graph()
     path = [start_note]
-    current_note = start_note
-    
-    all_notes = {n['title']: n for n in [read_note_content(f) for f in find_markdown_files()] if n}
-    
+    visited = {start_note['relative_path']}
+    current = start_note['relative_path']
+
     for _ in range(max_depth):
-        if not current_note['wikilinks']:
-            break
-        
-        # Filter to links that exist in our vault
-        valid_links = [link for link in current_note['wikilinks'] if link in all_notes and link not in [n['title'] for n in path]]
-        
+        valid_links = [n for n in graph.outgoing(current) if n not in visited]
         if not valid_links:
             break
-        
+
         # Pick a random valid link
-        next_title = random.choice(valid_links)
-        next_note = all_notes[next_title]
+        current = random.choice(valid_links)
+        next_note = _load(current)
+        if not next_note:
+            break
+        visited.add(current)
         path.append(next_note)
-        current_note = next_note
-    
+
     return path
 
 
+def biased_walks(
+    seeds: List[str],
+    walks: int = 500,
+    max_depth: int = 3,
+    restart: float = 0.15,
+    top: int = 3,
+) -> List[Tuple[List[str], int]]:
+    """Random walks with restart from seed notes; most-visited paths first.
+
+    Each walk starts at a random seed and follows outgoing links, stopping on
+    restart (probability `restart` per step), a dead end, or `max_depth`.
+    Visit frequencies approximate personalized PageRank around the seeds, so
+    the most common paths are the strongest trails out of the topic.
+    """
+    graph = get_link_graph()
+    seeds = [s for s in seeds if s in graph.word_counts]
+    if not seeds:
+        return []
+
+    counts: Counter = Counter()
+    for _ in range(walks):
+        current = random.choice(seeds)
+        trail = [current]
+        for _ in range(max_depth):
+            if random.random() < restart:
+                break
+            options = [n for n in graph.outgoing(current) if n not in trail]
+            if not options:
+                break
+            current = random.choice(options)
+            trail.append(current)
+        if len(trail) > 1:
+            counts[tuple(trail)] += 1
+
+    return [(list(trail), n) for trail, n in counts.most_common(top)]
+
+
 def build_research_prompt(notes: List[Dict], path: List[Dict], topic: Optional[str]) -> str:
     """Build the prompt for the AI research assistant."""
     notes_text = "\n\n---\n\n".join(
@@ -202,6 +199,7 @@ Examples:
   /skill random-walk --count 10         # Explore 10 random notes
   /skill random-walk --topic "AI"       # Random walk focused on AI topic
   /skill random-walk --save             # Save research exploration note
+  /skill random-walk --topic "AI" --biased  # Follow the most-visited trails from AI notes
 """
     )
     
@@ -225,6 +223,19 @@ Examples:
         help="Save research exploration note to vault"
     )
     
+    parser.add_argument(
+        "--biased",
+        action="store_true",
+        help="Trace the most-visited path of many random walks with restart from the topic (or first note)"
+    )
+
+    parser.add_argument(
+        "--walks",
+        type=int,
+        default=500,
+        help="Number of walks to sample in --biased mode (default: 500)"
+    )
+
     args = parser.parse_args()
     
     if TRACKER:
@@ -259,7 +270,17 @@ Examples:
     # Trace a connection path from the first note
     print("\n🔍 Tracing connection path...")
     start_note = random_notes[0]
-    connection_path = trace_connection_path(start_note)
+    connection_path = [start_note]
+    if args.biased:
+        seeds = topic_notes(args.topic) if args.topic else [start_note['relative_path']]
+        trails = biased_walks(seeds, walks=args.walks)
+        for trail, visits in trails:
+            print(f"  {visits:4d} visits: " + " → ".join(f"[[{Path(n).stem}]]" for n in trail))
+        if trails:
+            notes = [_load(n) for n in trails[0][0]]
+            connection_path = [n for n in notes if n]
+    else:
+        connection_path = trace_connection_path(start_note)
     
     if len(connection_path) > 1:
         path_str = " → ".join(f"[[{n['title']}]]" for n in connection_path)
@@ -295,6 +316,7 @@ Examples:
                 "topic": args.topic,
                 "notes_found": len(random_notes),
                 "path_length": len(connection_path),
+                "biased": args.biased,
             },
         )
 
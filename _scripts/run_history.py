@@ -0,0 +1,313 @@
+"""Run History - One indexed store for every skill and script run.
+
+The _org ExecutionEngine, pipeline.run_skill, scheduler.run_task and
+ai_brief.run_script launch child processes and used to leave at most a log
+file behind. Each run now lands in one SQLite table with:
+- skill (the name it was launched as), script and source (who launched it)
+- start time, duration and exit code
+- peak RSS and bytes written, from the child's own resource usage
+- where its profile was written, when profiling is on (run_profiler.py)
+
+Skill health and analysis reports query this store instead of scanning log
+files. Recording never fails a run: store errors only print a warning.
+
+Usage:
+  python3 _scripts/run_history.py                    # Per-skill summary, last 30 days
+  python3 _scripts/run_history.py --skill arxiv      # Recent runs of one skill
+  python3 _scripts/run_history.py --days 7 --failed  # Failed runs this week
+"""
+
+import argparse
+import os
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# pipeline.py and scheduler.py avoid config (and its dotenv load), so this
+# module resolves the vault the same way they do
+VAULT_PATH = Path(__file__).resolve().parent.parent
+RUN_HISTORY_PATH = VAULT_PATH / "_logs" / "run_history.db"
+RUN_HISTORY_VERSION = 2  # 2: profile column (run_profiler.py)
+
+# ru_maxrss is bytes on macOS, kilobytes on Linux
+RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+# ru_oublock counts 512-byte blocks written
+BLOCK_SIZE = 512
+
+
+def run_measured(cmd: Sequence[str], timeout: Optional[float] = None,
+                 **kwargs) -> Tuple[subprocess.CompletedProcess, Dict]:
+    """subprocess.run that also reports the child's peak RSS and bytes written.
+
+    Takes the same keyword arguments as subprocess.run (capture_output,
+    text, cwd, stdout, ...) and raises TimeoutExpired the same way. The
+    child is reaped with os.wait4 to read its own resource usage; where
+    that is unavailable (Windows) the usage values are None.
+    """
+    if not hasattr(os, "wait4"):
+        return subprocess.run(cmd, timeout=timeout, **kwargs), {"peak_rss": None, "bytes_written": None}
+
+    if kwargs.pop("capture_output", False):
+        kwargs["stdout"] = kwargs["stderr"] = subprocess.PIPE
+    output: Dict[str, object] = {}
+    waited: Dict[str, tuple] = {}
+
+    with subprocess.Popen(cmd, **kwargs) as proc:
+        # Drain pipes in threads so a chatty child can't block on a full pipe
+        readers = [
+            threading.Thread(target=lambda n=name, s=stream: output.__setitem__(n, s.read()), daemon=True)
+            for name, stream in (("stdout", proc.stdout), ("stderr", proc.stderr)) if stream
+        ]
+        for reader in readers:
+            reader.start()
+        waiter = threading.Thread(target=lambda: waited.update(result=os.wait4(proc.pid, 0)), daemon=True)
+        waiter.start()
+        waiter.join(timeout)
+        if waiter.is_alive():
+            proc.kill()
+            waiter.join()
+            for reader in readers:
+                reader.join()
+            proc.returncode = -9
+            raise subprocess.TimeoutExpired(cmd, timeout, output.get("stdout"), output.get("stderr"))
+        _, status, usage = waited["result"]
+        # Popen must not wait() for a child we already reaped
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        for reader in readers:
+            reader.join()
+
+    completed = subprocess.CompletedProcess(cmd, proc.returncode, output.get("stdout"), output.get("stderr"))
+    return completed, {"peak_rss": usage.ru_maxrss * RSS_UNIT, "bytes_written": usage.ru_oublock * BLOCK_SIZE}
+
+
+def script_from_command(cmd: Sequence[str]) -> Optional[str]:
+    """The .py file a command runs (e.g. "arxiv_digest.py"), if any."""
+    return next((Path(arg).name for arg in cmd if arg.endswith(".py")), None)
+
+
+class RunStore:
+    """SQLite table of runs, indexed by skill, script and start time."""
+
+    def __init__(self, db_path: Path = RUN_HISTORY_PATH):
+        self.conn: Optional[sqlite3.Connection] = None
+        try:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(db_path), timeout=30)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                """CREATE TABLE IF NOT EXISTS runs (
+                    id INTEGER PRIMARY KEY,
+                    skill TEXT NOT NULL,
+                    script TEXT,
+                    source TEXT NOT NULL,
+                    started TEXT NOT NULL,
+                    duration REAL NOT NULL,
+                    exit_code INTEGER,
+                    peak_rss INTEGER,
+                    bytes_written INTEGER,
+                    command TEXT,
+                    profile TEXT
+                )"""
+            )
+            if self.conn.execute("PRAGMA user_version").fetchone()[0] < 2:
+                columns = {row[1] for row in self.conn.execute("PRAGMA table_info(runs)")}
+                if "profile" not in columns:
+                    self.conn.execute("ALTER TABLE runs ADD COLUMN profile TEXT")
+            self.conn.execute(f"PRAGMA user_version = {RUN_HISTORY_VERSION}")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS runs_started ON runs (started)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS runs_skill ON runs (skill, started)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS runs_script ON runs (script, started)")
+            self.conn.commit()
+        except sqlite3.Error as e:
+            print(f"Warning: Run history unavailable: {e}")
+            self.conn = None
+
+    def record(
+        self,
+        skill: str,
+        source: str,
+        started: datetime,
+        duration: float,
+        exit_code: Optional[int],
+        peak_rss: Optional[int] = None,
+        bytes_written: Optional[int] = None,
+        script: Optional[str] = None,
+        command: Optional[Sequence[str]] = None,
+        profile: Optional[str] = None,
+    ) -> Optional[int]:
+        """Store one run. Returns its id, or None if it couldn't be stored.
+
+        `profile` is the vault-relative base path of the run's profile files.
+        """
+        if self.conn is None:
+            return None
+        try:
+            with self.conn:
+                cursor = self.conn.execute(
+                    "INSERT INTO runs (skill, script, source, started, duration, exit_code, "
+                    "peak_rss, bytes_written, command, profile) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (skill, script, source, started.isoformat(timespec="seconds"), round(duration, 3),
+                     exit_code, peak_rss, bytes_written, " ".join(command) if command else None, profile),
+                )
+            return cursor.lastrowid
+        except sqlite3.Error as e:
+            print(f"Warning: Failed to record run: {e}")
+            return None
+
+    def runs(
+        self,
+        skill: Optional[str] = None,
+        script: Optional[str] = None,
+        source: Optional[str] = None,
+        days: Optional[int] = None,
+        failed_only: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[Dict]:
+        """Runs matching every given filter, newest first."""
+        if self.conn is None:
+            return []
+        clauses, params = [], []
+        for column, value in (("skill", skill), ("script", script), ("source", source)):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if days is not None:
+            clauses.append("started >= ?")
+            params.append(since(days))
+        if failed_only:
+            clauses.append("(exit_code IS NULL OR exit_code != 0)")
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"SELECT * FROM runs {where} ORDER BY started DESC, id DESC"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        self.conn.row_factory = sqlite3.Row
+        try:
+            return [dict(row) for row in self.conn.execute(sql, params)]
+        finally:
+            self.conn.row_factory = None
+
+    def history_by_script(self, days: int = 30) -> Dict[str, List[Dict]]:
+        """Runs from the last N days grouped by script name, newest first."""
+        history: Dict[str, List[Dict]] = {}
+        for run in self.runs(days=days):
+            if run["script"]:
+                history.setdefault(run["script"], []).append(run)
+        return history
+
+    def summary(self, days: Optional[int] = None) -> List[Dict]:
+        """Per-skill run counts, failures, durations and resource peaks."""
+        if self.conn is None:
+            return []
+        where, params = ("WHERE started >= ?", (since(days),)) if days is not None else ("", ())
+        rows = self.conn.execute(
+            f"""SELECT skill, COUNT(*), SUM(exit_code IS NULL OR exit_code != 0), AVG(duration),
+                       MAX(duration), MAX(peak_rss), SUM(bytes_written), MAX(started)
+                FROM runs {where} GROUP BY skill ORDER BY skill""",
+            params,
+        ).fetchall()
+        keys = ("skill", "runs", "failed", "avg_duration", "max_duration",
+                "max_peak_rss", "bytes_written", "last_run")
+        return [dict(zip(keys, row)) for row in rows]
+
+
+def since(days: int) -> str:
+    """ISO start time of a window of the last N days."""
+    return (datetime.now() - timedelta(days=days)).isoformat(timespec="seconds")
+
+
+def record_run(skill: str, source: str, started: datetime, duration: float,
+               exit_code: Optional[int], **fields) -> Optional[int]:
+    """Store one run in the shared run history (see RunStore.record)."""
+    return RunStore().record(skill, source, started, duration, exit_code, **fields)
+
+
+def run_recorded(cmd: Sequence[str], skill: str, source: str, timeout: Optional[float] = None,
+                 profile: Optional[bool] = None, **kwargs) -> subprocess.CompletedProcess:
+    """Run a command with run_measured and record it in the run history.
+
+    Timeouts and launch failures are recorded with exit code -1 and re-raised.
+    With profile=True (default: the VAULT_PROFILE environment variable) a
+    Python script runs under run_profiler and its profile path is recorded.
+    """
+    from run_profiler import profile_stem, profiling_enabled, stored_path, wrap_command
+
+    run_cmd, stem = cmd, None
+    if profile if profile is not None else profiling_enabled():
+        stem = profile_stem(skill)
+        run_cmd = wrap_command(cmd, stem)
+        if run_cmd is None:
+            run_cmd, stem = cmd, None
+
+    started = datetime.now()
+    start = time.perf_counter()
+    usage: Dict = {}
+    exit_code = -1
+    try:
+        completed, usage = run_measured(run_cmd, timeout=timeout, **kwargs)
+        exit_code = completed.returncode
+        return completed
+    finally:
+        record_run(
+            skill, source, started, time.perf_counter() - start, exit_code,
+            peak_rss=usage.get("peak_rss"), bytes_written=usage.get("bytes_written"),
+            script=script_from_command(cmd), command=cmd,
+            profile=stored_path(stem) if stem else None,
+        )
+
+
+def format_bytes(n: Optional[int]) -> str:
+    if n is None:
+        return "-"
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:.0f}{unit}" if unit == "B" else f"{n:.1f}{unit}"
+        n /= 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run History - recorded skill and script runs",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python3 _scripts/run_history.py                    # Per-skill summary, last 30 days
+  python3 _scripts/run_history.py --skill arxiv      # Recent runs of one skill
+  python3 _scripts/run_history.py --days 7 --failed  # Failed runs this week
+""",
+    )
+    parser.add_argument("--days", type=int, default=30, help="Look back N days (default: 30)")
+    parser.add_argument("--skill", help="List runs of this skill")
+    parser.add_argument("--failed", action="store_true", help="List failed runs")
+    parser.add_argument("--limit", "-n", type=int, default=20, help="Max runs to list (default: 20)")
+    args = parser.parse_args()
+
+    store = RunStore()
+    if args.skill or args.failed:
+        runs = store.runs(skill=args.skill, days=args.days, failed_only=args.failed, limit=args.limit)
+        print(f"{'Started':<20} {'Skill':<24} {'Source':<10} {'Exit':>5} {'Duration':>9} {'Peak RSS':>9} {'Written':>9}")
+        for run in runs:
+            print(f"{run['started']:<20} {run['skill'][:24]:<24} {run['source']:<10} "
+                  f"{run['exit_code'] if run['exit_code'] is not None else '-':>5} {run['duration']:>8.1f}s "
+                  f"{format_bytes(run['peak_rss']):>9} {format_bytes(run['bytes_written']):>9}")
+        if not runs:
+            print("No matching runs.")
+        return
+
+    rows = store.summary(args.days)
+    if not rows:
+        print(f"No runs recorded in the last {args.days} days.")
+        return
+    print(f"Runs in the last {args.days} days\n")
+    print(f"{'Skill':<24} {'Runs':>5} {'Failed':>6} {'Avg':>8} {'Max':>8} {'Peak RSS':>9} {'Last run':<20}")
+    for row in rows:
+        print(f"{row['skill'][:24]:<24} {row['runs']:>5} {row['failed']:>6} {row['avg_duration']:>7.1f}s "
+              f"{row['max_duration']:>7.1f}s {format_bytes(row['max_peak_rss']):>9} {row['last_run']:<20}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""Run Profiler - Opt-in cProfile and tracemalloc for skill and script runs.
+
+When a scheduled run is slow, the run history says how long it took but not
+where the time went. With profiling on, each Python script launched through
+run_history.run_recorded (pipeline, scheduler, AI brief) or the _org
+ScriptRunner runs under this module's `exec` wrapper instead:
+- cProfile records time per function (imports, vault scans, HTTP, LLM calls),
+  in every thread: summarize_many / summarize_long run their API calls in
+  thread pools, and those threads get their own profiler, merged into the
+  run's .pstats (Python 3.12+ profiles all threads natively)
+- tracemalloc records peak Python heap and the largest live allocation sites
+Results go to _logs/profiles/<skill>_<timestamp>.pstats and .mem.json, and
+the path is stored with the run in the run history.
+
+Turn it on with VAULT_PROFILE=1, or --profile on pipeline.py, scheduler.py
+run and the _org workflow commands. tracemalloc slows Python-heavy code
+noticeably, so keep it off for normal runs.
+
+Usage:
+  VAULT_PROFILE=1 python3 _scripts/pipeline.py arxiv hn
+  python3 _scripts/run_profiler.py report                        # Profiled runs, last 30 days
+  python3 _scripts/run_profiler.py report --skill arxiv --top 40
+"""
+
+import argparse
+import cProfile
+import json
+import os
+import pstats
+import re
+import runpy
+import sys
+import threading
+import time
+import tracemalloc
+import traceback
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+# Add parent for run_history
+sys.path.insert(0, str(Path(__file__).parent))
+from run_history import RunStore, VAULT_PATH, format_bytes
+
+PROFILES_DIR = VAULT_PATH / "_logs" / "profiles"
+# Frames kept per allocation; 1 is enough to name the allocating line
+TRACEMALLOC_FRAMES = 1
+TOP_ALLOCATIONS = 15
+
+
+def profiling_enabled() -> bool:
+    """True when VAULT_PROFILE is set to 1/on/true/yes."""
+    return os.getenv("VAULT_PROFILE", "").strip().lower() in ("1", "on", "true", "yes")
+
+
+def profile_stem(skill: str) -> Path:
+    """Base path (no suffix) for a new run's profile files."""
+    safe = re.sub(r"[^\w-]", "_", skill)
+    return PROFILES_DIR / f"{safe}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+
+
+def wrap_command(cmd: Sequence[str], stem: Path) -> Optional[List[str]]:
+    """Rewrite `python [opts] script.py args` to run under this profiler.
+
+    Returns None for commands that don't run a .py script.
+    """
+    cmd = list(cmd)
+    index = next((i for i, arg in enumerate(cmd) if arg.endswith(".py")), None)
+    if not index:
+        return None
+    return cmd[:index] + [str(Path(__file__).resolve()), "exec", str(stem)] + cmd[index:]
+
+
+class ThreadProfilers:
+    """One cProfile.Profile per thread started while profiling is on.
+
+    Before Python 3.12 a Profile only sees the thread that enabled it, so
+    work done in thread pools (summarize_many, summarize_long) would show up
+    only as the main thread waiting on futures. threading.setprofile runs
+    _start first thing in each new thread, which swaps in its own profiler.
+    From 3.12 cProfile already covers every thread and this does nothing.
+    """
+
+    def __init__(self):
+        self.needed = sys.version_info < (3, 12)
+        self.profilers: List[cProfile.Profile] = []
+        self._lock = threading.Lock()
+
+    def _start(self, frame, event, arg):
+        profiler = cProfile.Profile()
+        with self._lock:
+            self.profilers.append(profiler)
+        profiler.enable()
+
+    def install(self):
+        if self.needed:
+            threading.setprofile(self._start)
+
+    def uninstall(self):
+        if self.needed:
+            threading.setprofile(None)
+
+    def merge_into(self, stats: pstats.Stats) -> pstats.Stats:
+        with self._lock:
+            profilers = list(self.profilers)
+        for profiler in profilers:
+            # A thread still running has its finished calls recorded so far
+            profiler.create_stats()
+            if profiler.stats:
+                stats.add(profiler)
+        return stats
+
+
+def exec_script(stem: Path, script: str, args: Sequence[str]) -> int:
+    """Run a script as __main__ under cProfile and tracemalloc; returns its exit code."""
+    script_path = Path(script).resolve()
+    sys.argv = [str(script_path), *args]
+    sys.path[0] = str(script_path.parent)
+
+    tracemalloc.start(TRACEMALLOC_FRAMES)
+    profiler = cProfile.Profile()
+    threads = ThreadProfilers()
+    exit_code = 0
+    start = time.perf_counter()
+    try:
+        threads.install()
+        profiler.enable()
+        runpy.run_path(str(script_path), run_name="__main__")
+    except SystemExit as e:
+        if isinstance(e.code, int) or e.code is None:
+            exit_code = e.code or 0
+        else:
+            print(e.code, file=sys.stderr)
+            exit_code = 1
+    except BaseException:
+        traceback.print_exc()
+        exit_code = 1
+    finally:
+        profiler.disable()
+        threads.uninstall()
+        wall = time.perf_counter() - start
+        current, peak = tracemalloc.get_traced_memory()
+        # Largest allocations still live at exit (tracemalloc can't snapshot the peak itself)
+        top = tracemalloc.take_snapshot().statistics("lineno")[:TOP_ALLOCATIONS]
+        tracemalloc.stop()
+        stem.parent.mkdir(parents=True, exist_ok=True)
+        threads.merge_into(pstats.Stats(profiler)).dump_stats(str(stem.with_suffix(".pstats")))
+        memory = {
+            "script": script_path.name,
+            "args": list(args),
+            "exit_code": exit_code,
+            "wall_s": round(wall, 3),
+            "tracemalloc_peak": peak,
+            "tracemalloc_at_exit": current,
+            "top_allocations": [
+                {"where": str(stat.traceback[0]), "size": stat.size, "count": stat.count}
+                for stat in top
+            ],
+        }
+        stem.with_suffix(".mem.json").write_text(json.dumps(memory, indent=2), encoding="utf-8")
+    return exit_code
+
+
+def stored_path(stem: Path) -> str:
+    """Profile path as stored in the run history (relative to the vault)."""
+    try:
+        return stem.relative_to(VAULT_PATH).as_posix()
+    except ValueError:
+        return str(stem)
+
+
+def report(skill: Optional[str] = None, days: int = 30, top: int = 25, sort: str = "cumulative") -> int:
+    """Print profiled runs and their merged top functions. Returns runs merged."""
+    runs = [r for r in RunStore().runs(skill=skill, days=days) if r.get("profile")]
+    files = []
+    print(f"{'Started':<20} {'Skill':<24} {'Exit':>5} {'Duration':>9} {'Peak RSS':>9} {'Py peak':>9}")
+    for run in runs:
+        stem = VAULT_PATH / run["profile"]
+        pstats_path = stem.with_suffix(".pstats")
+        if not pstats_path.exists():
+            continue
+        files.append(str(pstats_path))
+        memory = {}
+        mem_path = stem.with_suffix(".mem.json")
+        if mem_path.exists():
+            memory = json.loads(mem_path.read_text(encoding="utf-8"))
+        print(f"{run['started']:<20} {run['skill'][:24]:<24} "
+              f"{run['exit_code'] if run['exit_code'] is not None else '-':>5} {run['duration']:>8.1f}s "
+              f"{format_bytes(run['peak_rss']):>9} {format_bytes(memory.get('tracemalloc_peak')):>9}")
+
+    if not files:
+        print("No profiled runs found. Run with VAULT_PROFILE=1 (or --profile) first.")
+        return 0
+
+    print(f"\nTop {top} functions by {sort} time across {len(files)} run(s):\n")
+    stats = pstats.Stats(*files)
+    stats.sort_stats(sort).print_stats(top)
+    return len(files)
+
+
+def main():
+    # The runners invoke `exec STEM script.py args...`; pass the script's
+    # arguments through untouched rather than through argparse
+    if len(sys.argv) >= 4 and sys.argv[1] == "exec":
+        sys.exit(exec_script(Path(sys.argv[2]), sys.argv[3], sys.argv[4:]))
+
+    parser = argparse.ArgumentParser(
+        description="Run Profiler - where profiled skill runs spent their time",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  VAULT_PROFILE=1 python3 _scripts/pipeline.py arxiv hn          # Profile a pipeline
+  python3 _scripts/scheduler.py run --profile                    # Profile due tasks
+  python3 _scripts/run_profiler.py report                        # Profiled runs, last 30 days
+  python3 _scripts/run_profiler.py report --skill arxiv --top 40
+  python3 _scripts/run_profiler.py report --sort tottime
+""",
+    )
+    sub = parser.add_subparsers(dest="cmd")
+    p_report = sub.add_parser("report", help="Top functions across profiled runs")
+    p_report.add_argument("--skill", help="Only runs of this skill")
+    p_report.add_argument("--days", type=int, default=30, help="Look back N days (default: 30)")
+    p_report.add_argument("--top", type=int, default=25, help="Functions to list (default: 25)")
+    p_report.add_argument("--sort", default="cumulative", choices=["cumulative", "tottime", "calls"],
+                          help="Sort key (default: cumulative)")
+    args = parser.parse_args()
+
+    if args.cmd != "report":
+        parser.print_help()
+        return
+    report(args.skill, args.days, args.top, args.sort)
+
+
+if __name__ == "__main__":
+    main()
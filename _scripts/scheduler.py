@@ -6,12 +6,16 @@ Uses launchd on macOS for periodic execution. Supports daily, weekly, and cron s
 
 import argparse
 import json
+import os
 import platform
 import subprocess
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from run_history import run_recorded
+
 VAULT_ROOT = Path(__file__).resolve().parent.parent
 CONFIG_DIR = VAULT_ROOT / "_config"
 SCHEDULE_JSON = CONFIG_DIR / "schedule.json"
@@ -192,8 +196,12 @@ def run_task(task: dict) -> bool:
     target_type = task.get("target_type", "skill")
     task_id = task.get("id", "unknown")
 
+    # A pipeline profiles its own skills (VAULT_PROFILE is inherited), so
+    # only direct skill commands are wrapped here
+    profile = None
     if target_type == "pipeline":
         cmd = ["python3", str(VAULT_ROOT / "_scripts" / "pipeline.py"), "--run", target]
+        profile = False
     else:
         skills_json = VAULT_ROOT / ".claude" / "skills.json"
         if not skills_json.exists():
@@ -214,8 +222,11 @@ def run_task(task: dict) -> bool:
 
     try:
         with open(log_file, "w", encoding="utf-8") as lf:
-            proc = subprocess.run(
+            proc = run_recorded(
                 cmd,
+                skill=target,
+                source="scheduler",
+                profile=profile,
                 cwd=str(VAULT_ROOT),
                 stdout=lf,
                 stderr=subprocess.STDOUT,
@@ -408,6 +419,7 @@ Examples:
   scheduler list
   scheduler remove daily-curation
   scheduler run
+  scheduler run --profile        # Profile due tasks (see run_profiler.py report)
   scheduler install
 """,
     )
@@ -439,6 +451,8 @@ Examples:
     p_run.add_argument("--wake", action="store_true", help="Run overdue tasks (skip 14-min window)")
     p_run.add_argument("--notify", action="store_true", help="Send macOS notification when done")
     p_run.add_argument("--background", action="store_true", help="Run in background")
+    p_run.add_argument("--profile", action="store_true",
+                       help="Profile task runs with cProfile + tracemalloc (same as VAULT_PROFILE=1)")
     p_run.set_defaults(func=cmd_run)
 
     # wake (alias for run --wake)
@@ -457,9 +471,12 @@ Examples:
         parser.print_help()
         return 0
 
+    if getattr(args, "profile", False):
+        # Through the environment so background runs and pipelines inherit it
+        os.environ["VAULT_PROFILE"] = "1"
+
     # Background mode: spawn and return
     if args.cmd == "run" and getattr(args, "background", False):
-        import os
         cmd = [sys.executable, str(Path(__file__).resolve())]
         cmd.extend(["run", "-v"])
         if getattr(args, "wake", False):
@@ -21,6 +21,8 @@ EVOLUTION_LOG_PATH = VAULT_PATH / "_logs" / "evolution_log.json"
 LEARNING_RATE = 0.1
 ADAPTATION_THRESHOLD = 0.8
 MAX_ITERATIONS = 100
+# Operations passed to behavior analysis (full history is summarized by the stats)
+BEHAVIOR_WINDOW_DAYS = 7
 
 # Enhanced self-reflection prompt
 ENHANCED_REFLECTION_PROMPT = """You are an advanced self-evolution analyst. Analyze the 10x Distill System
@@ -435,7 +437,7 @@ class EvolutionEngine:
         script_stats = operations.get("script_statistics", {})
 
         return {
-            "operations": TRACKER.log,
+            "operations": TRACKER.get_recent_operations(BEHAVIOR_WINDOW_DAYS),
             "types": list(script_stats.keys()),
             "stats": operations
         }
@@ -445,21 +447,11 @@ class EvolutionEngine:
         if not TRACKER:
             return {"avg_response_time": 0, "success_rate": 0}
 
+        # Mean duration comes from the tracker's rollups, not a log scan
         stats = TRACKER.get_operation_statistics()
-        avg_response_time = 0
-        total_ops = stats.get("total_operations", 0)
-
-        if total_ops > 0:
-            # Calculate average response time from operations with metrics
-            response_times = []
-            for op in TRACKER.log:
-                if "response_time" in op.get("metrics", {}):
-                    response_times.append(op["metrics"]["response_time"])
-
-            avg_response_time = sum(response_times) / len(response_times) if response_times else 0
 
         return {
-            "avg_response_time": avg_response_time,
+            "avg_response_time": stats.get("duration_avg_s", 0),
             "success_rate": stats.get("success_rate", 0),
             "total_ops": stats.get("total_operations", 0),
             "failed_ops": stats.get("failed_operations", 0)
@@ -11,15 +11,24 @@ Enables the system to:
 
 import argparse
 import json
-import re
+import os
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
 from config import summarize, save_note, VAULT_PATH
+from operation_stats import OperationRollups
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are still single writes, just unlocked
+    fcntl = None
 
 # Reflection configuration
-REFLECTION_LOG_PATH = VAULT_PATH / "_logs" / "reflection_log.json"
+REFLECTION_LOG_PATH = VAULT_PATH / "_logs" / "reflection_log.jsonl"
+# Pre-JSONL log (one JSON array rewritten on every record); migrated on first use
+LEGACY_REFLECTION_LOG_PATH = VAULT_PATH / "_logs" / "reflection_log.json"
 REFLECTION_PROMPT = """You are an AI system self-reflection analyst. Given a history of system operations,
 analyze the performance and behavior of the 10x Distill System. Your analysis should include:
 
@@ -76,25 +85,92 @@ Return your response as a JSON object with the following structure:
 
 
 class SystemBehaviorTracker:
-    """Tracks system behavior and performance metrics."""
+    """Tracks system behavior and performance metrics.
+
+    Operations are appended one JSON line at a time to REFLECTION_LOG_PATH
+    under an exclusive file lock and fsynced, so recording is O(1) and
+    concurrent scripts never overwrite each other. The history is only read
+    when `log` is first accessed.
+    """
 
     def __init__(self):
         self.log_path = REFLECTION_LOG_PATH
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
-        self.log = self._load_log()
-
-    def _load_log(self) -> List[Dict]:
-        """Load existing reflection log."""
-        if self.log_path.exists():
+        self._log: Optional[List[Dict]] = None
+        self._rollups: Optional[OperationRollups] = None
+        # Start times of in-progress operations, to time their completion
+        self._started: Dict[tuple, float] = {}
+        if LEGACY_REFLECTION_LOG_PATH.exists():
+            self._migrate_legacy_log()
+
+    @property
+    def log(self) -> List[Dict]:
+        """All recorded operations, oldest first (loaded on first access)."""
+        if self._log is None:
+            self._log = self._load_log()
+        return self._log
+
+    @property
+    def rollups(self) -> OperationRollups:
+        """Per-day, per-script counters kept beside the log (opened on first use)."""
+        if self._rollups is None:
+            self._rollups = OperationRollups(self.log_path)
+        return self._rollups
+
+    def _load_log(self, offset: int = 0) -> List[Dict]:
+        """Load existing reflection log, optionally from a byte offset."""
+        entries = []
+        if not self.log_path.exists():
+            return entries
+        try:
+            with open(self.log_path, encoding="utf-8") as f:
+                f.seek(offset)
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entries.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        # A write cut short by a crash; skip it
+                        continue
+        except OSError as e:
+            print(f"Warning: Failed to load reflection log: {e}")
+        return entries
+
+    def _append(self, lines: List[str]):
+        """Append JSON lines atomically with respect to other processes."""
+        data = "".join(line + "\n" for line in lines).encode("utf-8")
+        fd = os.open(self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            os.write(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)  # also releases the lock
+
+    def _migrate_legacy_log(self):
+        """One-time move of reflection_log.json into the JSONL log."""
+        fd = os.open(self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            # Another process may have finished the migration while we waited
+            if not LEGACY_REFLECTION_LOG_PATH.exists():
+                return
             try:
-                return json.loads(self.log_path.read_text())
+                entries = json.loads(LEGACY_REFLECTION_LOG_PATH.read_text())
             except Exception as e:
-                print(f"Warning: Failed to load reflection log: {e}")
-        return []
-
-    def _save_log(self):
-        """Save reflection log to file."""
-        self.log_path.write_text(json.dumps(self.log, indent=2, default=str))
+                print(f"Warning: Failed to migrate reflection log: {e}")
+                return
+            data = "".join(json.dumps(e, default=str) + "\n" for e in entries)
+            os.write(fd, data.encode("utf-8"))
+            os.fsync(fd)
+            LEGACY_REFLECTION_LOG_PATH.rename(LEGACY_REFLECTION_LOG_PATH.with_suffix(".json.migrated"))
+            print(f"Migrated {len(entries)} operations to {self.log_path.name}")
+        finally:
+            os.close(fd)
 
     def record_operation(
         self,
@@ -104,30 +180,56 @@ class SystemBehaviorTracker:
         metrics: Optional[Dict] = None,
         error: Optional[str] = None,
     ):
-        """Record a system operation with metrics."""
+        """Record a system operation with metrics.
+
+        A completion recorded after an `in_progress` entry for the same
+        script and operation gets `duration_s` added to its metrics.
+        """
+        metrics = dict(metrics or {})
+        key = (script_name, operation_type)
+        if status == "in_progress":
+            self._started[key] = time.monotonic()
+        elif key in self._started and "duration_s" not in metrics:
+            metrics["duration_s"] = round(time.monotonic() - self._started.pop(key), 3)
         entry = {
             "timestamp": datetime.now().isoformat(),
             "script": script_name,
             "operation": operation_type,
             "status": status,
-            "metrics": metrics or {},
+            "metrics": metrics,
             "error": error,
         }
-        self.log.append(entry)
-        self._save_log()
+        try:
+            self._append([json.dumps(entry, default=str)])
+        except OSError as e:
+            print(f"Warning: Failed to record operation: {e}")
+            return
+        if self._log is not None:
+            self._log.append(entry)
+        self.rollups.refresh()
 
     def get_recent_operations(self, days: int = 7) -> List[Dict]:
         """Get operations from the past N days."""
-        cutoff = datetime.now() - timedelta(days=days)
-        return [
-            entry
-            for entry in self.log
-            if datetime.fromisoformat(entry["timestamp"]) >= cutoff
-        ]
-
-    def get_operation_statistics(self) -> Dict:
-        """Calculate system performance statistics."""
-        if not self.log:
+        # Timestamps are local ISO strings, so they compare as text
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        if self._log is not None:
+            return [entry for entry in self._log if entry["timestamp"] >= cutoff]
+        offset = self.rollups.offset_since(cutoff[:10])
+        if offset is None:
+            return [entry for entry in self.log if entry["timestamp"] >= cutoff]
+        return [entry for entry in self._load_log(offset) if entry["timestamp"] >= cutoff]
+
+    def get_operation_statistics(self, days: Optional[int] = None) -> Dict:
+        """Calculate system performance statistics (all time, or the last N days).
+
+        Answered from the per-day rollups, which also give duration
+        percentiles; falls back to scanning the log if they are unavailable.
+        """
+        stats = self.rollups.statistics(days)
+        if stats is not None:
+            return stats
+        entries = self.log if days is None else self.get_recent_operations(days)
+        if not entries:
             return {
                 "total_operations": 0,
                 "success_rate": 0,
@@ -136,12 +238,12 @@ class SystemBehaviorTracker:
                 "script_statistics": {}
             }
 
-        total = len(self.log)
-        successful = len([e for e in self.log if e["status"] == "success"])
-        failed = len([e for e in self.log if e["status"] == "failed"])
+        total = len(entries)
+        successful = len([e for e in entries if e["status"] == "success"])
+        failed = len([e for e in entries if e["status"] == "failed"])
 
         script_stats = {}
-        for entry in self.log:
+        for entry in entries:
             script = entry["script"]
             if script not in script_stats:
                 script_stats[script] = {"total": 0, "success": 0, "failed": 0}
@@ -169,7 +271,7 @@ class SelfReflectionAnalyzer:
     def generate_reflection_report(self, days: int = 7) -> str:
         """Generate comprehensive self-reflection report."""
         recent_ops = self.tracker.get_recent_operations(days)
-        stats = self.tracker.get_operation_statistics()
+        stats = self.tracker.get_operation_statistics(days)
 
         # Collect metrics from notes
         content_metrics = self._analyze_content_quality()
@@ -196,15 +298,14 @@ class SelfReflectionAnalyzer:
         note_types = {}
         total_notes = 0
 
+        # Local import: config imports this module to build TRACKER
+        from note_store import read_frontmatter
+
         for md_file in sources_dir.glob("*.md"):
             total_notes += 1
-            content = md_file.read_text(encoding="utf-8")
 
-            # Extract note type from frontmatter
-            note_type = "unknown"
-            type_match = re.search(r"^type:\s*(.+)$", content, re.MULTILINE)
-            if type_match:
-                note_type = type_match.group(1).strip()
+            # Extract note type from frontmatter (header-only read)
+            note_type = str(read_frontmatter(md_file).get("type") or "unknown").strip()
 
             if note_type not in note_types:
                 note_types[note_type] = 0
@@ -241,6 +342,9 @@ class SelfReflectionAnalyzer:
             lines.append(f"  Failed: {stats['failed']}")
             success_rate = stats["success"] / stats["total"] if stats["total"] > 0 else 0
             lines.append(f"  Success rate: {success_rate:.2%}")
+            if "duration_p50_s" in stats:
+                lines.append(f"  Duration p50/p90/p99: {stats['duration_p50_s']}s / "
+                             f"{stats['duration_p90_s']}s / {stats['duration_p99_s']}s")
 
         lines.append("")
         lines.append("Content Analysis:")
@@ -399,7 +503,7 @@ Last {args.days} days
 
     elif args.mode == "analyze":
         print(f"Analyzing system behavior for last {args.days} days...")
-        stats = tracker.get_operation_statistics()
+        stats = tracker.get_operation_statistics(args.days)
         print("\nSystem Statistics:")
         print(f"Total operations: {stats['total_operations']}")
         print(f"Successful: {stats['successful_operations']}")
@@ -414,6 +518,9 @@ Last {args.days} days
             print(f"  Failed: {script_stats['failed']}")
             rate = script_stats['success'] / script_stats['total'] if script_stats['total'] > 0 else 0
             print(f"  Success rate: {rate:.2%}")
+            if "duration_p50_s" in script_stats:
+                print(f"  Duration p50/p90/p99: {script_stats['duration_p50_s']}s / "
+                      f"{script_stats['duration_p90_s']}s / {script_stats['duration_p99_s']}s")
 
     elif args.mode == "improve":
         print(f"Generating self-improvement plan for last {args.days} days...")
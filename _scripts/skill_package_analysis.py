@@ -19,6 +19,7 @@ from typing import Dict, List, Any, Optional, Tuple
 # Add parent for config
 sys.path.insert(0, str(Path(__file__).parent))
 from config import summarize, save_note, VAULT_PATH
+from run_history import RunStore
 
 
 class SkillStatusMonitor:
@@ -77,9 +78,8 @@ class SkillStatusMonitor:
         return ""
     
     def get_execution_history(self, days: int = 30) -> Dict[str, List[Dict]]:
-        """Get execution history from logs."""
-        history = {}
-        return history
+        """Get recorded runs per script from the run history, newest first."""
+        return RunStore().history_by_script(days)
 
 
 class HealthAssessor:
@@ -124,13 +124,19 @@ class HealthAssessor:
         else:
             health_score += 0.1
         
-        # Check execution history (placeholder)
+        # Check execution history
         if not history:
             issues.append("No execution history found")
             health_score += 0.1
         else:
-            health_score += 0.15
-            strengths.append("Has execution history")
+            failed = sum(1 for run in history if run.get("exit_code") != 0)
+            failure_rate = failed / len(history)
+            if failure_rate > 0.3:
+                issues.append(f"Failed {failed} of {len(history)} recent runs")
+                health_score += 0.05
+            else:
+                health_score += 0.15
+                strengths.append(f"{len(history)} recent runs, {1 - failure_rate:.0%} successful")
         
         return {
             "skill": skill["name"],
@@ -10,7 +10,7 @@ import re
 from datetime import datetime
 from pathlib import Path
 
-from config import summarize, save_note, VAULT_PATH, TRACKER
+from config import summarize_stream, save_note, VAULT_PATH, TRACKER
 
 SOCRATES_PROMPT = """You are an expert at Socratic questioning — a method of guided inquiry that helps deepen understanding through thoughtful, probing questions. Your role is not to provide answers, but to ask questions that illuminate the topic.
 
@@ -126,7 +126,10 @@ Apply the SOCRATES questioning framework to explore this question/topic, taking
 The user wants to explore this question/topic using the Socratic method. Apply the SOCRATES framework to generate deep, thought-provoking questions."""
 
     print("Generating Socratic questions...")
-    result = summarize(user_input, SOCRATES_PROMPT)
+    print("\n" + "="*80 + "\n")
+    stream_stats = {}
+    result = "".join(summarize_stream(user_input, SOCRATES_PROMPT, stats=stream_stats, cache=False)).strip()
+    print("\n" + "="*80 + "\n")
 
     if args.save:
         today = datetime.now().strftime("%Y-%m-%d")
@@ -163,9 +166,6 @@ tags:
         save_note(out_path, note)
         print(f"Done! Socratic inquiry saved to {out_path}.")
     else:
-        print("\n" + "="*80 + "\n")
-        print(result)
-        print("\n" + "="*80 + "\n")
         print("Note: Use --save to save this to your vault.")
 
     if TRACKER:
@@ -173,7 +173,7 @@ tags:
             script_name="socrates.py",
             operation_type="socratic_inquiry",
             status="success",
-            metrics={"question": args.question, "saved": args.save},
+            metrics={"question": args.question, "saved": args.save, "first_token_s": stream_stats.get("first_token_s")},
         )
 
 
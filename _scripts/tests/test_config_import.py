@@ -0,0 +1,51 @@
+"""Import-time budget for config.py.
+
+Nearly every script imports config, so anything it loads at import time is
+paid by every run. The AI clients (openai) and the behavior tracker
+(self_reflection) are built on first use; these tests keep it that way.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+
+# Generous: config itself takes ~20ms, importing openai alone ~0.5-1s
+IMPORT_BUDGET_S = 0.3
+HEAVY_MODULES = ("openai", "self_reflection")
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import config
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "elapsed": elapsed,
+    "loaded": [name for name in %r if name in sys.modules],
+}))
+""" % (HEAVY_MODULES,)
+
+
+def _import_config() -> dict:
+    # A fresh interpreter, so modules imported by other tests don't count
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=SCRIPTS_DIR,
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_config_import_skips_heavy_modules():
+    assert _import_config()["loaded"] == []
+
+
+def test_config_import_within_budget():
+    # Best of three, so a cold disk cache on the first run doesn't fail it
+    elapsed = min(_import_config()["elapsed"] for _ in range(3))
+    assert elapsed < IMPORT_BUDGET_S, f"import config took {elapsed:.3f}s (budget {IMPORT_BUDGET_S}s)"
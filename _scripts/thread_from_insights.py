@@ -266,7 +266,7 @@ def main():
 
     prompt = build_thread_prompt(args.topic, notes_text, args.tweets)
     print("Generating thread with AI...")
-    thread_body = summarize(notes_text, prompt)
+    thread_body = summarize(notes_text, prompt, cache=False)
 
     today = datetime.now().strftime("%Y-%m-%d")
 
@@ -0,0 +1,468 @@
+"""Vault Index - Persistent full-text index over your Obsidian vault.
+
+Keeps every markdown note in an on-disk SQLite FTS5 table so keyword retrieval
+no longer spawns a ripgrep process (and rescans the vault) per query. The index
+is built once and then refreshed incrementally: only notes whose mtime or size
+changed since the last run are re-read.
+
+Alongside the text, the index keeps BM25 postings (term frequencies weighted
+by where a term appears: title, headings or body) and per-term document
+frequencies, so `VaultIndex.rank` can return notes by relevance instead of
+directory-walk order.
+
+Frontmatter properties, tags (with nested parents) and link targets are kept
+in side tables, so `VaultIndex.filter` can answer Dataview-style queries
+(see vault_query) with index lookups instead of a vault scan.
+
+Used by rag_query, filter_query and deep_research for keyword retrieval.
+"""
+
+import argparse
+import math
+import re
+import sqlite3
+import sys
+from pathlib import Path
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+# Add parent for config
+sys.path.insert(0, str(Path(__file__).parent))
+from config import VAULT_PATH, CACHE_DIR
+from vault_walker import VaultWalker, get_walker, watcher_active
+from note_store import parse_note
+from note_manifest import note_date
+from link_graph import link_target
+from vault_query import QueryError, compile_query
+
+INDEX_PATH = CACHE_DIR / "vault_index.db"
+
+# Bump when the schema changes; older index files are rebuilt from scratch
+SCHEMA_VERSION = 3
+
+
+# BM25 parameters and field boosts (a title hit counts as 3 body hits)
+BM25_K1 = 1.2
+BM25_B = 0.75
+TITLE_BOOST = 3.0
+HEADING_BOOST = 2.0
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "how", "in", "is",
+    "it", "of", "on", "or", "that", "the", "this", "to", "was", "what", "with", "do",
+    "does", "my", "i", "me", "about", "know", "notes",
+}
+
+_LATIN_RE = re.compile(r"[a-z0-9][a-z0-9_\-]*[a-z0-9]|[a-z0-9]")
+_CJK_RE = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+")
+_HEADING_RE = re.compile(r"^#{1,6}\s+(.+)$", re.MULTILINE)
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into index terms: lowercase words plus CJK character bigrams."""
+    text = text.lower()
+    tokens = [t for t in _LATIN_RE.findall(text) if len(t) > 1 and t not in STOPWORDS]
+    for run in _CJK_RE.findall(text):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i : i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def _weighted_terms(title: str, content: str) -> Tuple[Dict[str, float], int]:
+    """Field-weighted term frequencies and document length for one note."""
+    title_tf = Counter(tokenize(title))
+    head_tf = Counter(tokenize("\n".join(_HEADING_RE.findall(content))))
+    body_tf = Counter(tokenize(content))
+    weights: Dict[str, float] = {}
+    for term in set(title_tf) | set(head_tf) | set(body_tf):
+        weights[term] = (
+            TITLE_BOOST * title_tf.get(term, 0)
+            + HEADING_BOOST * head_tf.get(term, 0)
+            + body_tf.get(term, 0)
+        )
+    return weights, sum(body_tf.values()) + sum(title_tf.values())
+
+
+def _scan_vault(vault_path: Path) -> Dict[str, Tuple[int, int]]:
+    """Map relative path -> (mtime_ns, size) for every indexable note."""
+    walker = get_walker() if vault_path == VAULT_PATH else VaultWalker(root=vault_path)
+    return {rel: (e.mtime_ns, e.size) for rel, e in walker.scan(fresh=True).items()}
+
+
+class VaultIndex:
+    """Incrementally maintained full-text index of vault notes."""
+
+    def __init__(self, db_path: Path = INDEX_PATH, vault_path: Path = VAULT_PATH):
+        self.db_path = Path(db_path)
+        self.vault_path = Path(vault_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.has_fts = self._init_schema()
+
+    def _init_schema(self) -> bool:
+        """Create tables. Returns False when FTS5 trigram is unavailable."""
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            for table in ("files", "notes_fts", "notes_text", "terms", "postings", "props", "tags", "links"):
+                self.conn.execute(f"DROP TABLE IF EXISTS {table}")
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS files (
+                id INTEGER PRIMARY KEY,
+                path TEXT UNIQUE NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                doc_len INTEGER NOT NULL DEFAULT 0
+            )"""
+        )
+        self.conn.execute("CREATE TABLE IF NOT EXISTS terms (term TEXT PRIMARY KEY, df INTEGER NOT NULL)")
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS postings (
+                term TEXT NOT NULL,
+                doc_id INTEGER NOT NULL,
+                weight REAL NOT NULL,
+                PRIMARY KEY (term, doc_id)
+            ) WITHOUT ROWID"""
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc_id)")
+        # Queryable metadata: one row per property value / tag / link target
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS props (
+                doc_id INTEGER NOT NULL,
+                key TEXT NOT NULL,
+                value_text TEXT,
+                value_num REAL
+            )"""
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS props_text ON props (key, value_text)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS props_num ON props (key, value_num)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS props_doc ON props (doc_id)")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS tags (doc_id INTEGER NOT NULL, tag TEXT NOT NULL)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS tags_tag ON tags (tag)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS tags_doc ON tags (doc_id)")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS links (doc_id INTEGER NOT NULL, target TEXT NOT NULL)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS links_target ON links (target)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS links_doc ON links (doc_id)")
+        try:
+            # Trigram tokens give case-insensitive substring matching (same
+            # semantics as `rg -i -F`) and work for Chinese text without a
+            # word segmenter.
+            self.conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(content, tokenize='trigram')"
+            )
+            fts = True
+        except sqlite3.OperationalError:
+            # Older SQLite builds: plain table searched with LIKE
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS notes_text (rowid INTEGER PRIMARY KEY, content TEXT)"
+            )
+            fts = False
+        self.conn.commit()
+        return fts
+
+    @property
+    def _text_table(self) -> str:
+        return "notes_fts" if self.has_fts else "notes_text"
+
+    def refresh(self) -> Dict[str, int]:
+        """Bring the index up to date with the vault. Returns change counts."""
+        on_disk = _scan_vault(self.vault_path)
+        indexed = {
+            path: (file_id, mtime_ns, size)
+            for file_id, path, mtime_ns, size in self.conn.execute(
+                "SELECT id, path, mtime_ns, size FROM files"
+            )
+        }
+        changes: Dict[str, Optional[Tuple[int, int]]] = {path: None for path in indexed if path not in on_disk}
+        changes.update(on_disk)
+        stats = self._apply(changes, indexed)
+        stats["total"] = len(on_disk)
+        return stats
+
+    def update_paths(self, changes: Dict[str, Optional[Tuple[int, int]]]) -> Dict[str, int]:
+        """Apply known per-note changes without scanning the vault.
+
+        `changes` maps vault-relative paths to (mtime_ns, size), or None for
+        deleted notes (vault_watcher passes the paths from its events).
+        """
+        indexed: Dict[str, Tuple[int, int, int]] = {}
+        paths = list(changes)
+        for i in range(0, len(paths), 500):
+            batch = paths[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT id, path, mtime_ns, size FROM files WHERE path IN ({','.join('?' * len(batch))})",
+                batch,
+            )
+            indexed.update((path, (file_id, mtime_ns, size)) for file_id, path, mtime_ns, size in rows)
+        stats = self._apply(changes, indexed)
+        stats["total"] = self.conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+        return stats
+
+    def _apply(
+        self,
+        changes: Dict[str, Optional[Tuple[int, int]]],
+        indexed: Dict[str, Tuple[int, int, int]],
+    ) -> Dict[str, int]:
+        """Re-index changed notes and drop deleted ones (`indexed`: their current rows)."""
+        stats = {"added": 0, "updated": 0, "removed": 0}
+        table = self._text_table
+        with self.conn:
+            for path, stamp in changes.items():
+                existing = indexed.get(path)
+                if stamp is None:
+                    if existing:
+                        file_id = existing[0]
+                        self.conn.execute(f"DELETE FROM {table} WHERE rowid = ?", (file_id,))
+                        self._drop_postings(file_id)
+                        self._drop_metadata(file_id)
+                        self.conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+                        stats["removed"] += 1
+                    continue
+
+                mtime_ns, size = stamp
+                if existing and existing[1] == mtime_ns and existing[2] == size:
+                    continue
+                try:
+                    content = (self.vault_path / path).read_text(encoding="utf-8", errors="ignore")
+                except OSError:
+                    continue
+                weights, doc_len = _weighted_terms(Path(path).stem, content)
+                if existing:
+                    file_id = existing[0]
+                    self.conn.execute(
+                        "UPDATE files SET mtime_ns = ?, size = ?, doc_len = ? WHERE id = ?",
+                        (mtime_ns, size, doc_len, file_id),
+                    )
+                    self.conn.execute(f"DELETE FROM {table} WHERE rowid = ?", (file_id,))
+                    self._drop_postings(file_id)
+                    self._drop_metadata(file_id)
+                    stats["updated"] += 1
+                else:
+                    cur = self.conn.execute(
+                        "INSERT INTO files (path, mtime_ns, size, doc_len) VALUES (?, ?, ?, ?)",
+                        (path, mtime_ns, size, doc_len),
+                    )
+                    file_id = cur.lastrowid
+                    stats["added"] += 1
+                self.conn.execute(
+                    f"INSERT INTO {table} (rowid, content) VALUES (?, ?)",
+                    (file_id, content),
+                )
+                self.conn.executemany(
+                    "INSERT INTO postings (term, doc_id, weight) VALUES (?, ?, ?)",
+                    [(term, file_id, w) for term, w in weights.items()],
+                )
+                self.conn.executemany(
+                    "INSERT INTO terms (term, df) VALUES (?, 1) ON CONFLICT(term) DO UPDATE SET df = df + 1",
+                    [(term,) for term in weights],
+                )
+                self._add_metadata(file_id, path, content)
+        return stats
+
+    def _add_metadata(self, file_id: int, path: str, content: str):
+        """Store a note's properties, tags and link targets for filter()."""
+        note = parse_note(content)
+        props = []
+        frontmatter = {str(k).lower(): v for k, v in note["frontmatter"].items()}
+        day = note_date(frontmatter, Path(path).name)
+        if day and "date" not in frontmatter:
+            frontmatter["date"] = day
+        for key, value in frontmatter.items():
+            for item in value if isinstance(value, list) else [value]:
+                text = str(item).strip()
+                try:
+                    num = float(text)
+                except ValueError:
+                    num = None
+                props.append((file_id, key, text.lower(), num))
+        tags = set()
+        for tag in note["tags"]:
+            parts = tag.lower().strip("/").split("/")
+            tags.update("/".join(parts[:i]) for i in range(1, len(parts) + 1))
+        links = {Path(link_target(link)).name.lower() for link in note["wikilinks"]} - {""}
+        self.conn.executemany("INSERT INTO props VALUES (?, ?, ?, ?)", props)
+        self.conn.executemany("INSERT INTO tags VALUES (?, ?)", [(file_id, t) for t in tags])
+        self.conn.executemany("INSERT INTO links VALUES (?, ?)", [(file_id, t) for t in links])
+
+    def _drop_metadata(self, file_id: int):
+        for table in ("props", "tags", "links"):
+            self.conn.execute(f"DELETE FROM {table} WHERE doc_id = ?", (file_id,))
+
+    def _drop_postings(self, file_id: int):
+        """Remove a note's postings and decrement document frequencies."""
+        self.conn.execute(
+            "UPDATE terms SET df = df - 1 WHERE term IN (SELECT term FROM postings WHERE doc_id = ?)",
+            (file_id,),
+        )
+        # Only this note's terms can have dropped to zero
+        self.conn.execute(
+            "DELETE FROM terms WHERE df <= 0 AND term IN (SELECT term FROM postings WHERE doc_id = ?)",
+            (file_id,),
+        )
+        self.conn.execute("DELETE FROM postings WHERE doc_id = ?", (file_id,))
+
+    def search(self, query: str, limit: int = 20) -> List[Path]:
+        """Find notes containing `query` (case-insensitive substring match)."""
+        query = query.strip()
+        if not query:
+            return []
+        if self.has_fts and len(query) >= 3:
+            phrase = '"' + query.replace('"', '""') + '"'
+            sql = (
+                "SELECT f.path FROM notes_fts JOIN files f ON f.id = notes_fts.rowid "
+                "WHERE notes_fts MATCH ? ORDER BY f.path LIMIT ?"
+            )
+            params: Tuple = (phrase, limit)
+        else:
+            # Too short for trigrams (or no FTS5): scan stored text in-process
+            escaped = query.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            sql = (
+                f"SELECT f.path FROM {self._text_table} t JOIN files f ON f.id = t.rowid "
+                "WHERE lower(t.content) LIKE ? ESCAPE '\\' ORDER BY f.path LIMIT ?"
+            )
+            params = (f"%{escaped}%", limit)
+        try:
+            rows = self.conn.execute(sql, params).fetchall()
+        except sqlite3.OperationalError:
+            return []
+        return [self.vault_path / path for (path,) in rows]
+
+    def filter(self, query: str, limit: Optional[int] = None) -> List[Path]:
+        """Notes matching a vault_query query, e.g.
+
+        FROM "Sources" WHERE type = "hn-newsletter" AND date >= -7d SORT mtime DESC LIMIT 20
+
+        `limit` caps the results when the query has no LIMIT of its own.
+        Raises QueryError for malformed queries.
+        """
+        sql, params = compile_query(query, limit=limit)
+        return [self.vault_path / path for (path,) in self.conn.execute(sql, params)]
+
+    def rank(self, query: str, limit: int = 20) -> List[Tuple[Path, float]]:
+        """Rank notes against `query` with BM25 (title/heading hits boosted)."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        n_docs, avg_len = self.conn.execute("SELECT COUNT(*), AVG(doc_len) FROM files").fetchone()
+        if not n_docs:
+            return []
+        avg_len = avg_len or 1.0
+
+        scores: Dict[int, float] = {}
+        for term in terms:
+            row = self.conn.execute("SELECT df FROM terms WHERE term = ?", (term,)).fetchone()
+            if not row:
+                continue
+            df = row[0]
+            idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            for doc_id, weight, doc_len in self.conn.execute(
+                "SELECT p.doc_id, p.weight, f.doc_len FROM postings p JOIN files f ON f.id = p.doc_id "
+                "WHERE p.term = ?",
+                (term,),
+            ):
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * doc_len / avg_len)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * weight * (BM25_K1 + 1) / (weight + norm)
+
+        top = sorted(scores.items(), key=lambda x: -x[1])[:limit]
+        paths = dict(
+            self.conn.execute(
+                f"SELECT id, path FROM files WHERE id IN ({','.join('?' * len(top))})",
+                [doc_id for doc_id, _ in top],
+            ).fetchall()
+        ) if top else {}
+        return [(self.vault_path / paths[doc_id], score) for doc_id, score in top if doc_id in paths]
+
+    def search_any(self, terms: List[str], limit: int = 20) -> List[Path]:
+        """Find notes matching any of `terms`, in term order, without duplicates."""
+        seen = set()
+        results: List[Path] = []
+        for term in terms:
+            if len(results) >= limit:
+                break
+            for path in self.search(term, limit=limit):
+                if path not in seen:
+                    seen.add(path)
+                    results.append(path)
+        return results[:limit]
+
+    def count(self) -> int:
+        """Number of indexed notes."""
+        return self.conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+
+_INDEX: Optional[VaultIndex] = None
+
+
+def get_index(refresh: bool = True) -> VaultIndex:
+    """Get the shared index, refreshing it once per process.
+
+    The refresh is skipped while a watcher daemon keeps the index current.
+    """
+    global _INDEX
+    if _INDEX is None:
+        _INDEX = VaultIndex()
+        if refresh and not watcher_active():
+            _INDEX.refresh()
+    return _INDEX
+
+
+def main():
+    """Maintain or query the vault index from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Vault Index - Persistent full-text index over your vault",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python3 _scripts/vault_index.py refresh          # Update index (incremental)
+  python3 _scripts/vault_index.py rebuild          # Drop and rebuild from scratch
+  python3 _scripts/vault_index.py search "agents"  # Keyword search
+  python3 _scripts/vault_index.py rank "AI agents"  # BM25-ranked search
+  python3 _scripts/vault_index.py filter 'FROM "Sources" WHERE type = "hn-newsletter" AND date >= -7d SORT mtime DESC LIMIT 20'
+""",
+    )
+    parser.add_argument("command", choices=["refresh", "rebuild", "search", "rank", "filter"])
+    parser.add_argument("query", nargs="?", default="", help="Search query, or a filter query (see vault_query.py)")
+    parser.add_argument("--limit", type=int, default=None,
+                        help="Max results (default: 20 for search/rank; for filter, the query's LIMIT or all)")
+    args = parser.parse_args()
+
+    if args.command == "rebuild" and INDEX_PATH.exists():
+        for suffix in ("", "-wal", "-shm"):
+            Path(str(INDEX_PATH) + suffix).unlink(missing_ok=True)
+
+    index = VaultIndex()
+    stats = index.refresh()
+    if args.command in ("refresh", "rebuild"):
+        print(
+            f"Indexed {stats['total']} notes "
+            f"(+{stats['added']} ~{stats['updated']} -{stats['removed']}) → {INDEX_PATH}"
+        )
+        return
+
+    if not args.query:
+        parser.error(f"{args.command} requires a query")
+    if args.command == "filter":
+        try:
+            paths = index.filter(args.query, limit=args.limit)
+        except QueryError as e:
+            parser.error(f"bad filter query: {e}")
+        for path in paths:
+            print(path.relative_to(VAULT_PATH))
+        return
+    if args.command == "rank":
+        for path, score in index.rank(args.query, limit=args.limit or 20):
+            print(f"{score:6.2f}  {path.relative_to(VAULT_PATH)}")
+        return
+    for path in index.search(args.query, limit=args.limit or 20):
+        print(path.relative_to(VAULT_PATH))
+
+
+if __name__ == "__main__":
+    main()
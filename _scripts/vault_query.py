@@ -0,0 +1,288 @@
+"""Vault Query - Small Dataview-style query language over the vault index.
+
+    FROM "Sources" WHERE type = "hn-newsletter" AND date >= -7d SORT mtime DESC LIMIT 20
+
+Clauses (all optional, in this order):
+- FROM "Folder" | #tag, combined with OR
+- WHERE comparisons joined with AND / OR / NOT and parentheses
+- SORT field [ASC|DESC], ...
+- LIMIT n
+
+Fields: any frontmatter property (`type`, `date`, `status`, ...), `tag`/`tags`,
+`link`/`links` (link target note name), and the file fields `path`, `mtime`
+and `size`. Operators: = != < <= > >= and `contains`. Literals are typed:
+"strings", numbers, dates (2026-02-01, today, yesterday, or relative offsets
+-7d / -2w / -3m / -1y), which pick numeric, date or text comparison. List
+properties match when any element matches.
+
+`compile_query` turns a query into SQL over vault_index's files, props, tags
+and links tables; run it with `VaultIndex.filter`.
+"""
+
+import re
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Tuple
+
+FILE_FIELDS = {"path", "mtime", "size"}
+TAG_FIELDS = {"tag", "tags"}
+LINK_FIELDS = {"link", "links"}
+OPERATORS = {"=", "!=", "<", "<=", ">", ">=", "contains"}
+
+_TOKEN_RE = re.compile(
+    r"""\s*(?:
+        (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+      | (?P<reldate>[-+]\d+[dwmy])\b
+      | (?P<date>\d{4}-\d{2}-\d{2})\b
+      | (?P<number>[-+]?\d+(?:\.\d+)?)\b
+      | (?P<tag>\#[\w/\-]+)
+      | (?P<op>>=|<=|!=|=|<|>)
+      | (?P<punct>[(),])
+      | (?P<word>[A-Za-z_][\w.\-]*)
+    )""",
+    re.VERBOSE | re.UNICODE,
+)
+
+
+class QueryError(ValueError):
+    """Raised for queries that do not parse."""
+
+
+def _tokenize(text: str) -> List[Tuple[str, str]]:
+    tokens = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = _TOKEN_RE.match(text, pos)
+        if not match or match.end() == pos:
+            raise QueryError(f"Unexpected input at {pos}: {text[pos:pos + 20]!r}")
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "string":
+            value = re.sub(r"\\(.)", r"\1", value[1:-1])
+        tokens.append((kind, value))
+        pos = match.end()
+    return tokens
+
+
+def _relative_date(offset: str, today: date) -> date:
+    amount, unit = int(offset[:-1]), offset[-1]
+    if unit == "d":
+        return today + timedelta(days=amount)
+    if unit == "w":
+        return today + timedelta(weeks=amount)
+    months = today.month - 1 + amount * (12 if unit == "y" else 1)
+    year, month = today.year + months // 12, months % 12 + 1
+    # Clamp to the last valid day of the target month
+    for day in (today.day, 30, 29, 28):
+        try:
+            return date(year, month, day)
+        except ValueError:
+            continue
+    raise QueryError(f"Bad date offset: {offset}")
+
+
+class _Parser:
+    def __init__(self, text: str, today: Optional[date] = None, limit: Optional[int] = None):
+        self.tokens = _tokenize(text)
+        self.pos = 0
+        self.today = today or date.today()
+        self.limit = limit
+        self.params: List = []
+
+    # Token helpers
+    def peek(self) -> Tuple[Optional[str], Optional[str]]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def keyword(self, *words: str) -> bool:
+        kind, value = self.peek()
+        if kind == "word" and value.upper() in words:
+            self.pos += 1
+            return True
+        return False
+
+    def take(self, kind: str) -> str:
+        got_kind, value = self.peek()
+        if got_kind != kind:
+            raise QueryError(f"Expected {kind}, got {value!r}")
+        self.pos += 1
+        return value
+
+    # Literals
+    def literal(self) -> Tuple[str, object]:
+        """Return (type, value) with type in number/date/text."""
+        kind, value = self.peek()
+        self.pos += 1
+        if kind == "number":
+            return "number", float(value)
+        if kind == "date":
+            return "date", value
+        if kind == "reldate":
+            return "date", _relative_date(value, self.today).isoformat()
+        if kind == "word" and value.lower() in ("today", "yesterday", "tomorrow"):
+            shift = {"today": 0, "yesterday": -1, "tomorrow": 1}[value.lower()]
+            return "date", (self.today + timedelta(days=shift)).isoformat()
+        if kind in ("string", "word", "tag"):
+            return "text", value.lstrip("#") if kind == "tag" else value
+        raise QueryError(f"Expected a value, got {value!r}")
+
+    # FROM
+    def source(self) -> str:
+        kind, value = self.peek()
+        self.pos += 1
+        if kind == "string":
+            folder = value.strip("/")
+            escaped = folder.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            self.params.append(f"{escaped}/%")
+            return "f.path LIKE ? ESCAPE '\\'"
+        if kind == "tag":
+            self.params.append(value.lstrip("#").lower())
+            return "f.id IN (SELECT doc_id FROM tags WHERE tag = ?)"
+        raise QueryError(f'FROM expects "Folder" or #tag, got {value!r}')
+
+    # WHERE
+    def expr(self) -> str:
+        parts = [self.term()]
+        while self.keyword("OR"):
+            parts.append(self.term())
+        return parts[0] if len(parts) == 1 else "(" + " OR ".join(parts) + ")"
+
+    def term(self) -> str:
+        parts = [self.factor()]
+        while self.keyword("AND"):
+            parts.append(self.factor())
+        return parts[0] if len(parts) == 1 else "(" + " AND ".join(parts) + ")"
+
+    def factor(self) -> str:
+        if self.keyword("NOT"):
+            return f"NOT {self.factor()}"
+        kind, value = self.peek()
+        if kind == "punct" and value == "(":
+            self.pos += 1
+            inner = self.expr()
+            if self.take("punct") != ")":
+                raise QueryError("Expected )")
+            return f"({inner})"
+        return self.comparison()
+
+    def comparison(self) -> str:
+        field = self.take("word").lower()
+        kind, op = self.peek()
+        if kind == "op":
+            self.pos += 1
+        elif kind == "word" and op.lower() == "contains":
+            self.pos += 1
+            op = "contains"
+        else:
+            raise QueryError(f"Expected an operator after {field!r}, got {op!r}")
+        if op == "!=":
+            return f"NOT {self._predicate(field, '=')}"
+        return self._predicate(field, op)
+
+    def _predicate(self, field: str, op: str) -> str:
+        lit_type, value = self.literal()
+
+        if field in FILE_FIELDS:
+            if field == "path":
+                return self._text_match("lower(f.path)", op, str(value))
+            column = "f.mtime_ns" if field == "mtime" else "f.size"
+            if field == "mtime" and lit_type == "date":
+                day = datetime.strptime(str(value), "%Y-%m-%d")
+                if op in ("=", "contains"):
+                    self.params.extend([int(day.timestamp() * 1e9), int((day + timedelta(days=1)).timestamp() * 1e9)])
+                    return f"({column} >= ? AND {column} < ?)"
+                if op in (">", "<="):
+                    # "after day X" starts at the next midnight
+                    day += timedelta(days=1)
+                    op = ">=" if op == ">" else "<"
+                value = int(day.timestamp() * 1e9)
+            elif lit_type != "number":
+                raise QueryError(f"{field} compares with numbers or dates")
+            self.params.append(value)
+            return f"{column} {self._sql_op(op)} ?"
+
+        if field in TAG_FIELDS or field in LINK_FIELDS:
+            table, column = ("tags", "tag") if field in TAG_FIELDS else ("links", "target")
+            inner = self._text_match(column, op, str(value))
+            return f"f.id IN (SELECT doc_id FROM {table} WHERE {inner})"
+
+        self.params.append(field)
+        if lit_type == "number" and op != "contains":
+            inner = f"value_num {self._sql_op(op)} ?"
+            self.params.append(value)
+        elif lit_type == "date" and op != "contains":
+            # Date-times compare on their date part
+            inner = f"substr(value_text, 1, 10) {self._sql_op(op)} ?"
+            self.params.append(value)
+        else:
+            inner = self._text_match("value_text", op, str(value))
+        return f"f.id IN (SELECT doc_id FROM props WHERE key = ? AND {inner})"
+
+    def _text_match(self, column: str, op: str, value: str) -> str:
+        value = value.lower()
+        if op == "contains":
+            escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            self.params.append(f"%{escaped}%")
+            return f"{column} LIKE ? ESCAPE '\\'"
+        self.params.append(value)
+        return f"{column} {self._sql_op(op)} ?"
+
+    @staticmethod
+    def _sql_op(op: str) -> str:
+        if op not in OPERATORS:
+            raise QueryError(f"Unknown operator {op!r}")
+        return op
+
+    # SORT
+    def sort_key(self) -> str:
+        field = self.take("word").lower()
+        direction = "DESC" if self.keyword("DESC") else "ASC"
+        self.keyword("ASC")
+        if field in FILE_FIELDS:
+            column = {"path": "f.path", "mtime": "f.mtime_ns", "size": "f.size"}[field]
+            return f"{column} {direction}"
+        value = "(SELECT COALESCE(value_num, value_text) FROM props WHERE doc_id = f.id AND key = ? LIMIT 1)"
+        self.params.extend([field, field])
+        # Notes without the property sort last either way
+        return f"{value} IS NULL, {value} {direction}"
+
+    # Whole query
+    def parse(self) -> Tuple[str, List]:
+        where: List[str] = []
+        order: List[str] = []
+        limit = None
+
+        if self.keyword("FROM"):
+            sources = [self.source()]
+            while self.keyword("OR") or (self.peek() == ("punct", ",") and self.take("punct")):
+                sources.append(self.source())
+            where.append(sources[0] if len(sources) == 1 else "(" + " OR ".join(sources) + ")")
+        if self.keyword("WHERE"):
+            where.append(self.expr())
+        if self.keyword("SORT"):
+            order.append(self.sort_key())
+            while self.peek() == ("punct", ","):
+                self.pos += 1
+                order.append(self.sort_key())
+        if self.keyword("LIMIT"):
+            limit = int(float(self.take("number")))
+        if self.pos < len(self.tokens):
+            raise QueryError(f"Unexpected {self.peek()[1]!r}")
+        if limit is None:
+            limit = self.limit
+
+        sql = "SELECT f.path FROM files f"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY " + ", ".join(order + ["f.path"])
+        if limit is not None:
+            sql += " LIMIT ?"
+            self.params.append(limit)
+        return sql, self.params
+
+
+def compile_query(text: str, today: Optional[date] = None, limit: Optional[int] = None) -> Tuple[str, List]:
+    """Compile a query into (sql, params) selecting matching note paths.
+
+    `limit` caps the result count of queries without a LIMIT of their own.
+    """
+    return _Parser(text, today, limit).parse()
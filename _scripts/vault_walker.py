@@ -0,0 +1,348 @@
+"""Vault Walker - Shared, cached enumeration of notes in your Obsidian vault.
+
+One walker for every script that needs "all markdown files under X":
+- Built on os.scandir; excluded directories are pruned before descending
+- Keeps a manifest (path, mtime, size, inode) under _logs/cache
+- Repeated runs only re-list directories whose mtime changed; unchanged
+  directories reuse their cached listing without touching their files
+
+A directory's mtime changes when entries are added, removed or renamed, not
+when a file inside is edited in place. Callers that need fresh per-file
+mtime/size (e.g. the search index) pass `fresh=True`, which re-stats files
+but still skips listing unchanged directories.
+
+While a vault watcher daemon (vault_watcher.py) is running, it keeps the
+default walker's manifest current, and scans in other processes read the
+manifest without touching the filesystem at all.
+"""
+
+import hashlib
+import json
+import os
+import stat
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+# Add parent for config
+sys.path.insert(0, str(Path(__file__).parent))
+from config import VAULT_PATH, CACHE_DIR
+
+# Default directories never walked (union of what the scripts used to skip)
+EXCLUDE_DIRS = {
+    ".git", ".obsidian", ".claude", ".cursor", ".trash", ".ruff_cache",
+    "node_modules", "_scripts", "_org", "_logs",
+}
+
+MANIFEST_VERSION = 1
+
+# Written by vault_watcher.py while it runs (pid, heartbeat, maintained manifests)
+WATCHER_STATE_PATH = CACHE_DIR / "watcher.json"
+WATCHER_HEARTBEAT = 5.0
+
+
+class FileEntry(NamedTuple):
+    """Manifest record for one file (path is relative to the vault)."""
+
+    path: str
+    mtime_ns: int
+    size: int
+    inode: int
+
+
+def watcher_state() -> Optional[Dict]:
+    """State of a live watcher daemon in another process, or None."""
+    try:
+        state = json.loads(WATCHER_STATE_PATH.read_text(encoding="utf-8"))
+        pid = int(state["pid"])
+        if pid == os.getpid() or time.time() - state["heartbeat"] > 3 * WATCHER_HEARTBEAT:
+            return None
+        os.kill(pid, 0)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return state
+
+
+def watcher_active() -> bool:
+    """True if a watcher daemon is keeping the vault caches current."""
+    return watcher_state() is not None
+
+
+class VaultWalker:
+    """Cached, pruning directory walker over the vault."""
+
+    def __init__(
+        self,
+        root: Path = VAULT_PATH,
+        exclude_dirs: Iterable[str] = EXCLUDE_DIRS,
+        suffix: str = ".md",
+        skip_hidden: bool = True,
+        manifest_dir: Path = CACHE_DIR,
+    ):
+        self.root = Path(root)
+        self.exclude_dirs = set(exclude_dirs)
+        self.suffix = suffix
+        self.skip_hidden = skip_hidden
+        # One manifest per walker configuration so scripts with different
+        # exclude sets don't invalidate each other's cache
+        key = json.dumps([str(self.root), sorted(self.exclude_dirs), suffix, skip_hidden])
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:10]
+        self.manifest_path = Path(manifest_dir) / f"vault_manifest-{digest}.json"
+        self._dirs: Dict[str, Dict] = self._load_manifest()
+        self._dirty = False
+
+    def _load_manifest(self) -> Dict[str, Dict]:
+        """Load cached directory listings."""
+        try:
+            data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+            if data.get("version") == MANIFEST_VERSION:
+                return data.get("dirs", {})
+        except (OSError, ValueError):
+            pass
+        return {}
+
+    def save(self):
+        """Persist the manifest atomically (no-op when nothing changed)."""
+        if not self._dirty:
+            return
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.manifest_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(
+            json.dumps({"version": MANIFEST_VERSION, "dirs": self._dirs}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self.manifest_path)
+        self._dirty = False
+
+    def _skip_dir(self, name: str) -> bool:
+        return name in self.exclude_dirs or (self.skip_hidden and name.startswith("."))
+
+    def _list_dir(self, rel_dir: str, full_dir: str, mtime_ns: int) -> Dict:
+        """Read one directory with scandir and cache its listing."""
+        subdirs: List[str] = []
+        files: Dict[str, List[int]] = {}
+        with os.scandir(full_dir) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not self._skip_dir(entry.name):
+                            subdirs.append(entry.name)
+                    elif entry.name.endswith(self.suffix) and entry.is_file():
+                        st = entry.stat()
+                        files[entry.name] = [st.st_mtime_ns, st.st_size, st.st_ino]
+                except OSError:
+                    continue
+        listing = {"mtime_ns": mtime_ns, "subdirs": sorted(subdirs), "files": files}
+        self._dirs[rel_dir] = listing
+        self._dirty = True
+        return listing
+
+    def _watched(self) -> bool:
+        """True if a live watcher daemon maintains this walker's manifest."""
+        state = watcher_state()
+        return bool(state) and str(self.manifest_path) in state.get("manifests", [])
+
+    def _from_manifest(self, start: str) -> Optional[Dict[str, FileEntry]]:
+        """Entries under `start` straight from the manifest (no filesystem access)."""
+        self._dirs = self._load_manifest()
+        if start not in self._dirs:
+            return None
+        result: Dict[str, FileEntry] = {}
+        stack = [start]
+        while stack:
+            rel_dir = stack.pop()
+            listing = self._dirs.get(rel_dir)
+            if listing is None:
+                continue
+            for name, (f_mtime, f_size, f_ino) in listing["files"].items():
+                rel = f"{rel_dir}/{name}" if rel_dir else name
+                result[rel] = FileEntry(rel, f_mtime, f_size, f_ino)
+            stack.extend(f"{rel_dir}/{sub}" if rel_dir else sub for sub in listing["subdirs"])
+        return result
+
+    def directories(self) -> List[str]:
+        """Vault-relative directories seen by the last scan ("" is the root)."""
+        return sorted(self._dirs)
+
+    def scan(self, under: Optional[str] = None, fresh: bool = False) -> Dict[str, FileEntry]:
+        """Return {relative path: FileEntry} for matching files.
+
+        Args:
+            under: Limit the walk to this vault-relative folder.
+            fresh: Re-stat files in unchanged directories to pick up in-place edits.
+        """
+        start = "" if not under else Path(under).as_posix().strip("/")
+        if self._watched():
+            cached = self._from_manifest(start)
+            if cached is not None:
+                return cached
+        result = self._walk(start, fresh)
+        self.save()
+        return result
+
+    def _walk(self, start: str, fresh: bool) -> Dict[str, FileEntry]:
+        """Walk the filesystem under `start`, updating cached listings."""
+        result: Dict[str, FileEntry] = {}
+        visited = set()
+        stack = [start]
+        while stack:
+            rel_dir = stack.pop()
+            full_dir = os.path.join(self.root, rel_dir) if rel_dir else str(self.root)
+            try:
+                mtime_ns = os.stat(full_dir).st_mtime_ns
+            except OSError:
+                continue
+            visited.add(rel_dir)
+            listing = self._dirs.get(rel_dir)
+            if not listing or listing["mtime_ns"] != mtime_ns:
+                try:
+                    listing = self._list_dir(rel_dir, full_dir, mtime_ns)
+                except OSError:
+                    continue
+            elif fresh:
+                for name, meta in list(listing["files"].items()):
+                    try:
+                        st = os.stat(os.path.join(full_dir, name))
+                    except OSError:
+                        # Removed without the directory mtime moving (rare)
+                        del listing["files"][name]
+                        self._dirty = True
+                        continue
+                    current = [st.st_mtime_ns, st.st_size, st.st_ino]
+                    if current != meta:
+                        listing["files"][name] = current
+                        self._dirty = True
+
+            for name, (f_mtime, f_size, f_ino) in listing["files"].items():
+                rel = f"{rel_dir}/{name}" if rel_dir else name
+                result[rel] = FileEntry(rel, f_mtime, f_size, f_ino)
+            for sub in listing["subdirs"]:
+                stack.append(f"{rel_dir}/{sub}" if rel_dir else sub)
+
+        # Forget cached directories under the walked root that no longer exist
+        prefix = f"{start}/" if start else ""
+        for rel_dir in list(self._dirs):
+            if rel_dir not in visited and (rel_dir == start or rel_dir.startswith(prefix)):
+                del self._dirs[rel_dir]
+                self._dirty = True
+
+        return result
+
+    def update(self, rel_paths: Iterable[str], save: bool = True) -> Dict[str, Optional[FileEntry]]:
+        """Re-stat individual files (e.g. from vault_watcher events) and patch the manifest.
+
+        Returns {relative path: FileEntry, or None if the file is gone}.
+        Paths in directories the manifest doesn't cover are ignored. With
+        save=False the manifest is written by a later save().
+        """
+        result: Dict[str, Optional[FileEntry]] = {}
+        touched = set()
+        for rel in rel_paths:
+            rel_dir, _, name = rel.rpartition("/")
+            listing = self._dirs.get(rel_dir)
+            if listing is None or not name.endswith(self.suffix):
+                continue
+            touched.add(rel_dir)
+            try:
+                st = os.stat(os.path.join(self.root, rel))
+                is_file = stat.S_ISREG(st.st_mode)
+            except OSError:
+                is_file = False
+            if not is_file:
+                if listing["files"].pop(name, None) is not None:
+                    self._dirty = True
+                result[rel] = None
+                continue
+            current = [st.st_mtime_ns, st.st_size, st.st_ino]
+            if listing["files"].get(name) != current:
+                listing["files"][name] = current
+                self._dirty = True
+            result[rel] = FileEntry(rel, *current)
+        # Every change in these directories was just applied
+        for rel_dir in touched:
+            self._touch_dir(rel_dir)
+        if save:
+            self.save()
+        return result
+
+    def rescan(self, rel_dir: str, save: bool = True) -> Dict[str, Optional[FileEntry]]:
+        """Re-walk one directory subtree after it was created, moved or deleted.
+
+        Returns the files that appeared ({path: FileEntry}) or vanished
+        ({path: None}) under it.
+        """
+        rel_dir = rel_dir.strip("/")
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        before = {
+            f"{d}/{name}" if d else name: meta
+            for d, listing in self._dirs.items()
+            if d == rel_dir or d.startswith(prefix)
+            for name, meta in listing["files"].items()
+        }
+        if rel_dir:
+            parent, _, name = rel_dir.rpartition("/")
+            listing = self._dirs.get(parent)
+            if listing is None or self._skip_dir(name):
+                return {}  # Outside the walked tree
+            subdirs = set(listing["subdirs"]) - {name}
+            if os.path.isdir(os.path.join(self.root, rel_dir)):
+                subdirs.add(name)
+            if sorted(subdirs) != listing["subdirs"]:
+                listing["subdirs"] = sorted(subdirs)
+                self._dirty = True
+            self._touch_dir(parent)
+        # A vanished directory's listings are dropped by the walk itself
+        after = self._walk(rel_dir, fresh=True)
+        if save:
+            self.save()
+        changes: Dict[str, Optional[FileEntry]] = {rel: None for rel in before if rel not in after}
+        changes.update(
+            (rel, entry) for rel, entry in after.items()
+            if before.get(rel) != [entry.mtime_ns, entry.size, entry.inode]
+        )
+        return changes
+
+    def _touch_dir(self, rel_dir: str):
+        """Mark a cached listing current with its directory's mtime."""
+        listing = self._dirs.get(rel_dir)
+        try:
+            mtime_ns = os.stat(os.path.join(self.root, rel_dir) if rel_dir else str(self.root)).st_mtime_ns
+        except OSError:
+            return
+        if listing is not None and listing["mtime_ns"] != mtime_ns:
+            listing["mtime_ns"] = mtime_ns
+            self._dirty = True
+
+    def files(self, under: Optional[str] = None, fresh: bool = False) -> List[Path]:
+        """Absolute paths of matching files, sorted."""
+        return [self.root / rel for rel in sorted(self.scan(under=under, fresh=fresh))]
+
+
+_WALKERS: Dict[tuple, VaultWalker] = {}
+
+
+def get_walker(exclude_dirs: Optional[Iterable[str]] = None, skip_hidden: bool = True) -> VaultWalker:
+    """Get a shared walker for the given exclusion settings."""
+    excludes = frozenset(EXCLUDE_DIRS if exclude_dirs is None else exclude_dirs)
+    key = (excludes, skip_hidden)
+    if key not in _WALKERS:
+        _WALKERS[key] = VaultWalker(exclude_dirs=excludes, skip_hidden=skip_hidden)
+    return _WALKERS[key]
+
+
+def find_markdown_files(
+    under: Optional[str] = None,
+    exclude_dirs: Optional[Iterable[str]] = None,
+    skip_hidden: bool = True,
+) -> List[Path]:
+    """Find all markdown notes in the vault (or one folder of it)."""
+    return get_walker(exclude_dirs, skip_hidden).files(under=under)
+
+
+if __name__ == "__main__":
+    import time
+
+    t0 = time.perf_counter()
+    entries = get_walker().scan()
+    print(f"{len(entries)} notes in {(time.perf_counter() - t0) * 1000:.1f} ms")
@@ -0,0 +1,354 @@
+"""Vault Watcher - Optional daemon that keeps vault caches hot.
+
+Listens for create, modify, move and delete events under the vault (inotify
+via ctypes on Linux, polling elsewhere) and, a moment after each burst of
+edits, applies just the changed notes to every shared cache:
+- the walker manifest (vault_walker)
+- the parsed-note cache (note_store)
+- the link graph (link_graph; only links that could resolve differently)
+- the search index (vault_index)
+- the Sources/ note manifest (note_manifest)
+
+A full resync runs only at startup and when the inotify queue overflows.
+
+While it runs it keeps a heartbeat in _logs/cache/watcher.json. Other scripts
+see the live daemon (vault_walker.watcher_active) and read the cached state
+instead of rescanning the vault on startup.
+
+Usage:
+  python3 _scripts/vault_watcher.py run            # Foreground (inotify if available)
+  python3 _scripts/vault_watcher.py run --poll     # Force polling
+  python3 _scripts/vault_watcher.py status
+  python3 _scripts/vault_watcher.py stop
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import signal
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+# Add parent for config
+sys.path.insert(0, str(Path(__file__).parent))
+from config import VAULT_PATH
+from vault_walker import WATCHER_HEARTBEAT, WATCHER_STATE_PATH, get_walker, watcher_state
+from note_store import get_store
+from link_graph import get_link_graph, refresh_link_graph, save_link_graph, update_link_graph
+from vault_index import get_index
+from note_manifest import get_note_manifest
+
+# Wait this long after the last event before syncing (editors write in bursts)
+DEBOUNCE_SECONDS = 0.05
+POLL_INTERVAL = 2.0
+# Caches other processes load as whole JSON files (walker manifest, link
+# graph, note manifest) are rewritten once edits pause this long, not per edit
+PERSIST_DELAY = 1.0
+
+# inotify constants (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+WATCH_MASK = (
+    IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+)
+_EVENT = struct.Struct("iIII")
+
+
+class Inotify:
+    """Minimal inotify binding (one watch per directory)."""
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add = libc.inotify_add_watch
+        self._add.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(os.O_CLOEXEC | os.O_NONBLOCK)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watches: Dict[int, str] = {}
+
+    def add(self, rel_dir: str):
+        full = os.path.join(VAULT_PATH, rel_dir) if rel_dir else str(VAULT_PATH)
+        wd = self._add(self.fd, os.fsencode(full), WATCH_MASK)
+        if wd >= 0:
+            self.watches[wd] = rel_dir
+
+    def read(self, timeout: float):
+        """Yield (rel_dir, name, mask) for pending events, waiting up to `timeout`."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return
+        try:
+            buf = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset < len(buf):
+            wd, mask, _, length = _EVENT.unpack_from(buf, offset)
+            offset += _EVENT.size
+            name = buf[offset:offset + length].rstrip(b"\0").decode("utf-8", errors="replace")
+            offset += length
+            if mask & IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+            yield self.watches.get(wd), name, mask
+
+    def close(self):
+        os.close(self.fd)
+
+
+class VaultWatcher:
+    """Keeps the shared caches in step with the vault."""
+
+    def __init__(self, poll: bool = False):
+        self.walker = get_walker()
+        self.inotify: Optional[Inotify] = None
+        if not poll and sys.platform.startswith("linux"):
+            try:
+                self.inotify = Inotify()
+            except (OSError, AttributeError) as e:
+                print(f"inotify unavailable ({e}); polling every {POLL_INTERVAL:.0f}s")
+        self._stamp: Dict[str, Tuple[int, int]] = {}
+        self._unsaved = False
+        self._persisted = time.time()
+        self.syncs = 0
+
+    # State file
+    def write_state(self, last_sync: Optional[float] = None):
+        state = watcher_state_raw() or {}
+        state.update({
+            "pid": os.getpid(),
+            "mode": "inotify" if self.inotify else "poll",
+            "heartbeat": time.time(),
+            "manifests": [str(self.walker.manifest_path)],
+            "syncs": self.syncs,
+        })
+        if last_sync is not None:
+            state["last_sync"] = last_sync
+        WATCHER_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = WATCHER_STATE_PATH.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(tmp, WATCHER_STATE_PATH)
+
+    def clear_state(self):
+        state = watcher_state_raw()
+        if state and state.get("pid") == os.getpid():
+            WATCHER_STATE_PATH.unlink(missing_ok=True)
+
+    # Sync
+    def sync(self) -> Dict[str, int]:
+        """Full resync of every cache (startup, queue overflow); returns index change counts and timing."""
+        t0 = time.perf_counter()
+        entries = self.walker.scan(fresh=True)
+        self._stamp = {rel: (e.mtime_ns, e.size) for rel, e in entries.items()}
+        stats = get_index(refresh=False).refresh()
+        refresh_link_graph()
+        get_note_manifest().refresh()
+        get_store().prune(list(entries))
+        self._unsaved = False  # The full refreshes above wrote their caches
+        self.syncs += 1
+        stats["ms"] = round((time.perf_counter() - t0) * 1000, 1)
+        self.write_state(last_sync=time.time())
+        return stats
+
+    def apply(self, paths: Set[str], dirs: Set[str] = frozenset()) -> Optional[Dict[str, int]]:
+        """Apply changes to the given notes and directory subtrees only.
+
+        Returns index change counts and timing, or None if no note changed.
+        """
+        t0 = time.perf_counter()
+        entries = self.walker.update(paths, save=False)
+        for rel_dir in sorted(dirs):
+            entries.update(self.walker.rescan(rel_dir, save=False))
+        changes = {
+            rel: None if entry is None else (entry.mtime_ns, entry.size)
+            for rel, entry in entries.items()
+        }
+        changes = {rel: stamp for rel, stamp in changes.items() if stamp != self._stamp.get(rel)}
+        if not changes:
+            return None
+
+        stats = get_index(refresh=False).update_paths(changes)
+        get_store().forget([VAULT_PATH / rel for rel, stamp in changes.items() if stamp is None])
+        update_link_graph(changes, self._stamp, save=False)  # Re-parses the changed notes into the store
+        get_note_manifest().update({rel: entries[rel] for rel in changes}, save=False)
+        for rel, stamp in changes.items():
+            if stamp is None:
+                self._stamp.pop(rel, None)
+            else:
+                self._stamp[rel] = stamp
+        self._unsaved = True
+        self.syncs += 1
+        stats["ms"] = round((time.perf_counter() - t0) * 1000, 1)
+        self.write_state(last_sync=time.time())
+        return stats
+
+    def persist(self):
+        """Write the caches apply() left in memory (see PERSIST_DELAY)."""
+        self.walker.save()  # No-op when unchanged
+        if self._unsaved:
+            save_link_graph(get_link_graph())
+            get_note_manifest().save()
+            self._unsaved = False
+        self._persisted = time.time()
+
+    def _watch_tree(self):
+        known = set(self.inotify.watches.values())
+        for rel_dir in self.walker.directories():
+            if rel_dir not in known:
+                self.inotify.add(rel_dir)
+
+    def _changed_on_poll(self) -> Set[str]:
+        """Paths added, edited or deleted since the last sync (full rescan)."""
+        entries = self.walker.scan(fresh=True)
+        current = {rel: (e.mtime_ns, e.size) for rel, e in entries.items()}
+        changed = {rel for rel, stamp in current.items() if self._stamp.get(rel) != stamp}
+        changed.update(rel for rel in self._stamp if rel not in current)
+        return changed
+
+    # Main loop
+    def run(self):
+        signal.signal(signal.SIGTERM, self._on_term)
+        try:
+            print(self._report(self.sync()))
+            if self.inotify:
+                self._watch_tree()
+            print(f"Watching {VAULT_PATH} ({'inotify' if self.inotify else 'polling'}); Ctrl+C to stop")
+
+            last_beat = time.time()
+            while True:
+                overflow, dirs = False, set()
+                if self.inotify:
+                    paths, dirs, overflow = self._wait_inotify(PERSIST_DELAY if self._unsaved else WATCHER_HEARTBEAT)
+                else:
+                    time.sleep(POLL_INTERVAL)
+                    paths = self._changed_on_poll()
+                # Once edits pause, or at least every heartbeat while they don't
+                if not (paths or dirs or overflow) or time.time() - self._persisted >= WATCHER_HEARTBEAT:
+                    self.persist()
+                stats = None
+                if overflow:
+                    # Events were dropped: only a full resync is safe
+                    stats = self.sync()
+                elif paths or dirs:
+                    stats = self.apply(paths, dirs)
+                if overflow or dirs:
+                    self._watch_tree()
+                if stats:
+                    print(self._report(stats))
+                    last_beat = time.time()
+                elif time.time() - last_beat >= WATCHER_HEARTBEAT:
+                    self.write_state()
+                    last_beat = time.time()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.persist()
+            self.clear_state()
+            if self.inotify:
+                self.inotify.close()
+        print("Watcher stopped.")
+
+    def _wait_inotify(self, timeout: float) -> Tuple[Set[str], Set[str], bool]:
+        """Block for events; once one arrives, drain the burst.
+
+        Returns (changed note paths, changed directories, queue overflowed).
+        """
+        paths: Set[str] = set()
+        dirs: Set[str] = set()
+        overflow = False
+        wait = timeout
+        while True:
+            got = False
+            for rel_dir, name, mask in self.inotify.read(wait):
+                got = True
+                if mask & IN_Q_OVERFLOW:
+                    overflow = True
+                elif rel_dir is None:
+                    continue
+                elif mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                    dirs.add(rel_dir)
+                elif mask & IN_ISDIR:
+                    dirs.add(f"{rel_dir}/{name}" if rel_dir else name)
+                elif name.endswith(self.walker.suffix):
+                    paths.add(f"{rel_dir}/{name}" if rel_dir else name)
+            if not got:
+                return paths, dirs, overflow
+            wait = DEBOUNCE_SECONDS
+
+    def _on_term(self, signum, frame):
+        raise KeyboardInterrupt
+
+    @staticmethod
+    def _report(stats: Dict[str, int]) -> str:
+        return (
+            f"[{time.strftime('%H:%M:%S')}] synced {stats['total']} notes "
+            f"(+{stats['added']} ~{stats['updated']} -{stats['removed']}) in {stats['ms']} ms"
+        )
+
+
+def watcher_state_raw() -> Optional[Dict]:
+    """Contents of the state file, live or not."""
+    try:
+        return json.loads(WATCHER_STATE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Vault Watcher - keep vault caches hot while you edit",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python3 _scripts/vault_watcher.py run          # Start in the foreground
+  python3 _scripts/vault_watcher.py run --poll   # Polling instead of inotify
+  python3 _scripts/vault_watcher.py status       # Is a watcher running?
+  python3 _scripts/vault_watcher.py stop         # Stop the running watcher
+""",
+    )
+    parser.add_argument("command", choices=["run", "status", "stop"])
+    parser.add_argument("--poll", action="store_true", help="Use polling even where inotify is available")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        if watcher_state():
+            print("A watcher is already running.")
+            sys.exit(1)
+        VaultWatcher(poll=args.poll).run()
+        return
+
+    state = watcher_state()
+    if args.command == "status":
+        if not state:
+            print("No watcher running.")
+            return
+        last = state.get("last_sync")
+        age = f"{time.time() - last:.0f}s ago" if last else "never"
+        print(f"Watcher running (pid {state['pid']}, {state['mode']}); {state.get('syncs', 0)} syncs, last {age}")
+        return
+
+    if not state:
+        print("No watcher running.")
+        return
+    os.kill(state["pid"], signal.SIGTERM)
+    print(f"Sent stop to watcher (pid {state['pid']}).")
+
+
+if __name__ == "__main__":
+    main()
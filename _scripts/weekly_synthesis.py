@@ -5,11 +5,15 @@ to find themes, connections, and insights across all sources.
 """
 
 import argparse
-import re
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from config import summarize, save_note, VAULT_PATH, TRACKER
+from config import summarize, summarize_long, save_note, TRACKER
+from note_manifest import notes_between, read_body
+from context_packer import pack
+
+# Prompt budget for the collected notes, in estimated tokens
+CONTEXT_TOKENS = 24000
 
 SYNTHESIS_PROMPT = """You are an intellectual synthesizer. Given notes from multiple sources
 (Twitter, YouTube, Hacker News, ArXiv, Reddit, books, PDFs) collected over the past week,
@@ -40,38 +44,18 @@ Do NOT include any YAML frontmatter or title heading - start directly with Top T
 
 def collect_recent_notes(days: int = 7) -> list:
     """Find all Source notes from the past N days."""
-    sources_dir = VAULT_PATH / "Sources"
-    if not sources_dir.exists():
-        return []
-
     cutoff = datetime.now() - timedelta(days=days)
     notes = []
 
-    for md_file in sources_dir.glob("*.md"):
-        # Check file modification time
-        mtime = datetime.fromtimestamp(md_file.stat().st_mtime)
-        if mtime < cutoff:
+    for rec in notes_between(cutoff, datetime.now(), by="mtime"):
+        # Day buckets are inclusive; keep the exact cutoff
+        if rec["mtime"] < cutoff.timestamp():
             continue
-
-        content = md_file.read_text(encoding="utf-8")
-
-        # Extract type from frontmatter
-        note_type = "unknown"
-        type_match = re.search(r"^type:\s*(.+)$", content, re.MULTILINE)
-        if type_match:
-            note_type = type_match.group(1).strip()
-
-        # Extract the body (skip frontmatter)
-        body = content
-        fm_match = re.match(r"^---\s*\n.*?\n---\s*\n", content, re.DOTALL)
-        if fm_match:
-            body = content[fm_match.end():]
-
         notes.append({
-            "filename": md_file.stem,
-            "type": note_type,
-            "date": mtime.strftime("%Y-%m-%d"),
-            "content": body[:3000],  # Cap per note to manage token usage
+            "filename": rec["filename"],
+            "type": rec["type"],
+            "date": datetime.fromtimestamp(rec["mtime"]).strftime("%Y-%m-%d"),
+            "content": read_body(rec),
         })
 
     # Sort by date
@@ -82,6 +66,8 @@ def collect_recent_notes(days: int = 7) -> list:
 def main():
     parser = argparse.ArgumentParser(description="Generate weekly synthesis from all source notes")
     parser.add_argument("--days", type=int, default=7, help="Look back N days (default: 7)")
+    parser.add_argument("--full", action="store_true",
+                        help="Read every note in full (map-reduce over long weeks) instead of packing excerpts")
     args = parser.parse_args()
 
     # Track operation start
@@ -112,18 +98,20 @@ def main():
     for note_type, type_notes in by_type.items():
         print("  {}: {}".format(note_type, len(type_notes)))
 
-    # Format all notes for AI
-    notes_text = "\n\n---\n\n".join(
-        "SOURCE: [[{filename}]] (type: {type}, date: {date})\n\n{content}".format(**n)
+    sources = [
+        {"header": "SOURCE: [[{filename}]] (type: {type}, date: {date})".format(**n), "text": n["content"]}
         for n in notes
-    )
-
-    # Truncate if too long
-    if len(notes_text) > 80000:
-        notes_text = notes_text[:80000] + "\n\n[Additional notes truncated...]"
+    ]
 
     print("Generating weekly synthesis with AI...")
-    synthesis_body = summarize(notes_text, SYNTHESIS_PROMPT)
+    if args.full:
+        # Every note in full; condensed section by section if over budget
+        notes_text = "\n\n---\n\n".join("{header}\n\n{text}".format(**src) for src in sources)
+        synthesis_body = summarize_long(notes_text, SYNTHESIS_PROMPT, target_tokens=CONTEXT_TOKENS)
+    else:
+        # Pack the lead passages of every note into the token budget rather
+        # than cutting the tail notes off
+        synthesis_body = summarize(pack(sources, CONTEXT_TOKENS), SYNTHESIS_PROMPT)
 
     today = datetime.now().strftime("%Y-%m-%d")
     week_start = (datetime.now() - timedelta(days=args.days)).strftime("%Y-%m-%d")